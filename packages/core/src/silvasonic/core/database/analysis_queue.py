@@ -0,0 +1,272 @@
+"""Work queue and lease-based claiming for analysis workers (Worker Pull, ADR-0018).
+
+Every recording gets one ``recording_analysis`` row per analysis worker when
+the Indexer registers it (state ``pending``).  Workers claim a *batch* of
+pending rows in one short transaction and hold a time-limited lease
+(``claimed``) instead of keeping a ``FOR UPDATE`` row lock open while they
+decode and infer.  Results are persisted in bulk with
+:func:`complete_recordings`, which moves the rows to their final state;
+leases that run out (crashed or stalled worker) are reclaimed automatically
+by the next claim.
+
+The claim's ``claimed_at`` timestamp is its lease token: completion and
+release only touch rows still claimed with that token, so a stalled worker
+whose lease was reclaimed by another one cannot overwrite the newer result.
+A recording whose lease ran out ``max_attempts`` times (e.g. one that keeps
+crashing the worker) is not requeued again but marked
+``failed_max_attempts``.
+
+Claims only touch the partial ``pending`` index, so their cost is
+``O(log n)`` in the number of recordings no matter how much history has
+already been analyzed.
+
+Typical cycle::
+
+    async with get_session() as session:
+        claim = await claim_recordings(session, "birdnet", limit=8, lease_s=300)
+        await session.commit()  # release locks immediately
+
+    ...  # analyze without holding a connection
+
+    async with get_session() as session:
+        states = {rec.id: "done" for rec in claim.recordings}
+        kept = await complete_recordings(session, "birdnet", states, claim.claimed_at)
+        await insert_detections(session, [d for d in detections if d.recording_id in kept])
+        await session.commit()
+"""
+
+from collections.abc import Iterable, Mapping
+from datetime import datetime
+from typing import NamedTuple
+
+import structlog
+from silvasonic.core.database.models.recordings import Recording
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+log = structlog.get_logger()
+
+# Analysis workers that get a work item for every new recording
+ANALYSIS_WORKERS: tuple[str, ...] = ("birdnet",)
+
+# Expired leases after which a recording is given up instead of requeued
+DEFAULT_MAX_ATTEMPTS = 3
+
+_RECOVER_SQL = text("""
+    WITH expired AS (
+        UPDATE recording_analysis
+        SET state = CASE WHEN attempts >= :max_attempts
+                         THEN 'failed_max_attempts' ELSE 'pending' END,
+            lease_expires_at = NULL
+        WHERE worker = :worker
+          AND state = 'claimed'
+          AND lease_expires_at < NOW()
+        RETURNING recording_id, state
+    )
+    UPDATE recordings r
+    SET analysis_state = r.analysis_state || jsonb_build_object(CAST(:worker AS TEXT),
+                                                                expired.state)
+    FROM expired
+    WHERE r.id = expired.recording_id AND expired.state <> 'pending'
+    RETURNING r.id
+""")
+
+_CLAIM_SQL = """
+    WITH candidates AS (
+        SELECT recording_id
+        FROM recording_analysis
+        WHERE worker = :worker AND state = 'pending'
+        ORDER BY recording_time {order}
+        LIMIT :limit
+        FOR UPDATE SKIP LOCKED
+    )
+    UPDATE recording_analysis ra
+    SET state = 'claimed',
+        claimed_at = NOW(),
+        lease_expires_at = NOW() + make_interval(secs => :lease_s),
+        attempts = ra.attempts + 1
+    FROM candidates c
+    WHERE ra.worker = :worker AND ra.recording_id = c.recording_id
+    RETURNING ra.recording_id, ra.claimed_at
+"""
+
+_COMPLETE_SQL = text("""
+    WITH results AS (
+        SELECT * FROM unnest(CAST(:ids AS BIGINT[]), CAST(:states AS TEXT[])) AS t(id, state)
+    ), queue AS (
+        UPDATE recording_analysis ra
+        SET state = results.state, lease_expires_at = NULL
+        FROM results
+        WHERE ra.worker = :worker AND ra.recording_id = results.id
+          AND ra.state = 'claimed' AND ra.claimed_at = CAST(:claimed_at AS TIMESTAMPTZ)
+        RETURNING ra.recording_id, ra.state
+    ), summary AS (
+        UPDATE recordings r
+        SET analysis_state = r.analysis_state || jsonb_build_object(CAST(:worker AS TEXT),
+                                                                    queue.state)
+        FROM queue
+        WHERE r.id = queue.recording_id
+    )
+    SELECT recording_id FROM queue
+""")
+
+_RELEASE_SQL = text("""
+    WITH released AS (
+        UPDATE recording_analysis
+        SET state = CASE WHEN CAST(:attempted AS BOOLEAN) AND attempts >= :max_attempts
+                         THEN 'failed_max_attempts' ELSE 'pending' END,
+            lease_expires_at = NULL,
+            attempts = CASE WHEN CAST(:attempted AS BOOLEAN)
+                            THEN attempts ELSE GREATEST(attempts - 1, 0) END
+        WHERE worker = :worker AND recording_id = ANY(:ids)
+          AND state = 'claimed' AND claimed_at = CAST(:claimed_at AS TIMESTAMPTZ)
+        RETURNING recording_id, state
+    )
+    UPDATE recordings r
+    SET analysis_state = r.analysis_state || jsonb_build_object(CAST(:worker AS TEXT),
+                                                                released.state)
+    FROM released
+    WHERE r.id = released.recording_id AND released.state <> 'pending'
+""")
+
+
+class Claim(NamedTuple):
+    """Recordings leased by one claim and its lease token."""
+
+    recordings: list[Recording]
+    claimed_at: datetime | None = None
+
+
+async def claim_recordings(
+    session: AsyncSession,
+    worker: str,
+    *,
+    limit: int,
+    lease_s: float,
+    newest_first: bool = False,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+) -> Claim:
+    """Lease up to ``limit`` pending recordings for ``worker``.
+
+    Expired leases are first returned to ``pending`` (or, after
+    ``max_attempts`` claims, marked ``failed_max_attempts``), then the
+    oldest (or newest) pending rows are switched to ``claimed``.  ``SKIP LOCKED`` lets
+    concurrent claims pass each other, and a row that another claim already
+    took no longer matches ``state = 'pending'`` when it is re-checked, so
+    a live lease is never stolen.
+
+    The caller must commit right after claiming so the row locks are
+    released and the lease becomes visible to other workers.
+
+    Args:
+        session: Active async DB session.
+        worker: Analysis worker name (the ``recording_analysis.worker`` key).
+        limit: Maximum number of recordings to claim.
+        lease_s: Lease duration in seconds.
+        newest_first: Claim the newest recordings first instead of the oldest.
+        max_attempts: Claims after which an expired lease gives the recording up.
+
+    Returns:
+        The claimed recordings in processing order (may be empty) and the
+        lease token to pass to :func:`complete_recordings`.
+    """
+    given_up = await session.execute(_RECOVER_SQL, {"worker": worker, "max_attempts": max_attempts})
+    failed = [row[0] for row in given_up.fetchall()]
+    if failed:
+        log.warning("analysis_queue.max_attempts", worker=worker, recording_ids=failed)
+
+    order = "DESC" if newest_first else "ASC"
+    result = await session.execute(
+        text(_CLAIM_SQL.format(order=order)),
+        {"worker": worker, "limit": limit, "lease_s": lease_s},
+    )
+    claimed = result.fetchall()
+    if not claimed:
+        return Claim([])
+
+    ids = [row[0] for row in claimed]
+    sort_col = Recording.time.desc() if newest_first else Recording.time.asc()
+    rows = await session.execute(select(Recording).where(Recording.id.in_(ids)).order_by(sort_col))
+    # All rows of one claim share its transaction timestamp
+    return Claim(list(rows.scalars().all()), claimed[0][1])
+
+
+async def complete_recordings(
+    session: AsyncSession,
+    worker: str,
+    states: Mapping[int, str],
+    claimed_at: datetime | None,
+) -> set[int]:
+    """Record final states and drop the leases in one statement.
+
+    The queue rows move to their final state, and ``recordings.analysis_state``
+    keeps a per-recording summary for readers such as the Web-Interface.
+    Only rows still held under the lease token ``claimed_at`` change; rows
+    whose lease expired and was claimed again by another worker are left to
+    it.  Runs in the caller's transaction: insert detections into the same
+    session, for the returned recordings only, to commit them atomically
+    with the state change.
+
+    Args:
+        session: Active async DB session.
+        worker: Analysis worker name (the ``recording_analysis.worker`` key).
+        states: Mapping of recording ID to final state (e.g. ``"done"``).
+        claimed_at: Lease token of the claim (:attr:`Claim.claimed_at`).
+
+    Returns:
+        IDs of the recordings whose state was recorded.
+    """
+    if not states:
+        return set()
+    result = await session.execute(
+        _COMPLETE_SQL,
+        {
+            "worker": worker,
+            "ids": list(states),
+            "states": list(states.values()),
+            "claimed_at": claimed_at,
+        },
+    )
+    return {row[0] for row in result.fetchall()}
+
+
+async def release_recordings(
+    session: AsyncSession,
+    worker: str,
+    ids: Iterable[int],
+    claimed_at: datetime | None,
+    *,
+    attempted: bool = False,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+) -> None:
+    """Return claimed rows to ``pending`` without recording a result.
+
+    Used on shutdown for claimed-but-unprocessed recordings; otherwise they
+    would only be picked up again once their lease expires.  Rows no longer
+    held under the lease token ``claimed_at`` are left alone.
+
+    Args:
+        session: Active async DB session.
+        worker: Analysis worker name (the ``recording_analysis.worker`` key).
+        ids: Recording IDs to release.
+        claimed_at: Lease token of the claim (:attr:`Claim.claimed_at`).
+        attempted: The analysis was attempted and failed for a reason outside
+            the recording (e.g. a dead inference process).  The claim then
+            counts as an attempt, and a recording that used up
+            ``max_attempts`` is marked ``failed_max_attempts``; otherwise the
+            attempt is given back.
+        max_attempts: Attempts after which an ``attempted`` release gives up.
+    """
+    id_list = list(ids)
+    if not id_list:
+        return
+    await session.execute(
+        _RELEASE_SQL,
+        {
+            "worker": worker,
+            "ids": id_list,
+            "claimed_at": claimed_at,
+            "attempted": attempted,
+            "max_attempts": max_attempts,
+        },
+    )
@@ -0,0 +1,124 @@
+"""Cheap analysis backlog gauges for heartbeats (Worker Pull, ADR-0018).
+
+Triggers on ``recording_analysis`` append the change of each worker's queue
+size to ``analysis_backlog`` as delta rows, so reading the backlog sums a
+few rows rather than running a ``count(*)`` over the queue.  The deltas are
+append-only because a single counter row per worker would be locked by
+every queue write until its transaction commits: one long indexer scan
+would stall every claim.  :func:`compact_backlog` folds the deltas back into
+one row per worker; :class:`BacklogGauge` does that on each refresh and
+throttles refreshes to one per ``interval_s`` so that hot loops can call
+:meth:`BacklogGauge.maybe_refresh` on every iteration::
+
+    gauge = BacklogGauge(interval_s=10.0)
+
+    while running:
+        await gauge.maybe_refresh()
+        ...
+
+    def get_extra_meta(self) -> dict[str, Any]:
+        return {"analysis": {"backlog_pending": gauge.get("birdnet").pending}}
+"""
+
+import time
+from collections.abc import Callable
+from typing import NamedTuple
+
+import structlog
+from silvasonic.core.database.session import get_session
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+log = structlog.get_logger()
+
+
+class BacklogCounts(NamedTuple):
+    """Queue gauges of one analysis worker."""
+
+    pending: int = 0
+    claimed: int = 0
+
+
+async def read_backlog(session: AsyncSession) -> dict[str, BacklogCounts]:
+    """Return the current queue gauges of every analysis worker."""
+    result = await session.execute(
+        text("""
+            SELECT worker, sum(pending), sum(claimed)
+            FROM analysis_backlog
+            GROUP BY worker
+        """)
+    )
+    return {row[0]: BacklogCounts(int(row[1]), int(row[2])) for row in result.fetchall()}
+
+
+async def compact_backlog(session: AsyncSession) -> None:
+    """Fold the committed delta rows into one row per worker.
+
+    Only rows visible to the statement are deleted and re-summed; deltas of
+    transactions still in flight are left alone, and a concurrent compaction
+    skips the rows this one removed, so no change is counted twice.  The
+    caller commits.
+    """
+    await session.execute(
+        text("""
+            WITH folded AS (
+                DELETE FROM analysis_backlog
+                RETURNING worker, pending, claimed
+            )
+            INSERT INTO analysis_backlog (worker, pending, claimed)
+            SELECT worker, sum(pending), sum(claimed)
+            FROM folded
+            GROUP BY worker
+        """)
+    )
+
+
+class BacklogGauge:
+    """Time-throttled snapshot of ``analysis_backlog`` for heartbeat metadata.
+
+    Args:
+        interval_s: Minimum seconds between two database reads.
+        time_func: Dependency-injected clock function (defaults to monotonic).
+    """
+
+    def __init__(
+        self,
+        interval_s: float,
+        time_func: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Start with empty counts; the first refresh always reads."""
+        self.interval_s = interval_s
+        self.counts: dict[str, BacklogCounts] = {}
+        self._time = time_func
+        self._refreshed_at: float | None = None
+
+    def get(self, worker: str) -> BacklogCounts:
+        """Return the last known gauges of ``worker`` (zeros if never seen)."""
+        return self.counts.get(worker, BacklogCounts())
+
+    def as_meta(self) -> dict[str, dict[str, int]]:
+        """Return all gauges as a heartbeat-friendly mapping."""
+        return {worker: c._asdict() for worker, c in sorted(self.counts.items())}
+
+    async def maybe_refresh(self) -> bool:
+        """Compact and re-read the gauges if the last read is older than ``interval_s``.
+
+        Best-effort: on database errors the last known values are kept and
+        the next call retries.
+
+        Returns:
+            ``True`` if the gauges were re-read.
+        """
+        now = self._time()
+        if self._refreshed_at is not None and now - self._refreshed_at < self.interval_s:
+            return False
+        self._refreshed_at = now
+        try:
+            async with get_session() as session:
+                await compact_backlog(session)
+                await session.commit()
+                self.counts = await read_backlog(session)
+        except Exception as exc:
+            log.debug("backlog.refresh_failed", error=str(exc))
+            return False
+        return True
@@ -0,0 +1,139 @@
+"""Bulk persistence of analysis detections.
+
+Analysis workers produce detections on their hot path.  Building an ORM
+``Detection`` per hit and letting the unit of work flush them row by row
+costs an object graph per detection and one INSERT round trip each.
+Instead, workers collect plain :class:`DetectionRow` tuples and hand them to
+:func:`insert_detections`, which streams them into the ``detections``
+hypertable with a single ``COPY`` (asyncpg ``copy_records_to_table``), or one
+``executemany`` INSERT on other drivers.
+
+The ``details`` payload is identical for every hit of an analysis run, so it
+is serialized once with :func:`encode_details` and the same string is shared
+by all rows.  It is stored once in ``analysis_runs``; detections only carry
+the run's ID (resolved by :func:`resolve_run_id` at insert time, one query
+per distinct payload).  Completion is fenced by the claim's lease, so only
+the recordings :func:`complete_recordings` still accepts get their rows::
+
+    details = encode_details(BirdnetDetectionDetails(...).model_dump())
+    rows = [
+        DetectionRow(
+            t, t + window, rec.id, "birdnet", conf, label, name, clip, False, None, details
+        )
+    ]
+
+    async with get_session() as session:
+        kept = await complete_recordings(session, "birdnet", states, claim.claimed_at)
+        await insert_detections(session, [r for r in rows if r.recording_id in kept])
+        await session.commit()
+"""
+
+import json
+from collections.abc import Mapping, Sequence
+from datetime import datetime
+from typing import Any, NamedTuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+DETECTION_COLUMNS = (
+    "time",
+    "end_time",
+    "recording_id",
+    "worker",
+    "confidence",
+    "label",
+    "common_name",
+    "clip_path",
+    "pinned",
+    "event",
+    "run_id",
+)
+
+_INSERT_SQL = text(
+    f"INSERT INTO detections ({', '.join(DETECTION_COLUMNS)}) VALUES "
+    "(:time, :end_time, :recording_id, :worker, :confidence, :label, "
+    ":common_name, :clip_path, :pinned, CAST(:event AS JSONB), :run_id)"
+)
+
+_RUN_SQL = text("""
+    WITH created AS (
+        INSERT INTO analysis_runs (worker, details)
+        VALUES (:worker, CAST(:details AS JSONB))
+        ON CONFLICT (worker, details) DO NOTHING
+        RETURNING id
+    )
+    SELECT id FROM created
+    UNION ALL
+    SELECT id FROM analysis_runs
+    WHERE worker = :worker AND details = CAST(:details AS JSONB)
+    LIMIT 1
+""")
+
+
+class DetectionRow(NamedTuple):
+    """One detection, in ``detections`` column order.
+
+    ``details`` is the JSON text from :func:`encode_details`; it is stored as
+    the row's analysis run, not on the row itself.  ``event`` is the JSON text
+    of a ``DetectionEvent`` for merged detections, else ``None``.  ``pinned``
+    clips outlive their source recording.
+    """
+
+    time: datetime
+    end_time: datetime
+    recording_id: int
+    worker: str
+    confidence: float
+    label: str
+    common_name: str | None
+    clip_path: str | None
+    pinned: bool
+    event: str | None
+    details: str
+
+
+def encode_details(details: Mapping[str, Any]) -> str:
+    """Serialize a run's shared ``details`` payload once for all of its rows."""
+    return json.dumps(details, separators=(",", ":"))
+
+
+async def resolve_run_id(session: AsyncSession, worker: str, details: str) -> int:
+    """Return the ``analysis_runs`` ID for a configuration, creating it if needed."""
+    params = {"worker": worker, "details": details}
+    run_id = (await session.execute(_RUN_SQL, params)).scalar()
+    if run_id is None:
+        # A concurrent transaction created the run after our snapshot was taken
+        run_id = (await session.execute(_RUN_SQL, params)).scalar_one()
+    return int(run_id)
+
+
+async def insert_detections(session: AsyncSession, rows: Sequence[DetectionRow]) -> int:
+    """Insert detection rows in bulk within the session's transaction.
+
+    The caller commits, so detections and the analysis state that records
+    them stay atomic.
+
+    Returns:
+        Number of rows written.
+    """
+    if not rows:
+        return 0
+
+    run_ids: dict[tuple[str, str], int] = {}
+    for row in rows:
+        key = (row.worker, row.details)
+        if key not in run_ids:
+            run_ids[key] = await resolve_run_id(session, *key)
+    records = [(*row[:-1], run_ids[row.worker, row.details]) for row in rows]
+
+    connection = await session.connection()
+    raw = await connection.get_raw_connection()
+    copy_records = getattr(raw.driver_connection, "copy_records_to_table", None)
+    if copy_records is not None:
+        await copy_records("detections", records=records, columns=DETECTION_COLUMNS)
+    else:
+        await session.execute(
+            _INSERT_SQL, [dict(zip(DETECTION_COLUMNS, r, strict=True)) for r in records]
+        )
+    return len(rows)
@@ -1,7 +1,12 @@
 from silvasonic.core.database.models.base import Base
-from silvasonic.core.database.models.detections import Detection
+from silvasonic.core.database.models.detections import AnalysisRun, Detection
 from silvasonic.core.database.models.profiles import MicrophoneProfile
-from silvasonic.core.database.models.recordings import Recording, Upload
+from silvasonic.core.database.models.recordings import (
+    AnalysisBacklog,
+    Recording,
+    RecordingAnalysis,
+    Upload,
+)
 from silvasonic.core.database.models.system import (
     Device,
     ManagedService,
@@ -12,12 +17,15 @@ from silvasonic.core.database.models.taxonomy import Taxonomy
 from silvasonic.core.database.models.weather import Weather
 
 __all__ = [
+    "AnalysisBacklog",
+    "AnalysisRun",
     "Base",
     "Detection",
     "Device",
     "ManagedService",
     "MicrophoneProfile",
     "Recording",
+    "RecordingAnalysis",
     "SystemConfig",
     "Taxonomy",
     "Upload",
@@ -1,11 +1,44 @@
-from datetime import datetime
+from datetime import UTC, datetime
 from typing import Any
 
 from silvasonic.core.database.models.base import Base
-from sqlalchemy import BigInteger, DateTime, Float, ForeignKey, Text
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    DateTime,
+    Float,
+    ForeignKey,
+    SmallInteger,
+    Text,
+    UniqueConstraint,
+    false,
+)
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
+# Failed clip cuts after which a pinned detection is given up (no longer
+# retried by the BirdNET pin sweep, no longer holding back the Janitor)
+MAX_PIN_CLIP_ATTEMPTS = 3
+
+
+class AnalysisRun(Base):
+    """One distinct analysis configuration snapshot of a worker.
+
+    Holds the run parameters (``details``, e.g. ``BirdnetDetectionDetails``)
+    that every detection of the run shares, so detections only store a
+    reference.
+    """
+
+    __tablename__ = "analysis_runs"
+    __table_args__ = (UniqueConstraint("worker", "details"),)
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    worker: Mapped[str] = mapped_column(Text, nullable=False)
+    details: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(UTC), nullable=False
+    )
+
 
 class Detection(Base):
     """Stores analysis results from various workers (BirdNET, BatDetect, etc.).
@@ -33,4 +66,17 @@ class Detection(Base):
     common_name: Mapped[str | None] = mapped_column(Text, nullable=True)
     clip_path: Mapped[str | None] = mapped_column(Text, nullable=True)
 
-    details: Mapped[dict[str, Any]] = mapped_column(JSONB, default=dict, nullable=False)
+    # Keep the clip after the source recording is deleted (user-starred or pinned)
+    pinned: Mapped[bool] = mapped_column(
+        Boolean, default=False, server_default=false(), nullable=False
+    )
+    # Failed attempts to cut the clip of a pinned detection
+    clip_attempts: Mapped[int] = mapped_column(
+        SmallInteger, default=0, server_default="0", nullable=False
+    )
+
+    # Window scores of a merged event (``DetectionEvent``); NULL for one window
+    event: Mapped[dict[str, Any] | None] = mapped_column(JSONB, nullable=True)
+
+    # Shared run parameters (model version, thresholds, location)
+    run_id: Mapped[int] = mapped_column(BigInteger, ForeignKey("analysis_runs.id"), nullable=False)
@@ -55,6 +55,53 @@ class Recording(Base):
     )
 
 
+class RecordingAnalysis(Base):
+    """Per-worker analysis work item for a recording — Worker Pull (ADR-0018).
+
+    The Indexer enqueues one ``pending`` row per analysis worker when it
+    registers a recording.  Workers claim rows with a time-limited lease
+    (``claimed``) and finish them with their result state; leases past
+    ``lease_expires_at`` are reclaimable by any worker, so a crashed worker
+    never strands its batch.  ``recording_time`` mirrors ``recordings.time``
+    so claims are served by the partial ``pending`` index alone.
+    """
+
+    __tablename__ = "recording_analysis"
+
+    recording_id: Mapped[int] = mapped_column(
+        BigInteger, ForeignKey("recordings.id"), primary_key=True
+    )
+    worker: Mapped[str] = mapped_column(Text, primary_key=True)
+
+    state: Mapped[str] = mapped_column(
+        Text, default="pending", server_default=text("'pending'"), nullable=False
+    )
+    recording_time: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    claimed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    lease_expires_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+
+class AnalysisBacklog(Base):
+    """Per-worker queue gauge deltas over ``recording_analysis`` (ADR-0018).
+
+    Appended by statement-level triggers on ``recording_analysis`` and
+    folded into one row per worker by readers, so backlog metrics sum a
+    handful of rows instead of a ``count(*)`` over the queue.  Append-only
+    deltas keep queue writers from serializing on a shared counter row.
+    """
+
+    __tablename__ = "analysis_backlog"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    worker: Mapped[str] = mapped_column(Text, nullable=False)
+    pending: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+    claimed: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+
+
 class Upload(Base):
     """Immutable audit log of all upload attempts."""
 
@@ -1,10 +1,10 @@
-"""Pydantic schemas for Detection JSONB payloads."""
+"""Pydantic schemas for analysis run JSONB payloads."""
 
 from pydantic import BaseModel, Field
 
 
 class BirdnetDetectionDetails(BaseModel):
-    """Data contract for the ``details`` JSONB field of a BirdNET detection."""
+    """Data contract for the ``analysis_runs.details`` JSONB of a BirdNET run."""
 
     model_version: str = Field(
         ...,
@@ -18,3 +18,19 @@ class BirdnetDetectionDetails(BaseModel):
     lat: float | None = None
     lon: float | None = None
     week: int | None = None
+    merge_events: bool = False
+
+
+class DetectionEvent(BaseModel):
+    """Data contract for the ``detections.event`` JSONB of a merged detection.
+
+    Present when overlapping windows of one label were merged into a single
+    detection; the row's ``confidence`` is the best window score.
+    """
+
+    windows: int = Field(..., ge=2, description="Number of merged windows.")
+    mean_confidence: float
+    offsets_s: list[float] = Field(
+        ..., description="Window starts relative to the detection time (seconds)."
+    )
+    scores: list[float] = Field(..., description="Score of each window.")
@@ -87,7 +87,24 @@ class BirdnetSettings(BaseModel):
 
     confidence_threshold: float = 0.65
     clip_padding_seconds: float = 3.0
+    clip_mode: Literal["eager", "lazy"] = "eager"
+    clip_top_n: int = 1
+    clip_format: Literal["flac", "opus", "wav"] = "flac"
     overlap: float = 0.0
+    adaptive_overlap: float | None = None
+    interest_threshold: float = 0.25
+    merge_events: bool = False
     sensitivity: float = 1.0
     threads: int = 1
+    model_variant: Literal["FP32", "FP16", "INT8"] = "FP32"
+    min_variant_agreement: float = 0.95
+    batch_size: int = 8
+    workers: int = 1
+    claim_batch_size: int = 8
+    prefetch: int = 2
+    gate_threshold_db: float | None = None
+    logit_store: Literal["off", "top_k", "full"] = "off"
+    logit_top_k: int = 16
     processing_order: Literal["oldest_first", "newest_first"] = "oldest_first"
+    stream_analysis: bool = False
+    common_name_locale: str | None = None
@@ -0,0 +1,165 @@
+"""Redis Pub/Sub wake-up for analysis workers (ADR-0018, messaging_patterns.md §3).
+
+The Processor publishes ``"recordings"`` on the ``silvasonic:work`` channel
+after it has committed newly indexed recordings.  Idle analysis workers
+block on :class:`WorkSignal` instead of re-polling the queue on a short
+timer, so new segments are claimed right away and an idle station does not
+run empty claim queries.
+
+The signal is a simple wake-up — not a work item.  If Redis is down or a
+message is lost, the worker's fallback poll picks the recordings up; the
+queue in the database stays the single source of truth.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from typing import NoReturn
+
+import structlog
+from redis.asyncio import Redis
+from silvasonic.core.constants import RECONNECT_DELAY_S
+from silvasonic.core.redis import get_redis_connection
+
+log = structlog.get_logger()
+
+# Redis channel name and payload (messaging_patterns.md §3)
+WORK_CHANNEL = "silvasonic:work"
+NEW_RECORDINGS = "recordings"
+
+
+class WorkPublisher:
+    """Publish the new-recordings signal (best-effort, lazily connected).
+
+    Args:
+        redis_url: Redis connection URL.
+    """
+
+    def __init__(self, redis_url: str = "redis://localhost:6379/0") -> None:
+        """Initialize without connecting; the first notify() connects."""
+        self._redis_url = redis_url
+        self._redis: Redis | None = None
+
+    async def notify(self) -> bool:
+        """Wake up idle analysis workers.
+
+        Returns:
+            ``True`` if the signal was published.  Failures are logged and
+            swallowed — the workers' fallback poll still finds the work.
+        """
+        if self._redis is None:
+            self._redis = await get_redis_connection(self._redis_url)
+            if self._redis is None:
+                return False
+        try:
+            await self._redis.publish(WORK_CHANNEL, NEW_RECORDINGS)
+        except Exception as exc:
+            log.warning("work_signal.publish_failed", error=str(exc))
+            await self.close()
+            return False
+        return True
+
+    async def close(self) -> None:
+        """Drop the connection; the next notify() reconnects."""
+        redis, self._redis = self._redis, None
+        if redis is not None:
+            try:
+                await redis.aclose()
+            except Exception:
+                log.debug("work_signal.close_failed", exc_info=True)
+
+
+class WorkSignal:
+    """Subscribe to ``silvasonic:work`` and let idle workers block on it.
+
+    The subscription runs as a background task started on the first
+    :meth:`wait`, and reconnects automatically after Redis outages.
+    ``connected`` tells callers whether they may rely on the signal and use
+    a long fallback poll.
+
+    Args:
+        redis_url: Redis connection URL.
+    """
+
+    def __init__(self, redis_url: str = "redis://localhost:6379/0") -> None:
+        """Initialize without subscribing."""
+        self._redis_url = redis_url
+        self._event = asyncio.Event()
+        self._task: asyncio.Task[NoReturn] | None = None
+        self.connected = False
+
+    def _handle_message(self, raw: dict[str, object]) -> None:
+        """Process a single Pub/Sub message.
+
+        Only ``"recordings"`` payloads on ``"message"`` type wake the
+        worker.  All other messages are ignored.
+        """
+        if raw["type"] != "message":
+            return
+
+        data = raw.get("data", b"")
+        if isinstance(data, bytes):
+            data = data.decode("utf-8", errors="replace")
+
+        if data == NEW_RECORDINGS:
+            self._event.set()
+
+    async def wait(self, timeout: float) -> bool:
+        """Block until new work is signalled or ``timeout`` seconds pass.
+
+        A signal that arrived while the worker was busy is not lost: it
+        stays pending and ends the next wait immediately.
+
+        Returns:
+            ``True`` if woken by a signal, ``False`` on timeout.
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self.run())
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout)
+        except TimeoutError:
+            return False
+        self._event.clear()
+        return True
+
+    async def stop(self) -> None:
+        """Cancel the subscription task."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self.connected = False
+
+    async def run(self) -> NoReturn:
+        """Listen for work signals.
+
+        Automatically reconnects on disconnection with 5s delay.
+        """
+        import redis.asyncio as aioredis
+
+        while True:  # pragma: no cover — integration-tested (test_work_signal.py)
+            client = None
+            try:
+                client = aioredis.from_url(self._redis_url)
+                pubsub = client.pubsub()
+                await pubsub.subscribe(WORK_CHANNEL)
+                self.connected = True
+                # Work may have been signalled while we were not listening
+                self._event.set()
+                log.info("work_signal.connected", channel=WORK_CHANNEL)
+
+                async for message in pubsub.listen():
+                    self._handle_message(message)
+
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.connected = False  # Fall back to short polling meanwhile
+                log.warning("work_signal.disconnected", reconnect_in=RECONNECT_DELAY_S)
+                await asyncio.sleep(RECONNECT_DELAY_S)
+            finally:
+                self.connected = False
+                if client is not None:
+                    await client.aclose()
@@ -0,0 +1,50 @@
+"""Integration tests: WorkPublisher → WorkSignal over real Redis.
+
+Verifies that idle analysis workers are woken by the Processor's
+new-recordings signal.
+
+Uses the shared ``redis_container`` fixture from ``silvasonic-test-utils``
+(surfaced via root ``conftest.py``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from silvasonic.core.work_signal import WorkPublisher, WorkSignal
+from silvasonic.test_utils.helpers import build_redis_url
+from testcontainers.redis import RedisContainer
+
+
+@pytest.mark.integration
+class TestWorkSignalRedis:
+    """Verify the wake-up round trip with a real Redis Pub/Sub channel."""
+
+    async def test_publish_wakes_waiting_worker(self, redis_container: RedisContainer) -> None:
+        """A published signal ends a long idle wait early."""
+        url = build_redis_url(redis_container)
+        signal = WorkSignal(url)
+        publisher = WorkPublisher(url)
+
+        # The first wait subscribes and returns on the initial catch-up wake
+        assert await signal.wait(5.0) is True
+        assert signal.connected is True
+
+        waiter = asyncio.create_task(signal.wait(30.0))
+        await asyncio.sleep(0.2)
+        assert await publisher.notify() is True
+        assert await asyncio.wait_for(waiter, 5.0) is True
+
+        await publisher.close()
+        await signal.stop()
+
+    async def test_timeout_without_publish(self, redis_container: RedisContainer) -> None:
+        """Without a signal the wait falls back to its timeout."""
+        signal = WorkSignal(build_redis_url(redis_container))
+
+        assert await signal.wait(5.0) is True  # initial catch-up wake
+        assert await signal.wait(0.3) is False
+
+        await signal.stop()
+        assert signal.connected is False
@@ -0,0 +1,172 @@
+"""Unit tests for lease-based recording claims.
+
+The SQL itself is covered by the BirdNET worker-pull integration tests;
+these tests pin the parameters and short-circuits without a database.
+"""
+
+from datetime import UTC, datetime
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from silvasonic.core.database.analysis_queue import (
+    Claim,
+    claim_recordings,
+    complete_recordings,
+    release_recordings,
+)
+
+T0 = datetime(2026, 5, 1, 4, 0, tzinfo=UTC)
+
+
+def _result(rows: list[tuple[Any, ...]]) -> MagicMock:
+    result = MagicMock()
+    result.fetchall.return_value = rows
+    return result
+
+
+def _session(claimed_ids: list[int], given_up: list[int] | None = None) -> Any:
+    load_result = MagicMock()
+    load_result.scalars.return_value.all.return_value = [MagicMock(id=r) for r in claimed_ids]
+    session = MagicMock()
+    session.execute = AsyncMock(
+        side_effect=[
+            _result([(rid,) for rid in given_up or []]),
+            _result([(rid, T0) for rid in claimed_ids]),
+            load_result,
+        ]
+    )
+    return session
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestClaimRecordings:
+    """Verify claim parameters and ordering."""
+
+    async def test_empty_queue_skips_load(self) -> None:
+        """No claimed IDs means no load round trip."""
+        session = _session([])
+        assert await claim_recordings(session, "birdnet", limit=4, lease_s=60) == Claim([])
+        assert session.execute.await_count == 2
+
+    async def test_expired_leases_are_recovered_first(self) -> None:
+        """Stale claims of this worker go back to pending before the claim."""
+        session = _session([])
+        await claim_recordings(session, "birdnet", limit=4, lease_s=60)
+
+        stmt, params = session.execute.await_args_list[0].args
+        assert params == {"worker": "birdnet", "max_attempts": 3}
+        assert "state = 'claimed'" in str(stmt)
+        assert "lease_expires_at < NOW()" in str(stmt)
+
+    async def test_poison_recordings_are_given_up(self) -> None:
+        """Leases that ran out max_attempts times end in a failed state."""
+        session = _session([], given_up=[7])
+        with patch("silvasonic.core.database.analysis_queue.log") as mock_log:
+            await claim_recordings(session, "birdnet", limit=4, lease_s=60, max_attempts=5)
+
+        stmt, params = session.execute.await_args_list[0].args
+        assert params["max_attempts"] == 5
+        assert "failed_max_attempts" in str(stmt)
+        assert mock_log.warning.call_args.kwargs["recording_ids"] == [7]
+
+    async def test_claim_binds_worker_limit_and_lease(self) -> None:
+        """Worker, batch size and lease duration are bound parameters."""
+        session = _session([3, 5])
+        claim = await claim_recordings(session, "birdnet", limit=4, lease_s=60)
+
+        stmt, params = session.execute.await_args_list[1].args
+        assert params == {"worker": "birdnet", "limit": 4, "lease_s": 60}
+        assert "SKIP LOCKED" in str(stmt)
+        assert "state = 'pending'" in str(stmt)
+        assert "FROM recordings" not in str(stmt)
+        assert [r.id for r in claim.recordings] == [3, 5]
+        assert claim.claimed_at == T0
+
+    async def test_newest_first_orders_descending(self) -> None:
+        """Processing order flips the candidate sort."""
+        session = _session([])
+        await claim_recordings(session, "birdnet", limit=1, lease_s=60, newest_first=True)
+        stmt = session.execute.await_args_list[1].args[0]
+        assert "ORDER BY recording_time DESC" in str(stmt)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestCompleteRecordings:
+    """Verify bulk completion and lease release."""
+
+    async def test_single_statement_for_the_whole_batch(self) -> None:
+        """Queue states, leases and the state summary are updated in one round trip."""
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=_result([(1,), (2,)]))
+
+        kept = await complete_recordings(
+            session, "birdnet", {1: "done", 2: "failed_file_missing"}, T0
+        )
+
+        assert kept == {1, 2}
+        assert session.execute.await_count == 1
+        stmt, params = session.execute.await_args.args
+        assert params == {
+            "worker": "birdnet",
+            "ids": [1, 2],
+            "states": ["done", "failed_file_missing"],
+            "claimed_at": T0,
+        }
+        assert "recording_analysis" in str(stmt)
+        assert "analysis_state" in str(stmt)
+
+    async def test_completion_is_fenced_by_the_lease(self) -> None:
+        """Rows reclaimed by another worker are not completed and not returned."""
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=_result([(1,)]))
+
+        kept = await complete_recordings(session, "birdnet", {1: "done", 2: "done"}, T0)
+
+        assert kept == {1}
+        stmt = str(session.execute.await_args.args[0])
+        assert "ra.state = 'claimed'" in stmt
+        assert "ra.claimed_at = CAST(:claimed_at AS TIMESTAMPTZ)" in stmt
+
+    async def test_release_returns_claims_to_pending(self) -> None:
+        """Released rows become claimable again immediately."""
+        session = MagicMock()
+        session.execute = AsyncMock()
+
+        await release_recordings(session, "birdnet", iter([4, 9]), T0)
+
+        stmt, params = session.execute.await_args.args
+        assert params == {
+            "worker": "birdnet",
+            "ids": [4, 9],
+            "claimed_at": T0,
+            "attempted": False,
+            "max_attempts": 3,
+        }
+        assert "ELSE 'pending'" in str(stmt)
+        # A claim released unattempted gives its attempt back
+        assert "attempts - 1" in str(stmt)
+
+    async def test_attempted_release_keeps_the_attempt(self) -> None:
+        """Retries after outside failures still end at max_attempts."""
+        session = MagicMock()
+        session.execute = AsyncMock()
+
+        await release_recordings(session, "birdnet", [4], T0, attempted=True, max_attempts=2)
+
+        stmt, params = session.execute.await_args.args
+        assert params["attempted"] is True
+        assert params["max_attempts"] == 2
+        assert "failed_max_attempts" in str(stmt)
+
+    async def test_nothing_to_do(self) -> None:
+        """Empty inputs never hit the database."""
+        session = MagicMock()
+        session.execute = AsyncMock()
+
+        assert await complete_recordings(session, "birdnet", {}, T0) == set()
+        await release_recordings(session, "birdnet", [], T0)
+
+        session.execute.assert_not_awaited()
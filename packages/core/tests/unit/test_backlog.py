@@ -0,0 +1,91 @@
+"""Unit tests for the throttled analysis backlog gauges.
+
+The trigger-maintained counters are covered by the Worker Pull integration
+tests; these tests pin the throttling and the best-effort error handling.
+"""
+
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from silvasonic.core.database.backlog import (
+    BacklogCounts,
+    BacklogGauge,
+    compact_backlog,
+    read_backlog,
+)
+
+
+def _session(rows: list[tuple[str, int, int]]) -> Any:
+    result = MagicMock()
+    result.fetchall.return_value = rows
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=result)
+    session.commit = AsyncMock()
+    return session
+
+
+def _patch_session(session: Any) -> Any:
+    cm = MagicMock()
+    cm.__aenter__ = AsyncMock(return_value=session)
+    cm.__aexit__ = AsyncMock(return_value=False)
+    return patch("silvasonic.core.database.backlog.get_session", return_value=cm)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestBacklogGauge:
+    """Verify throttled reads of the analysis_backlog counters."""
+
+    async def test_read_backlog_is_a_counter_lookup(self) -> None:
+        """Gauges sum the delta rows, never count the queue."""
+        session = _session([("birdnet", 12, 3)])
+        assert await read_backlog(session) == {"birdnet": BacklogCounts(12, 3)}
+        stmt = str(session.execute.await_args.args[0])
+        assert "analysis_backlog" in stmt
+        assert "count(" not in stmt.lower()
+
+    async def test_compaction_folds_deltas_per_worker(self) -> None:
+        """Deltas are replaced by their per-worker sums in one statement."""
+        session = _session([])
+        await compact_backlog(session)
+        stmt = " ".join(str(session.execute.await_args.args[0]).split())
+        assert "DELETE FROM analysis_backlog RETURNING" in stmt
+        assert "INSERT INTO analysis_backlog" in stmt
+        assert "GROUP BY worker" in stmt
+
+    async def test_reads_are_throttled(self) -> None:
+        """Within the interval, refreshes reuse the last snapshot."""
+        clock = [100.0]
+        gauge = BacklogGauge(interval_s=10.0, time_func=lambda: clock[0])
+        session = _session([("birdnet", 5, 1)])
+
+        with _patch_session(session):
+            assert await gauge.maybe_refresh() is True
+            clock[0] += 9.0
+            assert await gauge.maybe_refresh() is False
+            clock[0] += 1.0
+            assert await gauge.maybe_refresh() is True
+
+        # Each refresh compacts (and commits) before it reads
+        assert session.execute.await_count == 4
+        assert session.commit.await_count == 2
+        assert gauge.get("birdnet") == BacklogCounts(pending=5, claimed=1)
+
+    async def test_db_error_keeps_last_values(self) -> None:
+        """A failed read is best-effort and does not reset the gauges."""
+        gauge = BacklogGauge(interval_s=0.0)
+        gauge.counts = {"birdnet": BacklogCounts(3, 0)}
+
+        with patch("silvasonic.core.database.backlog.get_session", side_effect=OSError("db down")):
+            assert await gauge.maybe_refresh() is False
+
+        assert gauge.get("birdnet").pending == 3
+
+    async def test_unknown_worker_and_meta(self) -> None:
+        """Workers without counters read as zero; meta lists every worker."""
+        gauge = BacklogGauge(interval_s=10.0)
+        gauge.counts = {"birdnet": BacklogCounts(2, 1)}
+
+        assert gauge.get("batdetect") == BacklogCounts(0, 0)
+        assert gauge.as_meta() == {"birdnet": {"pending": 2, "claimed": 1}}
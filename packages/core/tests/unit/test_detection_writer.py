@@ -0,0 +1,126 @@
+"""Unit tests for bulk detection persistence.
+
+The COPY into the real hypertable is covered by the BirdNET worker-pull
+integration tests; these tests pin run resolution and the driver dispatch
+without a database.
+"""
+
+import json
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from silvasonic.core.database.detection_writer import (
+    DETECTION_COLUMNS,
+    DetectionRow,
+    encode_details,
+    insert_detections,
+)
+
+
+def _rows(count: int) -> list[DetectionRow]:
+    details = encode_details({"model_version": "v2.4", "sensitivity": 1.0})
+    t = datetime(2026, 5, 1, 6, 0, tzinfo=UTC)
+    return [
+        DetectionRow(
+            time=t + timedelta(seconds=3 * i),
+            end_time=t + timedelta(seconds=3 * i + 3),
+            recording_id=7,
+            worker="birdnet",
+            confidence=0.9,
+            label="Turdus merula",
+            common_name="Eurasian Blackbird",
+            clip_path=None,
+            pinned=False,
+            event=None,
+            details=details,
+        )
+        for i in range(count)
+    ]
+
+
+def _session(driver: Any, run_ids: list[int | None] | None = None) -> Any:
+    raw = MagicMock()
+    raw.driver_connection = driver
+    connection = MagicMock()
+    connection.get_raw_connection = AsyncMock(return_value=raw)
+    session = MagicMock()
+    session.connection = AsyncMock(return_value=connection)
+    # ``None`` simulates a lost creation race; the retry then finds run 42
+    results: list[Any] = []
+    for rid in run_ids or []:
+        results.append(MagicMock(scalar=MagicMock(return_value=rid)))
+        if rid is None:
+            results.append(MagicMock(scalar_one=MagicMock(return_value=42)))
+    session.execute = AsyncMock(side_effect=[*results, MagicMock()])
+    return session
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestInsertDetections:
+    """Verify bulk insert dispatch."""
+
+    async def test_empty_batch_skips_round_trip(self) -> None:
+        """No rows means no connection checkout."""
+        session = _session(MagicMock())
+        assert await insert_detections(session, []) == 0
+        session.connection.assert_not_awaited()
+
+    async def test_asyncpg_uses_copy_with_run_id(self) -> None:
+        """All rows go out in one COPY, referencing their run instead of details."""
+        driver = MagicMock()
+        driver.copy_records_to_table = AsyncMock()
+        session = _session(driver, run_ids=[7])
+        rows = _rows(3)
+
+        assert await insert_detections(session, rows) == 3
+
+        # One run lookup for the shared payload, no per-row statements
+        assert session.execute.await_count == 1
+        call = driver.copy_records_to_table.await_args_list[-1]
+        assert call.args == ("detections",)
+        assert call.kwargs["columns"] == DETECTION_COLUMNS
+        records = call.kwargs["records"]
+        assert [r[:-1] for r in records] == [tuple(row[:-1]) for row in rows]
+        assert {r[-1] for r in records} == {7}
+
+    async def test_other_drivers_use_executemany(self) -> None:
+        """Without COPY support, one executemany INSERT carries all rows."""
+        session = _session(object(), run_ids=[7])
+
+        assert await insert_detections(session, _rows(2)) == 2
+
+        params = session.execute.await_args_list[-1].args[1]
+        assert len(params) == 2
+        assert set(params[0]) == set(DETECTION_COLUMNS)
+        assert params[0]["run_id"] == 7
+
+    async def test_distinct_payloads_get_distinct_runs(self) -> None:
+        """Each configuration snapshot is resolved once; a lost race is retried."""
+        driver = MagicMock()
+        driver.copy_records_to_table = AsyncMock()
+        session = _session(driver, run_ids=[7, None])
+        rows = _rows(2)
+        rows[1] = rows[1]._replace(details=encode_details({"sensitivity": 1.5}))
+
+        await insert_detections(session, rows)
+
+        records = driver.copy_records_to_table.await_args_list[-1].kwargs["records"]
+        assert [r[-1] for r in records] == [7, 42]
+
+
+@pytest.mark.unit
+class TestDetectionRow:
+    """Verify row layout and shared details."""
+
+    def test_fields_match_copy_columns(self) -> None:
+        """Tuple order is the COPY column order (details becomes run_id)."""
+        assert DetectionRow._fields[:-1] == DETECTION_COLUMNS[:-1]
+
+    def test_details_serialized_once_and_shared(self) -> None:
+        """All rows of a run reference the same JSON string."""
+        rows = _rows(3)
+        assert rows[0].details is rows[2].details
+        assert json.loads(rows[0].details) == {"model_version": "v2.4", "sensitivity": 1.0}
@@ -10,7 +10,7 @@ from silvasonic.core.schemas.cloud_sync import (
     WebDAVConfig,
     validate_rclone_config,
 )
-from silvasonic.core.schemas.detections import BirdnetDetectionDetails
+from silvasonic.core.schemas.detections import BirdnetDetectionDetails, DetectionEvent
 from silvasonic.core.schemas.devices import (
     AudioConfig,
     MicrophoneProfile,
@@ -252,3 +252,23 @@ class TestBirdnetDetectionDetails:
         assert det.lat is None
         assert det.lon is None
         assert det.week is None
+        assert det.merge_events is False
+
+
+@pytest.mark.unit
+class TestDetectionEvent:
+    """Tests for the DetectionEvent schema."""
+
+    def test_valid_event(self) -> None:
+        """A merged event carries one offset and score per window."""
+        event = DetectionEvent.model_validate(
+            {"windows": 2, "mean_confidence": 0.8, "offsets_s": [0.0, 1.0], "scores": [0.7, 0.9]}
+        )
+        assert event.windows == 2
+
+    def test_single_window_rejected(self) -> None:
+        """An event merges at least two windows."""
+        with pytest.raises(ValidationError):
+            DetectionEvent.model_validate(
+                {"windows": 1, "mean_confidence": 0.8, "offsets_s": [0.0], "scores": [0.8]}
+            )
@@ -395,10 +395,19 @@ class TestConfigSchemas:
         s = BirdnetSettings()
         assert s.confidence_threshold == 0.65
         assert s.clip_padding_seconds == 3.0
+        assert s.clip_mode == "eager"
+        assert s.clip_top_n == 1
+        assert s.clip_format == "flac"
+        assert s.model_variant == "FP32"
+        assert s.min_variant_agreement == 0.95
         assert s.overlap == 0.0
+        assert s.adaptive_overlap is None
+        assert s.merge_events is False
         assert s.sensitivity == 1.0
         assert s.threads == 1
         assert s.processing_order == "oldest_first"
+        assert s.stream_analysis is False
+        assert s.common_name_locale is None
 
     def test_processor_settings_defaults(self) -> None:
         """ProcessorSettings has correct defaults."""
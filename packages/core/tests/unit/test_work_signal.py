@@ -0,0 +1,123 @@
+"""Unit tests for the new-recordings wake-up signal.
+
+The Pub/Sub round trip is covered by ``tests/integration/test_work_signal.py``;
+these tests pin message filtering, wait semantics and best-effort publishing.
+"""
+
+import asyncio
+from typing import NoReturn
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from silvasonic.core.work_signal import (
+    NEW_RECORDINGS,
+    WORK_CHANNEL,
+    WorkPublisher,
+    WorkSignal,
+)
+
+
+async def _idle_run() -> NoReturn:
+    await asyncio.Event().wait()
+    raise AssertionError("unreachable")
+
+
+@pytest.fixture
+def signal() -> WorkSignal:
+    sig = WorkSignal("redis://test")
+    # Never touch Redis from unit tests
+    sig.run = _idle_run  # type: ignore[method-assign]
+    return sig
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestWorkSignal:
+    """Verify message handling and blocking waits."""
+
+    async def test_timeout_without_signal(self, signal: WorkSignal) -> None:
+        """No message means the fallback poll timeout elapses."""
+        assert await signal.wait(0.01) is False
+        await signal.stop()
+
+    async def test_recordings_message_wakes_waiter(self, signal: WorkSignal) -> None:
+        """A published 'recordings' payload ends the wait early."""
+        waiter = asyncio.create_task(signal.wait(5.0))
+        await asyncio.sleep(0)
+        signal._handle_message({"type": "message", "data": NEW_RECORDINGS.encode()})
+        assert await asyncio.wait_for(waiter, 1.0) is True
+        await signal.stop()
+
+    async def test_signal_while_busy_is_not_lost(self, signal: WorkSignal) -> None:
+        """A signal between two waits ends the next wait once, then it is consumed."""
+        signal._handle_message({"type": "message", "data": NEW_RECORDINGS})
+        assert await signal.wait(0.01) is True
+        assert await signal.wait(0.01) is False
+        await signal.stop()
+
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            {"type": "subscribe", "data": 1},
+            {"type": "message", "data": b"reconcile"},
+        ],
+    )
+    async def test_other_messages_ignored(self, signal: WorkSignal, raw: dict[str, object]) -> None:
+        """Subscription confirmations and foreign payloads do not wake the worker."""
+        signal._handle_message(raw)
+        assert await signal.wait(0.01) is False
+        await signal.stop()
+
+    async def test_subscription_started_lazily_and_stopped(self, signal: WorkSignal) -> None:
+        """The first wait starts the subscriber; stop cancels it."""
+        assert signal._task is None
+        await signal.wait(0.01)
+        task = signal._task
+        assert task is not None
+
+        await signal.stop()
+        assert task.cancelled()
+        assert signal.connected is False
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestWorkPublisher:
+    """Verify best-effort publishing."""
+
+    async def test_publishes_on_work_channel(self) -> None:
+        """notify() publishes the payload on the work channel, connecting once."""
+        redis = MagicMock(publish=AsyncMock())
+        with patch(
+            "silvasonic.core.work_signal.get_redis_connection",
+            new=AsyncMock(return_value=redis),
+        ) as connect:
+            publisher = WorkPublisher("redis://test")
+            assert await publisher.notify() is True
+            assert await publisher.notify() is True
+
+        connect.assert_awaited_once()
+        redis.publish.assert_awaited_with(WORK_CHANNEL, NEW_RECORDINGS)
+
+    async def test_redis_unavailable(self) -> None:
+        """Without Redis the signal is skipped, not raised."""
+        with patch(
+            "silvasonic.core.work_signal.get_redis_connection", new=AsyncMock(return_value=None)
+        ):
+            assert await WorkPublisher("redis://test").notify() is False
+
+    async def test_publish_failure_drops_connection(self) -> None:
+        """A broken connection is closed so the next notify() reconnects."""
+        redis = MagicMock(
+            publish=AsyncMock(side_effect=ConnectionError("gone")), aclose=AsyncMock()
+        )
+        with patch(
+            "silvasonic.core.work_signal.get_redis_connection",
+            new=AsyncMock(return_value=redis),
+        ) as connect:
+            publisher = WorkPublisher("redis://test")
+            assert await publisher.notify() is False
+            await publisher.notify()
+
+        redis.aclose.assert_awaited()
+        assert connect.await_count == 2
@@ -0,0 +1,82 @@
+"""Reusable decode buffers — flat RSS without a full GC per recording.
+
+Every recording used to be decoded into a fresh float32 array and followed
+by ``gc.collect()``.  A full collection walks every tracked object, including
+the interpreter wrappers and label lists that live for the whole process,
+and the allocator still churns multi-megabyte blocks.
+
+:class:`AudioArena` instead preallocates a fixed set of buffers sized for
+the longest expected segment.  The decoder fills a buffer in place
+(``SoundFile.read(out=...)``) and the pipeline hands it back once clips are
+written, so steady-state decoding allocates nothing.  Slots double as
+backpressure: the decoder waits for a free buffer when all are in flight.
+
+Processed segments (48 kHz mono PCM16 WAV) are memory-mapped instead of
+decoded (see :mod:`silvasonic.birdnet.pcm`), so their samples live in the
+page cache and the buffer of their slot stays unused.  The buffers are
+filled by every other source: raw-only recordings (resampled in place),
+other sample formats, and stream analysis, which copies mapped segments
+back to back into one buffer.
+
+Explicit collection is kept only as a safety valve under memory pressure
+(see :func:`collect_if_memory_pressure`).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+
+import numpy as np
+import psutil
+import structlog
+
+log = structlog.get_logger()
+
+
+class AudioArena:
+    """Fixed pool of preallocated mono float32 decode buffers.
+
+    Args:
+        slots: Number of buffers (recordings that may be in flight at once).
+        capacity: Samples per buffer.  Longer recordings fall back to a
+            one-off allocation.
+    """
+
+    def __init__(self, slots: int, capacity: int) -> None:
+        """Allocate all buffers up front."""
+        self.slots = max(1, slots)
+        self.capacity = capacity
+        self._free: asyncio.Queue[np.ndarray] = asyncio.Queue()
+        for _ in range(self.slots):
+            self._free.put_nowait(np.zeros(capacity, dtype=np.float32))
+
+    @property
+    def available(self) -> int:
+        """Number of buffers not currently in use."""
+        return self._free.qsize()
+
+    async def acquire(self) -> np.ndarray:
+        """Take a buffer, waiting until one is released if all are in use."""
+        return await self._free.get()
+
+    def release(self, buffer: np.ndarray) -> None:
+        """Return a buffer obtained from :meth:`acquire`."""
+        self._free.put_nowait(buffer)
+
+
+def collect_if_memory_pressure(threshold_percent: float) -> bool:
+    """Run ``gc.collect()`` only when system memory use is above the threshold.
+
+    Returns:
+        ``True`` if a collection was run.
+    """
+    try:
+        used = psutil.virtual_memory().percent
+    except (psutil.Error, OSError):
+        return False
+    if used < threshold_percent:
+        return False
+    collected = gc.collect()
+    log.info("birdnet.gc_memory_pressure", memory_percent=used, collected=collected)
+    return True
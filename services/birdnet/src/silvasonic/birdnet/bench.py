@@ -0,0 +1,316 @@
+"""BirdNET throughput benchmark — the real analysis path, offline.
+
+Runs :meth:`BirdNETService._process_recording` (decode, gate, batched
+inference, thresholding, clip writing) over a directory of audio files and
+commits the detections into an in-memory stand-in session, so no database,
+Redis or container is needed.  Every combination of model variant, TFLite
+``threads``, ``overlap`` and ``batch_size`` runs in a fresh spawned process,
+which keeps interpreter state and the peak-RSS high-water mark per
+configuration.
+
+Reported per configuration (JSON):
+
+* ``rtf`` — real-time factor, wall time / audio duration (lower is better)
+* ``window_ms_p50`` / ``window_ms_p95`` — model invoke time per window
+  (batch invoke time / batch rows)
+* ``peak_rss_mb`` — peak resident set size of the benchmark process
+* ``detections_per_s`` — detections per wall-clock second
+
+Usage (from the repository root, models in ``SILVASONIC_BIRDNET_MODEL_DIR``)::
+
+    silvasonic-birdnet-bench --threads 1 2 4 --overlap 0 1.5 --batch-size 1 8
+    silvasonic-birdnet-bench --variant FP32 FP16 --repeat 5 --output bench.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import json
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any, cast
+
+import numpy as np
+import soundfile as sf  # type: ignore[import-untyped]
+from ai_edge_litert.interpreter import Interpreter  # type: ignore[import-untyped]
+from silvasonic.birdnet.variants import MODEL_VARIANTS, model_path
+from silvasonic.core.database.detection_writer import insert_detections
+from silvasonic.core.database.models.recordings import Recording
+from sqlalchemy.ext.asyncio import AsyncSession
+
+DEFAULT_AUDIO_DIR = Path("tests/fixtures/audio")
+AUDIO_SUFFIXES = (".wav", ".flac")
+
+
+@dataclass(frozen=True)
+class BenchConfig:
+    """One point of the benchmark sweep."""
+
+    variant: str
+    threads: int
+    overlap: float
+    batch_size: int
+
+
+@dataclass(frozen=True)
+class BenchResult:
+    """Measurements of one :class:`BenchConfig` over all files and repeats."""
+
+    config: BenchConfig
+    files: int
+    audio_s: float
+    wall_s: float
+    rtf: float
+    windows: int
+    window_ms_p50: float
+    window_ms_p95: float
+    detections: int
+    detections_per_s: float
+    peak_rss_mb: float
+
+
+class TimedInterpreter:
+    """Interpreter proxy that records the invoke time per window of each batch."""
+
+    def __init__(self, interpreter: Interpreter) -> None:
+        """Wrap a loaded interpreter."""
+        self._interpreter = interpreter
+        self._rows = 1
+        self.window_ms: list[float] = []
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate everything that is not timed to the wrapped interpreter."""
+        return getattr(self._interpreter, name)
+
+    def set_tensor(self, index: int, batch: np.ndarray) -> None:
+        """Set the input batch and remember its size."""
+        self._rows = max(1, len(batch))
+        self._interpreter.set_tensor(index, batch)
+
+    def invoke(self) -> None:
+        """Invoke the model and record the time per window."""
+        start = time.perf_counter()
+        self._interpreter.invoke()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.window_ms.extend([elapsed_ms / self._rows] * self._rows)
+
+
+class MemorySession:
+    """In-memory stand-in for the ``AsyncSession`` used by :func:`insert_detections`.
+
+    Analysis runs get sequential IDs and detection records are kept in
+    :attr:`rows` (through the ``copy_records_to_table`` fast path), so the
+    commit stage costs what row building costs without a database.
+    """
+
+    def __init__(self) -> None:
+        """Start with no runs and no rows."""
+        self.runs: dict[str, int] = {}
+        self.rows: list[tuple[Any, ...]] = []
+        self.commits = 0
+
+    async def execute(self, statement: Any, params: dict[str, Any]) -> Any:
+        """Resolve an analysis run (the only statement the writer executes)."""
+        run_id = self.runs.setdefault(params["details"], len(self.runs) + 1)
+        return _Scalar(run_id)
+
+    async def connection(self) -> MemorySession:
+        """Return the session itself as its connection."""
+        return self
+
+    async def get_raw_connection(self) -> MemorySession:
+        """Return the session itself as the raw connection."""
+        return self
+
+    @property
+    def driver_connection(self) -> MemorySession:
+        """Return the session itself as the driver connection."""
+        return self
+
+    async def copy_records_to_table(
+        self, table: str, records: list[tuple[Any, ...]], columns: Sequence[str]
+    ) -> None:
+        """Keep the records instead of copying them into ``table``."""
+        self.rows.extend(records)
+
+    async def commit(self) -> None:
+        """Count the commit."""
+        self.commits += 1
+
+
+@dataclass(frozen=True)
+class _Scalar:
+    value: int
+
+    def scalar(self) -> int:
+        return self.value
+
+    def scalar_one(self) -> int:
+        return self.value
+
+
+@contextmanager
+def scratch_workspace(prefix: str) -> Iterator[str]:
+    """Yield a temporary BirdNET workspace, set as ``SILVASONIC_WORKSPACE_DIR`` in the block.
+
+    The previous environment is restored on exit, so the variable never
+    outlives the directory.
+    """
+    previous = os.environ.get("SILVASONIC_WORKSPACE_DIR")
+    with tempfile.TemporaryDirectory(prefix=prefix) as workspace:
+        os.environ["SILVASONIC_WORKSPACE_DIR"] = workspace
+        try:
+            yield workspace
+        finally:
+            if previous is None:
+                os.environ.pop("SILVASONIC_WORKSPACE_DIR", None)
+            else:
+                os.environ["SILVASONIC_WORKSPACE_DIR"] = previous
+
+
+def audio_files(audio_dir: Path) -> list[Path]:
+    """Return the benchmark audio files of ``audio_dir`` in name order."""
+    return sorted(p for p in audio_dir.iterdir() if p.suffix.lower() in AUDIO_SUFFIXES)
+
+
+def peak_rss_mb() -> float:
+    """Return the peak resident set size of this process in MiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in KiB on Linux, in bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+async def run_config(config: BenchConfig, files: Sequence[Path], repeat: int = 1) -> BenchResult:
+    """Benchmark one configuration in this process.
+
+    The first file is analyzed once untimed to allocate the interpreter's
+    tensors; then every file is analyzed ``repeat`` times.
+    """
+    from silvasonic.birdnet.labels import LabelTable
+    from silvasonic.birdnet.service import LABELS_PATH, MODEL_DIR, BirdNETService
+    from silvasonic.core.schemas.system_config import BirdnetSettings, SystemSettings
+
+    with scratch_workspace("birdnet-bench-"):
+        svc = BirdNETService()
+        svc.birdnet_config = BirdnetSettings(
+            threads=config.threads, overlap=config.overlap, batch_size=config.batch_size
+        )
+        svc.system_config = SystemSettings()
+
+        labels = LabelTable.from_file(LABELS_PATH)
+        allowed_mask = np.ones(len(labels), dtype=bool)
+        interpreter = Interpreter(
+            model_path=str(model_path(MODEL_DIR, config.variant)), num_threads=config.threads
+        )
+        interpreter.allocate_tensors()
+        timed = TimedInterpreter(interpreter)
+        session = MemorySession()
+
+        async def analyze(rec_id: int, path: Path) -> int:
+            recording = Recording(
+                id=rec_id,
+                time=datetime(2026, 5, 1, 4, tzinfo=UTC) + timedelta(minutes=rec_id),
+                file_processed=path.name,
+            )
+            rows = await svc._process_recording(recording, path, timed, labels, allowed_mask, False)
+            await insert_detections(cast(AsyncSession, session), rows)
+            await session.commit()
+            return len(rows)
+
+        await analyze(0, files[0])
+        timed.window_ms.clear()
+
+        detections = 0
+        start = time.perf_counter()
+        for rec_id, path in enumerate(list(files) * repeat, start=1):
+            detections += await analyze(rec_id, path)
+        wall_s = time.perf_counter() - start
+        svc._clip_writer.shutdown()
+
+    audio_s = sum(sf.info(str(path)).duration for path in files) * repeat
+    window_ms = np.array(timed.window_ms or [0.0])
+    return BenchResult(
+        config=config,
+        files=len(files) * repeat,
+        audio_s=round(audio_s, 3),
+        wall_s=round(wall_s, 4),
+        rtf=round(wall_s / audio_s, 5),
+        windows=len(timed.window_ms),
+        window_ms_p50=round(float(np.percentile(window_ms, 50)), 3),
+        window_ms_p95=round(float(np.percentile(window_ms, 95)), 3),
+        detections=detections,
+        detections_per_s=round(detections / wall_s, 2),
+        peak_rss_mb=round(peak_rss_mb(), 1),
+    )
+
+
+def _run_config_sync(config: BenchConfig, files: Sequence[Path], repeat: int) -> BenchResult:
+    return asyncio.run(run_config(config, files, repeat))
+
+
+def sweep(
+    configs: Sequence[BenchConfig], files: Sequence[Path], repeat: int = 1
+) -> list[BenchResult]:
+    """Benchmark every configuration in a fresh spawned process, one at a time."""
+    results = []
+    for config in configs:
+        with ProcessPoolExecutor(
+            max_workers=1, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            result = executor.submit(_run_config_sync, config, files, repeat).result()
+        # Progress on stderr: stdout may carry the report
+        print(f"{config}: rtf={result.rtf}", file=sys.stderr)
+        results.append(result)
+    return results
+
+
+def report(results: Sequence[BenchResult], files: Sequence[Path]) -> dict[str, Any]:
+    """Build the machine-readable benchmark report."""
+    return {
+        "created": datetime.now(UTC).isoformat(timespec="seconds"),
+        "cpu_count": os.cpu_count(),
+        "files": [path.name for path in files],
+        "results": [asdict(result) for result in results],
+    }
+
+
+def main() -> None:
+    """Run the BirdNET benchmark sweep and write the JSON report."""
+    parser = argparse.ArgumentParser(description="Benchmark the BirdNET analysis path offline.")
+    parser.add_argument("--audio-dir", type=Path, default=DEFAULT_AUDIO_DIR)
+    parser.add_argument("--variant", nargs="+", choices=MODEL_VARIANTS, default=["FP32"])
+    parser.add_argument("--threads", nargs="+", type=int, default=[1])
+    parser.add_argument("--overlap", nargs="+", type=float, default=[0.0])
+    parser.add_argument("--batch-size", nargs="+", type=int, default=[8])
+    parser.add_argument("--repeat", type=int, default=3, help="Passes over all files.")
+    parser.add_argument("--output", type=Path, help="Report file (default: stdout).")
+    args = parser.parse_args()
+
+    files = audio_files(args.audio_dir)
+    if not files:
+        parser.error(f"no audio files in {args.audio_dir}")
+    configs = [
+        BenchConfig(*point)
+        for point in itertools.product(args.variant, args.threads, args.overlap, args.batch_size)
+    ]
+    output = json.dumps(report(sweep(configs, files, args.repeat), files), indent=2)
+    if args.output is None:
+        print(output)
+    else:
+        args.output.write_text(output + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,12 +2,21 @@
 
 from __future__ import annotations
 
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
 import structlog
+from silvasonic.birdnet.latency import LatencyHistogram
 from silvasonic.core.constants import DEFAULT_LOG_STARTUP_S, DEFAULT_LOG_SUMMARY_INTERVAL_S
 from silvasonic.core.two_phase import TwoPhaseWindow
 
 log = structlog.get_logger()
 
+# Timed stages of a batch, in order: lease query, audio decode, model inference,
+# thresholding/row building, clip encoding + writing, bulk insert + commit
+STAGES = ("claim", "decode", "inference", "postprocess", "clip_write", "commit")
+
 
 class BirdnetStats:
     """Tracks BirdNET inference progress and limits log spam during steady state."""
@@ -27,10 +36,20 @@ class BirdnetStats:
         self.total_hits = 0
         self.total_errors = 0
         self.total_duration_s = 0.0
+        self.total_windows = 0
+        self.total_windows_skipped = 0
+        # Model invokes (batches) per analysis pass: "coarse", and "fine" with adaptive overlap
+        self.invokes: dict[str, int] = {}
+        # Wall-clock latency per stage — tells disk, CPU and database stalls apart
+        self.stages = {stage: LatencyHistogram() for stage in STAGES}
 
         self._last_summary_analyzed = 0
         self._last_summary_hits = 0
         self._last_summary_errors = 0
+        self._last_summary_windows = 0
+        self._last_summary_windows_skipped = 0
+        self._last_summary_invokes: dict[str, int] = {}
+        self._last_summary_stages = {stage: h.snapshot() for stage, h in self.stages.items()}
 
     @property
     def is_startup_phase(self) -> bool:
@@ -51,6 +70,35 @@ class BirdnetStats:
                 hits=hits,
             )
 
+    def record_gate(self, windows: int, skipped: int) -> None:
+        """Record how many windows of a recording the energy pre-gate skipped."""
+        self.total_windows += windows
+        self.total_windows_skipped += skipped
+
+    def record_invokes(self, stage: str, invokes: int) -> None:
+        """Record model invokes of one analysis pass (``coarse`` or ``fine``)."""
+        self.invokes[stage] = self.invokes.get(stage, 0) + invokes
+
+    def record_stage(self, stage: str, seconds: float) -> None:
+        """Record the duration of one stage (see ``STAGES``)."""
+        self.stages[stage].record(seconds)
+
+    @contextmanager
+    def timed(self, stage: str) -> Iterator[None]:
+        """Record the wall-clock duration of the block as ``stage`` (unless it raises)."""
+        start = time.perf_counter()
+        yield
+        self.record_stage(stage, time.perf_counter() - start)
+
+    def stage_latencies(
+        self, since: dict[str, list[int]] | None = None
+    ) -> dict[str, dict[str, float | int]]:
+        """Return count and p50/p95/p99 (ms) per stage, optionally since a snapshot."""
+        return {
+            stage: h.summary(None if since is None else since[stage])
+            for stage, h in self.stages.items()
+        }
+
     def record_error(self, recording_id: int, exc: Exception) -> None:
         """Record an inference error."""
         self.total_errors += 1
@@ -77,6 +125,11 @@ class BirdnetStats:
         diff_analyzed = self.total_analyzed - self._last_summary_analyzed
         diff_hits = self.total_hits - self._last_summary_hits
         diff_errors = self.total_errors - self._last_summary_errors
+        diff_windows = self.total_windows - self._last_summary_windows
+        diff_skipped = self.total_windows_skipped - self._last_summary_windows_skipped
+        diff_invokes = {
+            stage: n - self._last_summary_invokes.get(stage, 0) for stage, n in self.invokes.items()
+        }
 
         if diff_analyzed > 0 or diff_errors > 0:
             log.info(
@@ -85,6 +138,10 @@ class BirdnetStats:
                 analyzed_recent=diff_analyzed,
                 hits_recent=diff_hits,
                 errors_recent=diff_errors,
+                windows_recent=diff_windows,
+                windows_skipped_recent=diff_skipped,
+                invokes_recent=diff_invokes,
+                stages_recent=self.stage_latencies(since=self._last_summary_stages),
                 total_analyzed=self.total_analyzed,
                 total_hits=self.total_hits,
                 total_errors=self.total_errors,
@@ -93,6 +150,10 @@ class BirdnetStats:
         self._last_summary_analyzed = self.total_analyzed
         self._last_summary_hits = self.total_hits
         self._last_summary_errors = self.total_errors
+        self._last_summary_windows = self.total_windows
+        self._last_summary_windows_skipped = self.total_windows_skipped
+        self._last_summary_invokes = dict(self.invokes)
+        self._last_summary_stages = {stage: h.snapshot() for stage, h in self.stages.items()}
 
     def emit_final_summary(self) -> None:
         """Emit the lifetime summary before shutdown."""
@@ -102,5 +163,9 @@ class BirdnetStats:
             total_analyzed=self.total_analyzed,
             total_hits=self.total_hits,
             total_errors=self.total_errors,
+            total_windows=self.total_windows,
+            total_windows_skipped=self.total_windows_skipped,
+            total_invokes=dict(self.invokes),
             total_duration_s=round(self.total_duration_s, 2),
+            stages=self.stage_latencies(),
         )
@@ -0,0 +1,328 @@
+"""BirdNET detection clips — written at analysis time or materialized on request.
+
+A clip covers a time span of a recording, not a detection: all detections
+of the same span (e.g. several species in one window) share one file, named
+after the recording and span only.  Clips are encoded as ``clip_format``
+(FLAC by default, Opus or WAV) on the :class:`ClipWriter` thread pool.
+
+With ``clip_mode: eager`` every detection gets its clip while the decoded
+audio is in memory.  Most of those clips are never played back, so
+``clip_mode: lazy`` writes only the ``clip_top_n`` best detections per label
+and recording; every other detection keeps its position in the source
+recording instead, which its ``time``/``end_time`` relative to
+``recordings.time`` already give exactly.  :class:`ClipService` cuts the clip
+from the source on first request and caches it under ``clips/``.  That source
+is the detection's own recording: with ``stream_analysis``, an eager clip of
+a detection near a segment boundary runs on into the neighbouring segment,
+while its lazy clip stops at the end of its recording (the neighbour may be
+gone by the time the clip is requested)::
+
+    async with get_session() as session:
+        clip_path = await ClipService(clips_dir, recordings_dir, 3.0).materialize(session, 42)
+        await session.commit()
+
+Detections with ``pinned = true`` (user-starred) are clips to keep: the
+BirdNET worker materializes pending pins while idle, the Janitor holds their
+source back in Housekeeping mode until then and never deletes a pinned clip.
+
+Usage (inside the BirdNET container)::
+
+    silvasonic-birdnet-clip 42 43         # materialize, print clip paths
+    silvasonic-birdnet-clip --pin 42      # ... and keep the clip for good
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Literal
+
+import numpy as np
+import soundfile as sf  # type: ignore[import-untyped]
+import structlog
+from silvasonic.core.database.models.detections import MAX_PIN_CLIP_ATTEMPTS, Detection
+from silvasonic.core.database.models.recordings import Recording
+from silvasonic.core.database.session import get_session
+from sqlalchemy import Row, Select, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+log = structlog.get_logger()
+
+ClipFormat = Literal["flac", "opus", "wav"]
+
+# soundfile (format, subtype) per clip format; None = the format's default
+_SF_FORMATS: dict[str, tuple[str, str | None]] = {
+    "flac": ("FLAC", None),
+    "opus": ("OGG", "OPUS"),
+    "wav": ("WAV", None),
+}
+# Opus only encodes these rates; raw-only sources fall back to FLAC
+_OPUS_RATES = frozenset({8000, 12000, 16000, 24000, 48000})
+
+
+def clip_format_for(clip_format: ClipFormat, sample_rate: int) -> ClipFormat:
+    """Return the format a clip at ``sample_rate`` is actually written in."""
+    if clip_format == "opus" and sample_rate not in _OPUS_RATES:
+        return "flac"
+    return clip_format
+
+
+def clip_stem(recording_id: int, start_ms: int, end_ms: int) -> str:
+    """Return the clip filename of a span without extension (times relative to its recording)."""
+    return f"{recording_id}_{start_ms}_{end_ms}"
+
+
+def span_ms(start_s: float, end_s: float) -> tuple[int, int]:
+    """Return the millisecond bounds :func:`clip_stem` names a span by.
+
+    Rounded rather than truncated: detection times are stored with
+    microsecond precision, so a span read back from the database may sit a
+    hair below the sample position it was cut at.  Eager and lazy clips of
+    the same span must get the same stem.
+    """
+    return round(start_s * 1000), round(end_s * 1000)
+
+
+def top_per_label(classes: np.ndarray, scores: np.ndarray, n: int) -> np.ndarray:
+    """Mark the ``n`` highest-scoring detections of each class (lazy-mode clips)."""
+    order = np.lexsort((-scores, classes))
+    ordered = classes[order]
+    rank = np.arange(len(order)) - np.searchsorted(ordered, ordered)
+    top = np.zeros(len(classes), dtype=bool)
+    top[order] = rank < n
+    return top
+
+
+def write_clip(dest: Path, audio: np.ndarray, sample_rate: int) -> bool:
+    """Write one clip in the format of its extension; failures are logged as ``False``."""
+    sf_format, subtype = _SF_FORMATS[dest.suffix[1:]]
+    try:
+        sf.write(str(dest), audio, sample_rate, subtype=subtype, format=sf_format)
+        return True
+    except Exception as e:
+        log.warning("birdnet.clip_extraction_failed", error=str(e), path=str(dest))
+        return False
+
+
+def extract_clip(
+    source: Path, start_s: float, end_s: float, dest: Path, clip_format: ClipFormat = "flac"
+) -> Path | None:
+    """Cut ``[start_s, end_s)`` out of ``source`` at its native rate.
+
+    ``dest`` is the clip path without extension; Opus falls back to FLAC
+    for rates it cannot encode.
+
+    Returns:
+        The written clip, or ``None`` on failure.
+    """
+    try:
+        info = sf.info(str(source))
+        start = max(0, int(start_s * info.samplerate))
+        stop = min(info.frames, int(end_s * info.samplerate))
+        audio, sample_rate = sf.read(str(source), start=start, stop=stop, dtype="float32")
+    except Exception as e:
+        log.warning("birdnet.clip_source_unreadable", error=str(e), path=str(source))
+        return None
+    if audio.ndim > 1:
+        audio = audio.mean(axis=1)
+    path = dest.with_name(f"{dest.name}.{clip_format_for(clip_format, sample_rate)}")
+    return path if write_clip(path, audio, sample_rate) else None
+
+
+class ClipWriter:
+    """Encodes clips on a dedicated thread pool.
+
+    FLAC/Opus encoding is CPU-bound and would otherwise queue behind
+    decoding and inference on the default executor.
+
+    Args:
+        threads: Writer threads.
+    """
+
+    def __init__(self, threads: int) -> None:
+        """Start the writer pool."""
+        self._pool = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="clip-writer")
+
+    async def write(self, dest: Path, audio: np.ndarray, sample_rate: int) -> bool:
+        """Write one clip (see :func:`write_clip`) without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, write_clip, dest, audio, sample_rate)
+
+    def shutdown(self) -> None:
+        """Finish pending writes and stop the pool."""
+        self._pool.shutdown(wait=True)
+
+
+class ClipService:
+    """Materializes BirdNET clips from their source recordings on request.
+
+    Args:
+        clips_dir: ``clips/`` in the BirdNET workspace (the cache).
+        recordings_dir: Root of the Recorder workspace (read-only).
+        padding_s: Audio kept before and after the detection.
+        clip_format: Format of newly cut clips.
+    """
+
+    _COLUMNS = (
+        Detection.id,
+        Detection.time,
+        Detection.end_time,
+        Detection.clip_path,
+        Recording.id,
+        Recording.time,
+        Recording.file_processed,
+        Recording.file_raw,
+        Recording.local_deleted,
+    )
+
+    def __init__(
+        self,
+        clips_dir: Path,
+        recordings_dir: Path,
+        padding_s: float,
+        clip_format: ClipFormat = "flac",
+    ) -> None:
+        """Initialize with workspace locations and the clip settings."""
+        self.clips_dir = clips_dir
+        self.recordings_dir = recordings_dir
+        self.padding_s = padding_s
+        self.clip_format = clip_format
+
+    def _select(self) -> Select[*tuple[Any, ...]]:
+        return (
+            select(*self._COLUMNS)
+            .join(Recording, Recording.id == Detection.recording_id)
+            .where(Detection.worker == "birdnet")
+        )
+
+    async def materialize(self, session: AsyncSession, detection_id: int) -> str | None:
+        """Return the clip path of a detection, cutting the clip first if needed.
+
+        The caller commits (the detection's ``clip_path`` is updated).
+
+        Returns:
+            ``clips/<file>`` relative to the BirdNET workspace, or ``None``
+            if the detection is unknown or its source recording is gone.
+        """
+        result = await session.execute(self._select().where(Detection.id == detection_id))
+        row = result.first()
+        if row is None:
+            return None
+        return await self._materialize(session, row)
+
+    async def materialize_pinned(self, session: AsyncSession, limit: int) -> int:
+        """Materialize up to ``limit`` pinned detections that have no clip yet.
+
+        Pins with the fewest failed attempts go first (oldest first among
+        equals), and each failed cut counts towards ``clip_attempts``; after
+        ``MAX_PIN_CLIP_ATTEMPTS`` a pin is no longer selected, so pins that
+        can never be cut do not crowd out the rest.  The caller commits.
+
+        Returns:
+            Number of clips written.
+        """
+        result = await session.execute(
+            self._select()
+            .where(
+                Detection.pinned.is_(True),
+                Detection.clip_path.is_(None),
+                Detection.clip_attempts < MAX_PIN_CLIP_ATTEMPTS,
+                Recording.local_deleted.is_(False),
+            )
+            .order_by(Detection.clip_attempts, Detection.time)
+            .limit(limit)
+        )
+        written = 0
+        for row in result.all():
+            det_id, det_time = row[0], row[1]
+            try:
+                path = await self._materialize(session, row)
+            except Exception as e:
+                log.warning("birdnet.pin_clip_failed", detection_id=det_id, error=str(e))
+                path = None
+            if path is not None:
+                written += 1
+                continue
+            await session.execute(
+                update(Detection)
+                .where(Detection.id == det_id, Detection.time == det_time)
+                .values(clip_attempts=Detection.clip_attempts + 1)
+            )
+        return written
+
+    async def _materialize(self, session: AsyncSession, row: Row[Any]) -> str | None:
+        det_id, det_time, det_end, clip_path, rec_id, rec_time, processed, raw, gone = tuple(row)
+        if clip_path is not None and (self.clips_dir.parent / clip_path).exists():
+            return str(clip_path)
+        if gone:
+            return None
+
+        # Sample position in the source recording, as the detection times encode it
+        start_s = (det_time - rec_time).total_seconds()
+        end_s = (det_end - rec_time).total_seconds()
+        stem = clip_stem(rec_id, *span_ms(start_s, end_s))
+        # Another detection of the same span may have cut the clip already
+        clip = next(self.clips_dir.glob(f"{stem}.*"), None)
+        if clip is None:
+            clip = await asyncio.to_thread(
+                extract_clip,
+                self.recordings_dir / (processed or raw),
+                start_s - self.padding_s,
+                end_s + self.padding_s,
+                self.clips_dir / stem,
+                self.clip_format,
+            )
+        if clip is None:
+            return None
+
+        path = f"clips/{clip.name}"
+        await session.execute(
+            update(Detection)
+            .where(Detection.id == det_id, Detection.time == det_time)
+            .values(clip_path=path)
+        )
+        log.info("birdnet.clip_materialized", detection_id=det_id, clip_path=path)
+        return path
+
+
+async def _materialize_cli(detection_ids: list[int], pin: bool) -> None:
+    from silvasonic.birdnet.service import BirdNETService
+
+    svc = BirdNETService()
+    await svc.load_config()
+    assert svc.birdnet_config is not None
+    clips = ClipService(
+        svc.clips_dir,
+        svc.recordings_dir,
+        svc.birdnet_config.clip_padding_seconds,
+        svc.birdnet_config.clip_format,
+    )
+
+    async with get_session() as session:
+        for detection_id in detection_ids:
+            if pin:
+                await session.execute(
+                    update(Detection).where(Detection.id == detection_id).values(pinned=True)
+                )
+            path = await clips.materialize(session, detection_id)
+            print(f"{detection_id}\t{path or 'unavailable'}")
+        await session.commit()
+
+
+def main() -> None:
+    """Materialize BirdNET clips for the given detections."""
+    parser = argparse.ArgumentParser(
+        description="Cut BirdNET detection clips from their source recordings."
+    )
+    parser.add_argument("detection_id", type=int, nargs="+", help="Detection ID(s).")
+    parser.add_argument(
+        "--pin", action="store_true", help="Also pin the detections so their clips are kept."
+    )
+    args = parser.parse_args()
+    asyncio.run(_materialize_cli(args.detection_id, args.pin))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""Detection events — hits of overlapping windows merged into one detection.
+
+With ``overlap > 0`` (or adaptive overlap) one song is scored by several
+overlapping windows, and every window above the threshold would become its
+own detection row and clip.  :func:`merge_windows` merges hits of the same
+class whose windows overlap or touch into one event that spans the first
+window's start to the last window's end::
+
+    windows  |--A 0.7--|
+                 |--A 0.9--|              -> A 0.9, 0-5 s, 3 windows
+                     |--A 0.6--|
+                                 |--A 0.8--|  -> A 0.8, 8-11 s, 1 window
+
+The event's confidence is its best window score; all window scores are kept
+in the row's ``event`` payload (:func:`encode_event`).  Merging is vectorized:
+hits are sorted by (group, class, start) and a new event begins wherever the
+group or class changes or a window starts after the previous one ended.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+from silvasonic.core.schemas.detections import DetectionEvent
+
+
+@dataclass(frozen=True)
+class Events:
+    """Detection events as per-event arrays, plus the windows each one covers.
+
+    Attributes:
+        groups: Group key of each event (see :func:`merge_windows`).
+        classes: Class index of each event.
+        starts: First window start (samples).
+        ends: Last window end (samples).
+        confidence: Best window score.
+        hit_starts: Window starts of all hits, grouped by event.
+        hit_scores: Window scores of all hits, grouped by event.
+        bounds: ``(events + 1,)`` offsets; event ``k`` covers hits
+            ``bounds[k]:bounds[k + 1]``.
+    """
+
+    groups: np.ndarray
+    classes: np.ndarray
+    starts: np.ndarray
+    ends: np.ndarray
+    confidence: np.ndarray
+    hit_starts: np.ndarray
+    hit_scores: np.ndarray
+    bounds: np.ndarray
+
+    def __len__(self) -> int:
+        """Return the number of events."""
+        return len(self.classes)
+
+    def windows(self, k: int) -> slice:
+        """Return the slice of ``hit_starts``/``hit_scores`` covered by event ``k``."""
+        return slice(int(self.bounds[k]), int(self.bounds[k + 1]))
+
+
+def single_windows(
+    starts: np.ndarray,
+    classes: np.ndarray,
+    scores: np.ndarray,
+    window: int,
+    groups: np.ndarray | None = None,
+) -> Events:
+    """Wrap every hit as an event of its own (merging disabled)."""
+    return Events(
+        groups=np.zeros(len(starts), dtype=np.int64) if groups is None else groups,
+        classes=classes,
+        starts=starts,
+        ends=starts + window,
+        confidence=scores,
+        hit_starts=starts,
+        hit_scores=scores,
+        bounds=np.arange(len(starts) + 1),
+    )
+
+
+def merge_windows(
+    starts: np.ndarray,
+    classes: np.ndarray,
+    scores: np.ndarray,
+    window: int,
+    groups: np.ndarray | None = None,
+) -> Events:
+    """Merge hits of one class whose windows overlap or touch into events.
+
+    Args:
+        starts: ``(hits,)`` window start of each hit (samples).
+        classes: ``(hits,)`` class index of each hit.
+        scores: ``(hits,)`` score of each hit.
+        window: Window length in samples.
+        groups: Optional ``(hits,)`` key (e.g. recording ID); hits of
+            different groups never merge.
+    """
+    if len(starts) == 0:
+        return single_windows(starts, classes, scores, window, groups)
+    if groups is None:
+        groups = np.zeros(len(starts), dtype=np.int64)
+
+    order = np.lexsort((starts, classes, groups))
+    starts, classes, scores, groups = starts[order], classes[order], scores[order], groups[order]
+
+    new_event = np.ones(len(starts), dtype=bool)
+    new_event[1:] = (
+        (groups[1:] != groups[:-1])
+        | (classes[1:] != classes[:-1])
+        | (starts[1:] > starts[:-1] + window)
+    )
+    first = np.flatnonzero(new_event)
+    bounds = np.append(first, len(starts))
+
+    return Events(
+        groups=groups[first],
+        classes=classes[first],
+        starts=starts[first],
+        ends=starts[bounds[1:] - 1] + window,
+        confidence=np.maximum.reduceat(scores, first),
+        hit_starts=starts,
+        hit_scores=scores,
+        bounds=bounds,
+    )
+
+
+def encode_event(events: Events, k: int, sample_rate: int) -> str | None:
+    """Serialize the window scores of event ``k``; ``None`` for a single window."""
+    hits = events.windows(k)
+    scores = events.hit_scores[hits]
+    if len(scores) == 1:
+        return None
+    offsets = (events.hit_starts[hits] - events.starts[k]) / sample_rate
+    return DetectionEvent(
+        windows=len(scores),
+        mean_confidence=round(float(scores.mean()), 4),
+        offsets_s=[round(o, 3) for o in offsets.tolist()],
+        scores=[round(s, 4) for s in scores.tolist()],
+    ).model_dump_json()
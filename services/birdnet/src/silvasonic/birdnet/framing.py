@@ -0,0 +1,141 @@
+"""Zero-copy sliding-window framing for BirdNET audio.
+
+Builds all analysis windows of a recording as a single strided, read-only
+view over one buffer instead of slicing (and zero-padding) each window
+individually.  Works for any ``overlap`` setting: the window step only
+changes the row stride of the view, never the amount of copied memory.
+
+:func:`refine_rows` picks the dense-grid windows for the second pass of
+adaptive (coarse-to-fine) overlap.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from silvasonic.birdnet.pcm import Pcm16Frames
+
+
+def window_count(n_samples: int, step: int, min_samples: int) -> int:
+    """Return how many windows start at ``0, step, 2*step, ...`` with enough audio.
+
+    A window is only analyzed if at least ``min_samples`` of real audio remain
+    after its start (shorter tails are dropped, longer ones are zero-padded).
+    """
+    if n_samples < min_samples:
+        return 0
+    return (n_samples - min_samples) // step + 1
+
+
+def padded_length(n_samples: int, window: int, step: int, min_samples: int) -> int:
+    """Return the buffer length needed so the last window lies fully inside it."""
+    count = window_count(n_samples, step, min_samples)
+    if count == 0:
+        return n_samples
+    return max(n_samples, (count - 1) * step + window)
+
+
+def frame_audio(
+    audio: np.ndarray,
+    window: int,
+    step: int,
+    min_samples: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Frame a mono signal into overlapping windows without per-window copies.
+
+    If the tail window runs past the end of ``audio``, the signal is copied
+    **once** into a zero-padded buffer; otherwise the frames are a view
+    directly on ``audio``.
+
+    Args:
+        audio: 1-D float32 signal.
+        window: Window length in samples.
+        step: Hop between window starts in samples (``window - overlap``).
+        min_samples: Minimum real samples required for the tail window.
+
+    Returns:
+        ``(frames, starts)`` — a read-only ``(n, window)`` view and the
+        sample offset of each window start.
+    """
+    if step <= 0:
+        raise ValueError(f"Window step must be positive, got {step}")
+
+    count = window_count(len(audio), step, min_samples)
+    if count == 0:
+        return np.empty((0, window), dtype=np.float32), np.empty(0, dtype=np.int64)
+
+    needed = padded_length(len(audio), window, step, min_samples)
+    if needed > len(audio):
+        buffer = np.zeros(needed, dtype=np.float32)
+        buffer[: len(audio)] = audio
+    else:
+        buffer = np.ascontiguousarray(audio, dtype=np.float32)
+
+    frames = np.lib.stride_tricks.sliding_window_view(buffer[:needed], window)[::step]
+    starts = np.arange(count, dtype=np.int64) * step
+    return frames, starts
+
+
+def refine_rows(
+    fine_starts: np.ndarray,
+    hot_starts: np.ndarray,
+    scanned_starts: np.ndarray,
+    window: int,
+) -> np.ndarray:
+    """Select the fine-grid windows worth a second look (coarse-to-fine overlap).
+
+    A fine window is selected if it overlaps any "hot" coarse window (one
+    whose best class score passed the interest threshold) and does not start
+    at a position the coarse pass already covered.
+
+    Args:
+        fine_starts: Sample offsets of all windows on the dense grid.
+        hot_starts: Sample offsets of the hot coarse windows.
+        scanned_starts: Sample offsets of every coarse window.
+        window: Window length in samples.
+
+    Returns:
+        Ascending row indices into ``fine_starts``.
+    """
+    if len(hot_starts) == 0 or len(fine_starts) == 0:
+        return np.empty(0, dtype=np.int64)
+
+    hot = np.sort(hot_starts)
+    i = np.searchsorted(hot, fine_starts)
+    before = hot[np.maximum(i - 1, 0)]
+    after = hot[np.minimum(i, len(hot) - 1)]
+    near = (np.abs(fine_starts - before) < window) | (np.abs(fine_starts - after) < window)
+    return np.flatnonzero(near & ~np.isin(fine_starts, scanned_starts))
+
+
+class FrameRows:
+    """A subset of analysis windows, gathered from ``frames`` on access.
+
+    Indexing returns fresh ``(rows, window)`` arrays, so the gate and the
+    batcher only ever materialize one chunk or batch of the selected windows.
+
+    Args:
+        frames: Window view from :func:`frame_audio` or a ``Pcm16Frames``.
+        rows: Row indices of the selected windows.
+    """
+
+    def __init__(self, frames: np.ndarray | Pcm16Frames, rows: np.ndarray) -> None:
+        """Wrap ``frames`` without copying any sample data."""
+        self._frames = frames
+        self.rows = rows
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """``(selected windows, window)``."""
+        return (len(self.rows), self._frames.shape[1])
+
+    def __len__(self) -> int:
+        """Return the number of selected windows."""
+        return len(self.rows)
+
+    def __getitem__(self, key: slice | np.ndarray) -> np.ndarray:
+        """Return the selected windows ``key`` as a ``(rows, window)`` array."""
+        return np.asarray(self._frames[self.rows[key]], dtype=np.float32)
@@ -0,0 +1,155 @@
+"""BirdNET model invocation — in-process and multi-process (per-core) inference.
+
+TFLite intra-op threading scales poorly for the BirdNET classifier, so a
+4-core Pi 5 runs at roughly one core even with ``threads > 1``.  The
+:class:`InferencePool` instead runs N worker processes, each owning its
+own interpreter, and scales near-linearly with cores.  Decoding, clip
+writing and all database access stay in the service process; workers only
+receive window batches and return raw logits.
+
+A worker process that dies (OOM kill, or an interpreter that fails to load)
+breaks the whole executor: every pending and later batch raises
+:class:`~concurrent.futures.BrokenExecutor`.  The pool then reports itself
+``broken`` until :meth:`InferencePool.restart` replaces the executor.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor
+
+import numpy as np
+import structlog
+from ai_edge_litert.interpreter import Interpreter  # type: ignore[import-untyped]
+
+log = structlog.get_logger()
+
+
+def flat_sigmoid(x: np.ndarray, sensitivity: float = 1.0) -> np.ndarray:
+    """BirdNET sigmoid calculation (negative sensitivity matches birdnetlib/analyzer)."""
+    res = 1.0 / (1.0 + np.exp(sensitivity * np.clip(x, -15, 15)))
+    return res  # type: ignore[no-any-return]
+
+
+def logits_to_scores(logits: np.ndarray, sensitivity: float) -> np.ndarray:
+    """Map raw logits to confidences for a ``BirdnetSettings.sensitivity`` value."""
+    # Fast inversion for sigmoid according to spike v3
+    adj_sens = max(0.5, min(1.0 - (sensitivity - 1.0), 1.5))
+    return flat_sigmoid(logits, sensitivity=-adj_sens)
+
+
+def invoke_batch(interpreter: Interpreter, batch: np.ndarray) -> np.ndarray:
+    """Run a single interpreter invoke over a stacked ``(n, window_samples)`` batch.
+
+    The BirdNET model has a dynamic batch dimension. The input tensor is only
+    resized (and re-allocated) when the batch size changes, so recordings of
+    constant length reuse the same tensor allocation across invokes.
+    ``batch`` may be a strided frame view: ``set_tensor`` copies it into the
+    input tensor buffer (making it contiguous if needed), so the caller's
+    array can be reused as soon as this returns.
+
+    Returns:
+        Raw logits of shape ``(n, num_classes)``.
+    """
+    input_details = interpreter.get_input_details()[0]
+    if input_details["shape"][0] != len(batch):
+        interpreter.resize_tensor_input(input_details["index"], list(batch.shape))
+        interpreter.allocate_tensors()
+    interpreter.set_tensor(input_details["index"], batch)
+    interpreter.invoke()
+    return interpreter.get_tensor(interpreter.get_output_details()[0]["index"])  # type: ignore[no-any-return]
+
+
+# ---------------------------------------------------------------------------
+# Worker-process side (module globals live in each pool process)
+# ---------------------------------------------------------------------------
+_worker_interpreter: Interpreter | None = None
+
+
+def _init_worker(model_path: str, num_threads: int) -> None:
+    """Pool initializer: load one resident interpreter per worker process."""
+    global _worker_interpreter
+    _worker_interpreter = Interpreter(model_path=model_path, num_threads=num_threads)
+    _worker_interpreter.allocate_tensors()
+
+
+def _ready_in_worker() -> bool:
+    """Report whether this worker process loaded its interpreter."""
+    return _worker_interpreter is not None
+
+
+def _infer_in_worker(batch: np.ndarray) -> np.ndarray:
+    """Run a batch on this worker process's interpreter."""
+    if _worker_interpreter is None:
+        raise RuntimeError("Inference worker used before initialization")
+    return invoke_batch(_worker_interpreter, batch)
+
+
+class InferencePool:
+    """Process pool with one resident BirdNET interpreter per worker.
+
+    Uses the ``spawn`` start method: the service process runs an asyncio
+    loop, the health server and Redis clients, none of which are fork-safe.
+
+    Args:
+        model_path: Path to the classifier ``.tflite`` model.
+        workers: Number of worker processes (typically one per core).
+        threads: TFLite intra-op threads per worker process.
+    """
+
+    def __init__(self, model_path: str, workers: int, threads: int = 1) -> None:
+        """Start the worker processes (interpreters load lazily on first use)."""
+        self.workers = workers
+        self.broken = False
+        self._model_path = model_path
+        self._threads = threads
+        self._executor = self._start()
+        log.info("birdnet.inference_pool_started", workers=workers, threads=threads)
+
+    def _start(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self._model_path, self._threads),
+        )
+
+    async def infer(self, batch: np.ndarray) -> np.ndarray:
+        """Run one batch on the next free worker process and return raw logits.
+
+        Raises:
+            BrokenExecutor: A worker process died; the pool is ``broken``.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._executor, _infer_in_worker, batch)
+        except BrokenExecutor:
+            self.broken = True
+            raise
+
+    async def restart(self) -> bool:
+        """Replace a broken executor and check that a worker loads its model.
+
+        Returns:
+            ``True`` if the new pool is usable; ``False`` (still ``broken``)
+            if its worker failed to start, e.g. because the model is corrupt.
+        """
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = self._start()
+        loop = asyncio.get_running_loop()
+        try:
+            # Spawns the first worker, which runs the initializer
+            await loop.run_in_executor(self._executor, _ready_in_worker)
+        except BrokenExecutor as e:
+            log.error("birdnet.inference_pool_restart_failed", error=str(e))
+            self.broken = True
+            return False
+        self.broken = False
+        log.warning("birdnet.inference_pool_restarted", workers=self.workers)
+        return True
+
+    def shutdown(self) -> None:
+        """Stop all worker processes, dropping batches that have not started."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        log.info("birdnet.inference_pool_stopped", workers=self.workers)
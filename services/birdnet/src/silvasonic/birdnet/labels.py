@@ -0,0 +1,106 @@
+"""BirdNET label metadata, precomputed once per label file.
+
+The model's label file has one ``Scientific name_Common name`` line per
+class.  Splitting labels and building the detection label per hit put
+string work into the inner detection loop, which is hot during dense
+choruses.  :class:`LabelTable` does that work once at
+startup and stores the results in per-class arrays, so the hit path is pure
+indexing::
+
+    table = LabelTable.from_file(LABELS_PATH)
+    table.labels[i], table.common_names[i]
+
+``labels`` doubles as the ``taxonomy.label`` key (worker ``birdnet``), which
+lets :func:`load_common_names` bulk-load common names in another locale.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, replace
+from pathlib import Path
+
+import numpy as np
+from silvasonic.core.database.models.taxonomy import Taxonomy
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def _object_array(values: Sequence[str]) -> np.ndarray:
+    out = np.empty(len(values), dtype=object)
+    out[:] = values
+    return out
+
+
+def split_label(label: str) -> tuple[str, str]:
+    """Split a ``Scientific name_Common name`` label into ``(label, common_name)``."""
+    parts = label.split("_")
+    label_basename = f"{parts[0]}_{parts[1]}" if len(parts) > 1 else parts[0]
+    common_name = parts[1] if len(parts) > 1 else ""
+    return label_basename, common_name
+
+
+@dataclass(frozen=True)
+class LabelTable:
+    """Per-class label metadata as ``(classes,)`` object arrays of ``str``.
+
+    Attributes:
+        labels: Detection label ``Scientific name_Common name`` (also the
+            ``taxonomy.label`` key).
+        scientific_names: Scientific name.
+        common_names: Common name (model English, or a taxonomy locale).
+    """
+
+    labels: np.ndarray
+    scientific_names: np.ndarray
+    common_names: np.ndarray
+
+    @classmethod
+    def from_labels(cls, raw: Sequence[str]) -> LabelTable:
+        """Build the table from raw label lines."""
+        split = [split_label(label) for label in raw]
+        labels = [label for label, _ in split]
+        return cls(
+            labels=_object_array(labels),
+            scientific_names=_object_array([label.split("_")[0] for label in labels]),
+            common_names=_object_array([common for _, common in split]),
+        )
+
+    @classmethod
+    def from_file(cls, path: Path) -> LabelTable:
+        """Load the model's label file (one label per line)."""
+        with open(path) as f:
+            return cls.from_labels([line.strip() for line in f.readlines()])
+
+    def __len__(self) -> int:
+        """Return the number of classes."""
+        return len(self.labels)
+
+    def with_common_names(self, names: Mapping[str, str]) -> LabelTable:
+        """Return a copy whose common names are replaced where ``names`` has the label.
+
+        Classes missing from ``names`` keep their current common name.
+        """
+        common = _object_array(
+            [
+                names.get(label, current)
+                for label, current in zip(self.labels, self.common_names, strict=True)
+            ]
+        )
+        return replace(self, common_names=common)
+
+
+async def load_common_names(
+    session: AsyncSession, locale: str, worker: str = "birdnet"
+) -> dict[str, str]:
+    """Bulk-load the ``locale`` common names of all ``worker`` labels from ``taxonomy``.
+
+    Returns:
+        ``{label: common name}`` for every taxonomy row that has ``locale``.
+    """
+    stmt = select(Taxonomy.label, Taxonomy.common_names[locale].astext).where(
+        Taxonomy.worker == worker,
+        Taxonomy.common_names.has_key(locale),
+    )
+    result = await session.execute(stmt)
+    return {label: name for label, name in result.all() if name}
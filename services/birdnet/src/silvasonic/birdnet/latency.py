@@ -0,0 +1,83 @@
+"""Fixed-bucket latency histograms for the BirdNET analysis stages.
+
+``avg_inference_ms`` alone cannot tell a slow SD card from a saturated CPU
+or a struggling database: it blends everything a recording costs.  Each
+stage (claim query, decode, inference, post-processing, clip write, commit)
+therefore keeps its own histogram of wall-clock durations.  The buckets are
+fixed (1-2-3-5 steps per decade from 1 ms to 100 s), so recording a sample
+is one bisect and an increment, memory stays constant however long the
+worker runs, and the counts of two moments can be subtracted to get the
+percentiles of just the interval in between.
+
+Percentiles are interpolated linearly within their bucket; samples above
+the last bound count as that bound.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Sequence
+
+# Upper bucket bounds in milliseconds; one overflow bucket follows the last
+BUCKET_BOUNDS_MS: tuple[float, ...] = (
+    *(step * 10**decade for decade in range(5) for step in (1, 2, 3, 5)),
+    100_000,
+)
+
+PERCENTILES = (50, 95, 99)
+
+
+class LatencyHistogram:
+    """Counts of stage durations per fixed bucket."""
+
+    def __init__(self) -> None:
+        """Start with all buckets empty."""
+        self.counts = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+
+    @property
+    def count(self) -> int:
+        """Number of recorded samples."""
+        return sum(self.counts)
+
+    def record(self, seconds: float) -> None:
+        """Count one stage duration."""
+        self.counts[bisect_left(BUCKET_BOUNDS_MS, seconds * 1000)] += 1
+
+    def snapshot(self) -> list[int]:
+        """Return a copy of the bucket counts (for interval summaries)."""
+        return list(self.counts)
+
+    def summary(self, since: Sequence[int] | None = None) -> dict[str, float | int]:
+        """Return the sample count and p50/p95/p99 in milliseconds.
+
+        Args:
+            since: An earlier :meth:`snapshot`; only samples recorded after it
+                are summarized.
+        """
+        counts = (
+            self.counts
+            if since is None
+            else [n - s for n, s in zip(self.counts, since, strict=True)]
+        )
+        out: dict[str, float | int] = {"count": sum(counts)}
+        for q in PERCENTILES:
+            out[f"p{q}_ms"] = percentile(counts, q)
+        return out
+
+
+def percentile(counts: Sequence[int], q: float) -> float:
+    """Estimate the ``q``-th percentile in milliseconds from bucket ``counts``."""
+    total = sum(counts)
+    if total == 0:
+        return 0.0
+    rank = q / 100 * total
+    seen = 0
+    for i, n in enumerate(counts):
+        if n and seen + n >= rank:
+            if i == len(BUCKET_BOUNDS_MS):
+                return float(BUCKET_BOUNDS_MS[-1])
+            lo = BUCKET_BOUNDS_MS[i - 1] if i else 0.0
+            hi = BUCKET_BOUNDS_MS[i]
+            return round(lo + (hi - lo) * (rank - seen) / n, 1)
+        seen += n
+    return float(BUCKET_BOUNDS_MS[-1])
@@ -0,0 +1,309 @@
+"""Per-window logit store — re-threshold historic audio without re-inference.
+
+Raw model outputs of every scored window are appended to one directory per
+UTC day under ``{workspace}/logits/``::
+
+    logits/2026-05-01/
+    ├── meta.json      # mode, row width, class count, model version, overlap
+    ├── index.bin      # (recording_id int64, start_sample int64) per window
+    ├── values.f16     # float16 logits, ``width`` per window
+    └── classes.u16    # uint16 class indices, ``width`` per window (top_k only)
+
+Two layouts are supported:
+
+*   ``full`` — all 6522 logits per window (~13 KB per window).
+*   ``top_k`` — only the ``K`` largest logits and their class indices
+    (~4 bytes per entry). Rescoring can then only find classes that were in
+    the window's top ``K``.
+
+Files are plain fixed-width binary so they can be appended without
+rewriting and read back with :class:`numpy.memmap`.  ``index.bin`` is
+written last, so a torn append is never visible to readers.  Rescoring walks
+the mapped rows in chunks of :data:`RESCORE_CHUNK_ROWS`, so a full-mode day
+never has to fit in memory.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterator
+from dataclasses import dataclass, replace
+from datetime import date
+from pathlib import Path
+from typing import Literal
+
+import numpy as np
+from silvasonic.birdnet.inference import logits_to_scores
+
+LogitStoreMode = Literal["top_k", "full"]
+
+INDEX_DTYPE = np.dtype([("recording_id", "<i8"), ("start", "<i8")])
+VALUES_DTYPE = np.dtype("<f2")
+CLASSES_DTYPE = np.dtype("<u2")
+
+# Rows converted to float32 at once when rescoring (~27 MB per array in full mode)
+RESCORE_CHUNK_ROWS = 1024
+
+
+@dataclass(frozen=True)
+class LogitDay:
+    """Memory-mapped view of one day of stored window logits.
+
+    Attributes:
+        index: ``(n,)`` structured array of ``recording_id`` / ``start``.
+        values: ``(rows, width)`` float16 logits.
+        classes: ``(rows, width)`` class indices, or ``None`` for ``full``
+            rows (column ``j`` is class ``j``).
+        num_classes: Number of model classes.
+        overlap: Window overlap in seconds the day was analyzed with
+            (``None`` for days stored before it was recorded).
+        rows: Row of ``values`` / ``classes`` for each ``index`` entry, or
+            ``None`` if they line up.  Lets :meth:`latest` select rows
+            without copying the mapped logits.
+    """
+
+    index: np.ndarray
+    values: np.ndarray
+    classes: np.ndarray | None
+    num_classes: int
+    overlap: float | None = None
+    rows: np.ndarray | None = None
+
+    def __len__(self) -> int:
+        """Return the number of stored windows."""
+        return len(self.index)
+
+    def latest(self) -> LogitDay:
+        """Drop rows superseded by a later append for the same window.
+
+        A recording is re-appended when its lease expired and it was analyzed
+        again; only the most recent rows count.
+        """
+        if len(self.index) == 0:
+            return self
+        keys = self.index[::-1]
+        _, first = np.unique(keys, return_index=True)
+        rows = np.sort(len(keys) - 1 - first)
+        if len(rows) == len(self.index):
+            return self
+        return replace(
+            self,
+            index=self.index[rows],
+            rows=rows if self.rows is None else self.rows[rows],
+        )
+
+    def chunks(
+        self, size: int = RESCORE_CHUNK_ROWS
+    ) -> Iterator[tuple[int, np.ndarray, np.ndarray | None]]:
+        """Yield ``(first, values, classes)`` for consecutive blocks of at most ``size`` windows.
+
+        ``first`` is the position of the block's first window in ``index``;
+        only one block of logits is read from the mapped files at a time.
+        """
+        for first in range(0, len(self.index), size):
+            sel: slice | np.ndarray = (
+                slice(first, first + size) if self.rows is None else self.rows[first : first + size]
+            )
+            yield (
+                first,
+                np.asarray(self.values[sel]),
+                None if self.classes is None else np.asarray(self.classes[sel]),
+            )
+
+
+class LogitStore:
+    """Append-only writer for per-day raw BirdNET window logits.
+
+    Read the store back with :func:`stored_days` and :func:`load_day`.
+
+    Args:
+        root: Store directory (``{workspace}/logits``).
+        mode: ``"top_k"`` or ``"full"``.
+        top_k: Logits kept per window in ``top_k`` mode.
+        num_classes: Number of model classes.
+        model_version: Model version recorded in each day's metadata.
+        overlap: Window overlap in seconds, recorded in each day's metadata.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        mode: LogitStoreMode,
+        top_k: int,
+        num_classes: int,
+        model_version: str,
+        overlap: float,
+    ) -> None:
+        """Configure the store (directories are created on first append)."""
+        self.root = root
+        self.mode = mode
+        self.width = num_classes if mode == "full" else max(1, min(top_k, num_classes))
+        self.num_classes = num_classes
+        self.model_version = model_version
+        self.overlap = overlap
+
+    def _meta(self) -> dict[str, object]:
+        return {
+            "mode": self.mode,
+            "width": self.width,
+            "num_classes": self.num_classes,
+            "model_version": self.model_version,
+            "overlap": self.overlap,
+        }
+
+    def append(self, recording_id: int, day: date, starts: np.ndarray, logits: np.ndarray) -> None:
+        """Append the raw logits of one recording's scored windows.
+
+        Args:
+            recording_id: Recording the windows belong to.
+            day: UTC day of the recording (selects the directory).
+            starts: ``(n,)`` window start offsets in samples.
+            logits: ``(n, num_classes)`` raw model outputs.
+
+        Raises:
+            ValueError: If the day was written with a different layout, model
+                or overlap.
+        """
+        if len(starts) == 0:
+            return
+
+        day_dir = self.root / day.isoformat()
+        meta_path = day_dir / "meta.json"
+        if meta_path.exists():
+            existing = json.loads(meta_path.read_text())
+            if existing != self._meta():
+                raise ValueError(f"Logit store {day_dir} holds {existing}, not {self._meta()}")
+        else:
+            day_dir.mkdir(parents=True, exist_ok=True)
+            meta_path.write_text(json.dumps(self._meta()))
+
+        # Drop rows of an append that died before its index entry was written
+        rows = self._indexed_rows(day_dir)
+        for name, dtype in (("values.f16", VALUES_DTYPE), ("classes.u16", CLASSES_DTYPE)):
+            path = day_dir / name
+            size = rows * self.width * dtype.itemsize
+            if path.exists() and path.stat().st_size != size:
+                with open(path, "r+b") as f:
+                    f.truncate(size)
+
+        if self.mode == "full":
+            values = logits.astype(VALUES_DTYPE)
+        else:
+            classes = np.argpartition(logits, -self.width, axis=1)[:, -self.width :]
+            values = np.take_along_axis(logits, classes, axis=1).astype(VALUES_DTYPE)
+            with open(day_dir / "classes.u16", "ab") as f:
+                f.write(classes.astype(CLASSES_DTYPE).tobytes())
+        with open(day_dir / "values.f16", "ab") as f:
+            f.write(values.tobytes())
+
+        index = np.empty(len(starts), dtype=INDEX_DTYPE)
+        index["recording_id"] = recording_id
+        index["start"] = starts
+        with open(day_dir / "index.bin", "ab") as f:
+            f.write(index.tobytes())
+
+    @staticmethod
+    def _indexed_rows(day_dir: Path) -> int:
+        """Return the number of complete rows (those with an index entry)."""
+        index_path = day_dir / "index.bin"
+        if not index_path.exists():
+            return 0
+        return index_path.stat().st_size // INDEX_DTYPE.itemsize
+
+
+def stored_days(root: Path) -> list[date]:
+    """Return all days present in the store at ``root`` in ascending order."""
+    if not root.exists():
+        return []
+    return sorted(date.fromisoformat(p.name) for p in root.iterdir() if (p / "meta.json").exists())
+
+
+def load_day(root: Path, day: date, model_version: str) -> LogitDay:
+    """Memory-map one day of stored logits (empty if nothing was stored).
+
+    Raises:
+        ValueError: If the day was written by a different model version.
+    """
+    day_dir = root / day.isoformat()
+    meta_path = day_dir / "meta.json"
+    if not meta_path.exists():
+        return LogitDay(
+            index=np.empty(0, dtype=INDEX_DTYPE),
+            values=np.empty((0, 0), dtype=VALUES_DTYPE),
+            classes=None,
+            num_classes=0,
+        )
+
+    meta = json.loads(meta_path.read_text())
+    if meta["model_version"] != model_version:
+        raise ValueError(
+            f"Logit store {day_dir} was written by model {meta['model_version']}, "
+            f"not {model_version}"
+        )
+    width = int(meta["width"])
+    rows = LogitStore._indexed_rows(day_dir)
+
+    def _map(name: str, dtype: np.dtype, shape: tuple[int, ...]) -> np.ndarray:
+        if rows == 0:
+            return np.empty(shape, dtype=dtype)
+        return np.memmap(day_dir / name, dtype=dtype, mode="r", shape=shape)
+
+    return LogitDay(
+        index=_map("index.bin", INDEX_DTYPE, (rows,)),
+        values=_map("values.f16", VALUES_DTYPE, (rows, width)),
+        classes=(
+            _map("classes.u16", CLASSES_DTYPE, (rows, width)) if meta["mode"] == "top_k" else None
+        ),
+        num_classes=int(meta["num_classes"]),
+        overlap=meta.get("overlap"),
+    )
+
+
+def rescore(
+    day: LogitDay,
+    *,
+    sensitivity: float,
+    threshold: float,
+    allowed_mask: np.ndarray,
+    chunk_rows: int = RESCORE_CHUNK_ROWS,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Re-apply sigmoid, threshold and species mask to stored logits.
+
+    Vectorized over blocks of :data:`RESCORE_CHUNK_ROWS` windows, so memory
+    stays bounded however many windows the day holds.
+
+    Args:
+        day: Stored logits (usually ``LogitDay.latest()``).
+        sensitivity: Sigmoid sensitivity, as in ``BirdnetSettings``.
+        threshold: Confidence threshold.
+        allowed_mask: ``(num_classes,)`` boolean species mask.
+        chunk_rows: Windows scored per block.
+
+    Returns:
+        ``(rows, classes, scores)`` — row index into ``day``, class index and
+        confidence of every hit.
+    """
+    if len(day) == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty, np.empty(0, dtype=np.float32)
+
+    out_rows: list[np.ndarray] = []
+    out_classes: list[np.ndarray] = []
+    out_scores: list[np.ndarray] = []
+    for first, values, classes_block in day.chunks(chunk_rows):
+        scores = logits_to_scores(values.astype(np.float32), sensitivity)
+        if classes_block is None:
+            hit_mask = (scores >= threshold) & allowed_mask
+        else:
+            hit_mask = (scores >= threshold) & allowed_mask[classes_block]
+
+        rows, cols = np.nonzero(hit_mask)
+        out_rows.append(rows + first)
+        out_classes.append(cols if classes_block is None else classes_block[rows, cols])
+        out_scores.append(scores[rows, cols])
+
+    return (
+        np.concatenate(out_rows).astype(np.int64),
+        np.concatenate(out_classes).astype(np.int64),
+        np.concatenate(out_scores).astype(np.float32),
+    )
@@ -0,0 +1,199 @@
+"""Memory-mapped reader for 16-bit PCM WAV segments.
+
+Processed recorder segments are always 48 kHz mono S16LE WAV.  Instead of
+decoding a whole file into a float32 array, the RIFF header is parsed once
+and the sample data is memory-mapped as ``int16``.  :class:`Pcm16Frames`
+then exposes the analysis windows with the same indexing as
+:func:`~silvasonic.birdnet.framing.frame_audio`, converting only the rows
+that are actually accessed (one gate chunk or inference batch at a time)
+to float32.  Peak memory no longer scales with the segment length.
+
+Anything else (compressed formats, float or 24-bit PCM, multi-channel,
+RF64) is left to the general ``soundfile`` path.
+"""
+
+from __future__ import annotations
+
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+from silvasonic.birdnet.framing import padded_length, window_count
+
+_WAVE_FORMAT_PCM = 0x0001
+_WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+# Full scale of signed 16-bit PCM (matches soundfile's int16 → float32 scaling)
+_PCM16_SCALE = 1.0 / 32768.0
+
+
+@dataclass(frozen=True)
+class WavInfo:
+    """Layout of the sample data in a PCM WAV file.
+
+    Attributes:
+        sample_rate: Samples per second.
+        channels: Interleaved channel count.
+        bits_per_sample: Sample width in bits.
+        data_offset: Byte offset of the first sample.
+        frames: Complete sample frames present in the file.
+    """
+
+    sample_rate: int
+    channels: int
+    bits_per_sample: int
+    data_offset: int
+    frames: int
+
+
+def read_wav_header(path: Path) -> WavInfo | None:
+    """Parse the RIFF header of an integer PCM WAV file.
+
+    The frame count is clamped to the bytes actually on disk, so a segment
+    whose header was never finalized still yields its complete frames.
+
+    Returns:
+        The data layout, or ``None`` if the file is not a readable integer
+        PCM WAV.
+    """
+    try:
+        file_size = path.stat().st_size
+        with open(path, "rb") as f:
+            riff = f.read(12)
+            if len(riff) < 12 or riff[:4] != b"RIFF" or riff[8:12] != b"WAVE":
+                return None
+
+            fmt: tuple[int, int, int, int] | None = None
+            while True:
+                chunk = f.read(8)
+                if len(chunk) < 8:
+                    return None
+                chunk_id, size = chunk[:4], struct.unpack("<I", chunk[4:])[0]
+
+                if chunk_id == b"fmt ":
+                    body = f.read(size)
+                    if len(body) < 16:
+                        return None
+                    tag, channels, rate, _byte_rate, _align, bits = struct.unpack(
+                        "<HHIIHH", body[:16]
+                    )
+                    if tag == _WAVE_FORMAT_EXTENSIBLE and len(body) >= 26:
+                        tag = struct.unpack("<H", body[24:26])[0]
+                    fmt = (tag, channels, rate, bits)
+                elif chunk_id == b"data":
+                    if fmt is None:
+                        return None
+                    tag, channels, rate, bits = fmt
+                    if tag != _WAVE_FORMAT_PCM or channels < 1 or bits % 8 != 0:
+                        return None
+                    offset = f.tell()
+                    block = channels * bits // 8
+                    available = min(size, file_size - offset)
+                    return WavInfo(rate, channels, bits, offset, max(0, available) // block)
+                else:
+                    f.seek(size, 1)
+
+                if size % 2:
+                    f.seek(1, 1)  # Chunks are word-aligned
+    except (OSError, struct.error):
+        return None
+
+
+def open_pcm16(path: Path, sample_rate: int) -> np.memmap | np.ndarray | None:
+    """Memory-map a mono 16-bit PCM WAV at ``sample_rate`` as an ``int16`` array.
+
+    Returns:
+        A 1-D ``int16`` array backed by the file, or ``None`` if the file does
+        not match (callers fall back to ``soundfile``).
+    """
+    info = read_wav_header(path)
+    if (
+        info is None
+        or info.bits_per_sample != 16
+        or info.channels != 1
+        or info.sample_rate != sample_rate
+    ):
+        return None
+    if info.frames == 0:
+        return np.empty(0, dtype=np.int16)
+    return np.memmap(path, dtype="<i2", mode="r", offset=info.data_offset, shape=(info.frames,))
+
+
+def to_float32(samples: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """Copy mono samples into the float32 buffer ``out`` of the same length.
+
+    ``int16`` PCM is scaled to ``[-1, 1)`` like :class:`Pcm16Frames` rows;
+    float input is copied as is.
+
+    Returns:
+        ``out``.
+    """
+    if samples.dtype == np.int16:
+        np.multiply(samples, _PCM16_SCALE, out=out, dtype=np.float32)
+    else:
+        out[:] = samples
+    return out
+
+
+class Pcm16Frames:
+    """Sliding analysis windows over ``int16`` PCM, converted to float32 on access.
+
+    Indexing with a slice or an integer array returns a fresh
+    ``(rows, window)`` float32 array; only the selected rows are read and
+    converted.  Windows that run past the end of the signal are zero-padded
+    from a small tail copy, never from a copy of the whole signal.
+
+    Args:
+        pcm: 1-D ``int16`` signal (usually a memory map from :func:`open_pcm16`).
+        window: Window length in samples.
+        step: Hop between window starts in samples.
+        min_samples: Minimum real samples required for the tail window.
+    """
+
+    def __init__(self, pcm: np.ndarray, window: int, step: int, min_samples: int) -> None:
+        """Build the strided window views (no sample data is read)."""
+        if step <= 0:
+            raise ValueError(f"Window step must be positive, got {step}")
+
+        self.window = window
+        self.count = window_count(len(pcm), step, min_samples)
+        self.starts = np.arange(self.count, dtype=np.int64) * step
+
+        # Windows lying fully inside the signal are views on the memory map
+        self._full = min(self.count, window_count(len(pcm), step, window))
+        if self._full:
+            self._body = np.lib.stride_tricks.sliding_window_view(
+                pcm[: (self._full - 1) * step + window], window
+            )[::step]
+        else:
+            self._body = np.empty((0, window), dtype=np.int16)
+
+        # The rest are framed from one small zero-padded copy of the tail
+        tail_start = self._full * step
+        if self.count > self._full:
+            needed = padded_length(len(pcm), window, step, min_samples) - tail_start
+            tail = np.zeros(needed, dtype=np.int16)
+            tail[: len(pcm) - tail_start] = pcm[tail_start:]
+            self._tail = np.lib.stride_tricks.sliding_window_view(tail, window)[::step]
+        else:
+            self._tail = np.empty((0, window), dtype=np.int16)
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """``(windows, window)`` like the equivalent float32 frame view."""
+        return (self.count, self.window)
+
+    def __len__(self) -> int:
+        """Return the number of windows."""
+        return self.count
+
+    def __getitem__(self, key: slice | np.ndarray) -> np.ndarray:
+        """Return the selected windows as a ``(rows, window)`` float32 array."""
+        rows = np.arange(self.count)[key]
+        out = np.empty((len(rows), self.window), dtype=np.float32)
+        in_body = rows < self._full
+        out[in_body] = self._body[rows[in_body]]
+        out[~in_body] = self._tail[rows[~in_body] - self._full]
+        out *= _PCM16_SCALE
+        return out
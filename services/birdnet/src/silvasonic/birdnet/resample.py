@@ -0,0 +1,199 @@
+"""Streaming polyphase resampling to the BirdNET model rate.
+
+Raw-only devices (``processed_enabled: false``) deliver their native rate —
+96, 192 or 384 kHz for ultrasonic microphones — while the model expects
+48 kHz.  This module converts any integer rate with a rational polyphase
+filter:
+
+*   The Kaiser-windowed sinc low-pass for a ``(src_rate, dst_rate)`` pair is
+    designed once and cached (:func:`polyphase_bank`).
+*   :class:`StreamResampler` consumes input blocks and emits every output
+    sample whose filter support is complete, computing each polyphase
+    branch with one matrix-vector product.  Only ``taps`` samples of
+    history are kept between blocks, and everything stays float32, so a
+    384 kHz segment never needs a full-rate float64 copy in RAM.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable
+from functools import lru_cache
+
+import numpy as np
+import soundfile as sf  # type: ignore[import-untyped]
+
+# Filter zero crossings on each side of the centre tap (quality vs. CPU)
+ZERO_CROSSINGS = 16
+# Passband edge relative to the lower Nyquist frequency (24 kHz → 22.6 kHz at 48 kHz)
+ROLLOFF = 0.94
+# Kaiser beta — ~80 dB stopband attenuation
+KAISER_BETA = 8.0
+
+# Input frames read and resampled per block (~1.5 MB of float32 at 384 kHz stereo)
+BLOCK_FRAMES = 1 << 16
+
+# Output samples computed per gathered window matrix (bounds temporary memory)
+_OUTPUT_CHUNK = 8192
+
+
+@lru_cache(maxsize=16)
+def polyphase_bank(src_rate: int, dst_rate: int) -> tuple[int, int, int, np.ndarray]:
+    """Design the anti-aliasing filter for ``src_rate → dst_rate`` as a polyphase bank.
+
+    Returns:
+        ``(up, down, delay, bank)`` — the reduced rate ratio, the filter
+        delay in upsampled samples, and a ``(up, taps)`` float32 array whose
+        row ``p`` holds the time-reversed taps of polyphase branch ``p``.
+    """
+    g = math.gcd(src_rate, dst_rate)
+    up, down = dst_rate // g, src_rate // g
+    ratio = max(up, down)
+
+    half = ZERO_CROSSINGS * ratio
+    n = np.arange(-half, half + 1, dtype=np.float64)
+    cutoff = ROLLOFF * 0.5 / ratio  # cycles per upsampled sample
+    h = 2.0 * cutoff * np.sinc(2.0 * cutoff * n) * np.kaiser(len(n), KAISER_BETA) * up
+
+    taps = -(-len(h) // up)
+    padded = np.zeros(up * taps, dtype=np.float64)
+    padded[: len(h)] = h
+    bank = np.ascontiguousarray(padded.reshape(taps, up).T[:, ::-1], dtype=np.float32)
+    bank.flags.writeable = False  # Shared through the cache
+    return up, down, half, bank
+
+
+def output_length(n_samples: int, src_rate: int, dst_rate: int) -> int:
+    """Return the number of output samples for ``n_samples`` input samples."""
+    up, down, _, _ = polyphase_bank(src_rate, dst_rate)
+    return -(-n_samples * up // down)
+
+
+class StreamResampler:
+    """Block-wise polyphase resampler for one mono signal.
+
+    Feed input with :meth:`process` and finish with :meth:`flush`; the
+    concatenated outputs equal a one-shot, zero-phase resampling of the
+    whole signal.
+
+    Args:
+        src_rate: Input sample rate in Hz.
+        dst_rate: Output sample rate in Hz.
+    """
+
+    def __init__(self, src_rate: int, dst_rate: int) -> None:
+        """Look up the cached filter bank and start with an empty history."""
+        self.up, self.down, self.delay, self.bank = polyphase_bank(src_rate, dst_rate)
+        self.taps = self.bank.shape[1]
+        self.src_rate = src_rate
+        self.dst_rate = dst_rate
+        # History covers input indices [_start, _received); negative ones are zeros
+        self._start = -(self.taps - 1)
+        self._history = np.zeros(self.taps - 1, dtype=np.float32)
+        self._received = 0
+        self._next = 0
+
+    def _base_index(self, m: np.ndarray | int) -> np.ndarray | int:
+        return (m * self.down + self.delay) // self.up
+
+    def _emit(self, stop: int) -> np.ndarray:
+        """Compute outputs ``_next .. stop - 1`` from the current history."""
+        if stop <= self._next:
+            return np.empty(0, dtype=np.float32)
+
+        windows = np.lib.stride_tricks.sliding_window_view(self._history, self.taps)
+        out = np.empty(stop - self._next, dtype=np.float32)
+        for chunk in range(self._next, stop, _OUTPUT_CHUNK):
+            m = np.arange(chunk, min(stop, chunk + _OUTPUT_CHUNK), dtype=np.int64)
+            pos = m * self.down + self.delay
+            phase = pos % self.up
+            rows = pos // self.up - (self.taps - 1) - self._start
+            dest = out[chunk - self._next : chunk - self._next + len(m)]
+            for p in np.unique(phase).tolist():
+                sel = phase == p
+                dest[sel] = windows[rows[sel]] @ self.bank[p]
+
+        self._next = stop
+        # Drop history no later output can reach
+        keep_from = int(self._base_index(self._next)) - (self.taps - 1)
+        if keep_from > self._start:
+            self._history = self._history[keep_from - self._start :]
+            self._start = keep_from
+        return out
+
+    def process(self, block: np.ndarray) -> np.ndarray:
+        """Consume one block of input and return the outputs it completes."""
+        block = np.asarray(block, dtype=np.float32)
+        self._history = np.concatenate([self._history, block])
+        self._received += len(block)
+        # Output m is complete once its newest input sample has arrived
+        stop = -(-(self._received * self.up - self.delay) // self.down)
+        return self._emit(max(self._next, stop))
+
+    def flush(self) -> np.ndarray:
+        """Zero-pad the end of the signal and return the remaining outputs."""
+        total = -(-self._received * self.up // self.down)
+        if total <= self._next:
+            return np.empty(0, dtype=np.float32)
+        needed = int(self._base_index(total - 1)) + 1 - (self._start + len(self._history))
+        if needed > 0:
+            self._history = np.concatenate([self._history, np.zeros(needed, dtype=np.float32)])
+        return self._emit(total)
+
+
+def resample_blocks(
+    blocks: Iterable[np.ndarray],
+    src_rate: int,
+    dst_rate: int,
+    out: np.ndarray,
+) -> np.ndarray:
+    """Resample a stream of mono blocks into ``out``.
+
+    Args:
+        blocks: Consecutive mono float32 input blocks.
+        src_rate: Input sample rate in Hz.
+        dst_rate: Output sample rate in Hz.
+        out: Destination with room for :func:`output_length` samples.
+
+    Returns:
+        The filled prefix of ``out``.
+    """
+    resampler = StreamResampler(src_rate, dst_rate)
+    filled = 0
+    for block in blocks:
+        chunk = resampler.process(block)
+        out[filled : filled + len(chunk)] = chunk
+        filled += len(chunk)
+    tail = resampler.flush()
+    out[filled : filled + len(tail)] = tail
+    return out[: filled + len(tail)]
+
+
+def resample(
+    audio: np.ndarray, src_rate: int, dst_rate: int, block: int = BLOCK_FRAMES
+) -> np.ndarray:
+    """Resample an in-memory mono signal (processed block by block in float32)."""
+    out = np.empty(output_length(len(audio), src_rate, dst_rate), dtype=np.float32)
+    blocks = (audio[i : i + block] for i in range(0, len(audio), block))
+    return resample_blocks(blocks, src_rate, dst_rate, out)
+
+
+def resample_soundfile(f: sf.SoundFile, dst_rate: int, out: np.ndarray | None) -> np.ndarray:
+    """Stream an open audio file through the resampler, downmixing each block to mono.
+
+    Args:
+        f: Open ``soundfile.SoundFile`` positioned at the start.
+        dst_rate: Output sample rate in Hz.
+        out: Preferred destination buffer; a fresh array is allocated if it is
+            ``None`` or too short.
+
+    Returns:
+        The resampled mono float32 signal.
+    """
+    n_out = output_length(f.frames, f.samplerate, dst_rate)
+    dest = out[:n_out] if out is not None and n_out <= len(out) else np.empty(n_out, np.float32)
+    blocks = (
+        b if b.ndim == 1 else b.mean(axis=1, dtype=np.float32)
+        for b in f.blocks(blocksize=BLOCK_FRAMES, dtype="float32")
+    )
+    return resample_blocks(blocks, f.samplerate, dst_rate, dest)
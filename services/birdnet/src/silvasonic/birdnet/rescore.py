@@ -0,0 +1,225 @@
+"""Re-score stored window logits into detections without re-running the model.
+
+Applies the *current* ``confidence_threshold``, ``sensitivity`` and location
+mask to the logit store (see :mod:`silvasonic.birdnet.logit_store`) and
+replaces the BirdNET detections of every recording found in it.  Clip paths
+and pins of detections that survive re-scoring unchanged (same recording,
+window and label) are kept; new hits get no clip, and clip files no
+surviving detection refers to are deleted.  The run details record the
+overlap the windows were stored with, not the current setting.
+
+Usage (inside the BirdNET container)::
+
+    silvasonic-birdnet-rescore                   # every stored day
+    silvasonic-birdnet-rescore --day 2026-05-01  # selected days only
+
+Only days stored by the model the worker loads now (the configured
+``model_variant``, or FP32 if it is refused) are re-scored; days written by
+another variant are skipped with a warning.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from datetime import UTC, date, datetime, time, timedelta
+from pathlib import Path
+
+import numpy as np
+import structlog
+from silvasonic.birdnet.events import encode_event, merge_windows, single_windows
+from silvasonic.birdnet.labels import LabelTable
+from silvasonic.birdnet.logit_store import LogitDay, load_day, rescore, stored_days
+from silvasonic.birdnet.service import (
+    LABELS_PATH,
+    MODEL_SR,
+    WINDOW_SAMPLES,
+    BirdNETService,
+)
+from silvasonic.birdnet.species_mask import mask_for, week_48
+from silvasonic.core.database.detection_writer import (
+    DetectionRow,
+    encode_details,
+    insert_detections,
+)
+from silvasonic.core.database.models.detections import Detection
+from silvasonic.core.database.models.recordings import Recording
+from silvasonic.core.database.session import get_session
+from silvasonic.core.schemas.detections import BirdnetDetectionDetails
+from silvasonic.core.schemas.system_config import BirdnetSettings, SystemSettings
+from sqlalchemy import delete, select
+
+log = structlog.get_logger()
+
+
+async def rescore_day(
+    data: LogitDay,
+    *,
+    labels: LabelTable,
+    birdnet_config: BirdnetSettings,
+    system_config: SystemSettings,
+    allowed_mask: np.ndarray,
+    loc_filter_active: bool,
+    model_version: str,
+    clips_root: Path,
+    week: int | None = None,
+) -> int:
+    """Replace the BirdNET detections of all recordings in ``data``.
+
+    ``allowed_mask`` is the ``(classes,)`` mask of the day's week, which is
+    recorded as ``week`` in the detection details.  Clips of replaced
+    detections that no new detection reuses are deleted from ``clips_root``
+    (the directory clip paths are relative to) once the new rows are
+    committed, so they are not left behind without a row pointing at them.
+
+    Returns:
+        Number of detections written.
+    """
+    data = data.latest()
+    if len(data) == 0:
+        return 0
+
+    rows, classes, scores = rescore(
+        data,
+        sensitivity=birdnet_config.sensitivity,
+        threshold=birdnet_config.confidence_threshold,
+        allowed_mask=allowed_mask,
+    )
+    recording_ids = np.unique(data.index["recording_id"]).tolist()
+    details = encode_details(
+        BirdnetDetectionDetails(
+            model_version=model_version,
+            sensitivity=birdnet_config.sensitivity,
+            overlap=birdnet_config.overlap if data.overlap is None else data.overlap,
+            confidence_threshold=birdnet_config.confidence_threshold,
+            location_filter_active=loc_filter_active,
+            lat=system_config.latitude,
+            lon=system_config.longitude,
+            week=week,
+            merge_events=birdnet_config.merge_events,
+        ).model_dump()
+    )
+
+    async with get_session() as session:
+        result = await session.execute(
+            select(Recording.id, Recording.time).where(Recording.id.in_(recording_ids))
+        )
+        rec_times = {rid: t for rid, t in result.all()}
+
+        existing = await session.execute(
+            select(
+                Detection.recording_id,
+                Detection.time,
+                Detection.label,
+                Detection.clip_path,
+                Detection.pinned,
+            )
+            .where(Detection.worker == "birdnet")
+            .where(Detection.recording_id.in_(recording_ids))
+            .where(Detection.clip_path.is_not(None) | Detection.pinned)
+        )
+        kept = {(rid, t, label): (clip, pinned) for rid, t, label, clip, pinned in existing.all()}
+
+        await session.execute(
+            delete(Detection)
+            .where(Detection.worker == "birdnet")
+            .where(Detection.recording_id.in_(recording_ids))
+        )
+
+        hit_recordings = data.index["recording_id"][rows].astype(np.int64)
+        hit_starts = data.index["start"][rows].astype(np.int64)
+        merge = birdnet_config.merge_events
+        merge_or_wrap = merge_windows if merge else single_windows
+        events = merge_or_wrap(hit_starts, classes, scores, WINDOW_SAMPLES, hit_recordings)
+
+        detections: list[DetectionRow] = []
+        for k in range(len(events)):
+            rid = int(events.groups[k])
+            if rid not in rec_times:
+                continue  # Recording row gone (retention)
+            cls = int(events.classes[k])
+            start = rec_times[rid] + timedelta(seconds=int(events.starts[k]) / MODEL_SR)
+            clip, pinned = kept.get((rid, start, labels.labels[cls]), (None, False))
+            detections.append(
+                DetectionRow(
+                    time=start,
+                    end_time=rec_times[rid] + timedelta(seconds=int(events.ends[k]) / MODEL_SR),
+                    recording_id=rid,
+                    worker="birdnet",
+                    confidence=float(events.confidence[k]),
+                    label=labels.labels[cls],
+                    common_name=labels.common_names[cls],
+                    clip_path=clip,
+                    pinned=pinned,
+                    event=encode_event(events, k, MODEL_SR) if merge else None,
+                    details=details,
+                )
+            )
+
+        await insert_detections(session, detections)
+        await session.commit()
+
+    orphaned = {clip for clip, _ in kept.values() if clip is not None} - {
+        d.clip_path for d in detections
+    }
+    for clip in orphaned:
+        try:
+            (clips_root / clip).unlink(missing_ok=True)
+        except OSError as e:
+            log.warning("birdnet.rescore_clip_unlink_failed", clip_path=clip, error=str(e))
+    if orphaned:
+        log.info("birdnet.rescore_clips_removed", clips=len(orphaned))
+
+    return len(detections)
+
+
+async def _rescore(days: list[date] | None) -> None:
+    svc = BirdNETService()
+    await svc.load_config()
+    assert svc.birdnet_config is not None
+    assert svc.system_config is not None
+    # Same variant (and model_version) the worker loads
+    svc._select_model()
+
+    labels = await svc._localize_labels(LabelTable.from_file(LABELS_PATH))
+    allowed_mask, loc_filter_active = svc._get_allowed_species_mask(labels)
+
+    for day in days or stored_days(svc.logits_dir):
+        # Logit days are UTC days, so all their recordings share one BirdNET week
+        noon = datetime.combine(day, time(12), UTC)
+        try:
+            data = load_day(svc.logits_dir, day, svc.model_version)
+        except ValueError as e:
+            log.warning("birdnet.rescore_day_skipped", day=day.isoformat(), reason=str(e))
+            continue
+        written = await rescore_day(
+            data,
+            labels=labels,
+            birdnet_config=svc.birdnet_config,
+            system_config=svc.system_config,
+            allowed_mask=mask_for(allowed_mask, noon),
+            loc_filter_active=loc_filter_active,
+            model_version=svc.model_version,
+            clips_root=svc.clips_dir.parent,
+            week=week_48(noon) if loc_filter_active else None,
+        )
+        log.info("birdnet.rescore_day_complete", day=day.isoformat(), detections=written)
+
+
+def main() -> None:
+    """Re-score stored logits with the current BirdNET settings."""
+    parser = argparse.ArgumentParser(
+        description="Re-score stored BirdNET window logits into detections."
+    )
+    parser.add_argument(
+        "--day",
+        action="append",
+        type=date.fromisoformat,
+        help="UTC day to re-score (YYYY-MM-DD); repeatable. Default: all stored days.",
+    )
+    args = parser.parse_args()
+    asyncio.run(_rescore(args.day))
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,9 @@ import gc
 import os
 import re
 import time
+from collections.abc import Sized
+from concurrent.futures import BrokenExecutor
+from datetime import UTC
 from pathlib import Path
 from typing import Any
 
@@ -12,14 +15,49 @@ import numpy as np
 import soundfile as sf  # type: ignore[import-untyped]
 import structlog
 from ai_edge_litert.interpreter import Interpreter  # type: ignore[import-untyped]
+from silvasonic.birdnet.audio_arena import AudioArena, collect_if_memory_pressure
 from silvasonic.birdnet.birdnet_stats import BirdnetStats
-from silvasonic.core.database.models.detections import Detection
+from silvasonic.birdnet.clips import (
+    ClipService,
+    ClipWriter,
+    clip_stem,
+    span_ms,
+    top_per_label,
+)
+from silvasonic.birdnet.events import Events, encode_event, merge_windows, single_windows
+from silvasonic.birdnet.framing import FrameRows, frame_audio, refine_rows
+from silvasonic.birdnet.gate import gate_windows
+from silvasonic.birdnet.inference import InferencePool, invoke_batch, logits_to_scores
+from silvasonic.birdnet.labels import LabelTable, load_common_names
+from silvasonic.birdnet.logit_store import LogitStore
+from silvasonic.birdnet.pcm import Pcm16Frames, open_pcm16, to_float32
+from silvasonic.birdnet.resample import resample, resample_soundfile
+from silvasonic.birdnet.species_mask import mask_for, week_48, week_table
+from silvasonic.birdnet.stream import attribute_windows, group_streams
+from silvasonic.birdnet.variants import (
+    REFERENCE_VARIANT,
+    REPORT_FILENAME,
+    load_reports,
+    model_path,
+    refusal,
+)
+from silvasonic.core.database.analysis_queue import (
+    claim_recordings,
+    complete_recordings,
+    release_recordings,
+)
+from silvasonic.core.database.backlog import BacklogGauge
+from silvasonic.core.database.detection_writer import (
+    DetectionRow,
+    encode_details,
+    insert_detections,
+)
 from silvasonic.core.database.models.recordings import Recording
 from silvasonic.core.database.session import get_session
 from silvasonic.core.schemas.detections import BirdnetDetectionDetails
 from silvasonic.core.schemas.system_config import BirdnetSettings, SystemSettings
 from silvasonic.core.service import SilvaService
-from sqlalchemy import func, select
+from silvasonic.core.work_signal import WorkSignal
 
 log = structlog.get_logger()
 
@@ -28,8 +66,14 @@ MODEL_SR = 48000
 WINDOW_SECS = 3.0
 WINDOW_SAMPLES = int(WINDOW_SECS * MODEL_SR)
 
+# Pinned clips cut per idle cycle (lazy clip mode)
+PIN_BATCH_SIZE = 16
+
+# Pipeline outcome (not a queue state): release the lease, counting the attempt
+RETRY_STATE = "retry"
+
 MODEL_DIR = Path(os.environ.get("SILVASONIC_BIRDNET_MODEL_DIR", "/app/models"))
-MODEL_PATH = MODEL_DIR / "BirdNET_GLOBAL_6K_V2.4_Model_FP32.tflite"
+MODEL_PATH = model_path(MODEL_DIR, REFERENCE_VARIANT)
 META_MODEL_PATH = MODEL_DIR / "BirdNET_GLOBAL_6K_V2.4_MData_Model_V2_FP16.tflite"
 LABELS_PATH = MODEL_DIR / "BirdNET_GLOBAL_6K_V2.4_Labels.txt"
 
@@ -43,12 +87,6 @@ def _derive_model_version(filename: str) -> str:
     return "v0.0-unknown"
 
 
-def _flat_sigmoid(x: np.ndarray, sensitivity: float = 1.0) -> np.ndarray:
-    """BirdNET sigmoid calculation (negative sensitivity matches birdnetlib/analyzer)."""
-    res = 1.0 / (1.0 + np.exp(sensitivity * np.clip(x, -15, 15)))
-    return res  # type: ignore[no-any-return]
-
-
 class BirdNETService(SilvaService):
     """BirdNET singleton background worker.
 
@@ -74,27 +112,44 @@ class BirdNETService(SilvaService):
         self.env_settings = env_settings
         self.birdnet_config: BirdnetSettings | None = None
         self.system_config: SystemSettings | None = None
+        self.model_variant = REFERENCE_VARIANT
         self.model_version = _derive_model_version(MODEL_PATH.name)
         self.recordings_dir = Path(env_settings.RECORDINGS_DIR)
 
         self.clips_dir = Path(env_settings.WORKSPACE_DIR) / "clips"
         self.clips_dir.mkdir(parents=True, exist_ok=True)
+        self._clip_writer = ClipWriter(env_settings.CLIP_WRITER_THREADS)
+        self.logits_dir = Path(env_settings.WORKSPACE_DIR) / "logits"
+        self.variant_reports_path = Path(env_settings.WORKSPACE_DIR) / REPORT_FILENAME
 
         # Initialize Two-Phase Logging stats
         self.stats = BirdnetStats()
 
         # Snapshot Refresh: monitor birdnet tuning + system location (ADR-0031)
         self._config_keys = ["birdnet", "system"]
-        self._backlog_pending: int = 0
+        # Indexer wake-up; idle polling is only the fallback
+        self._work_signal = WorkSignal(env_settings.REDIS_URL)
+        # Backlog gauges are read at most once per heartbeat
+        self._backlog = BacklogGauge(env_settings.HEARTBEAT_INTERVAL_S)
+        self._inference_pool: InferencePool | None = None
+        self._workers: int = 1
+        self._arena: AudioArena | None = None
 
     def get_extra_meta(self) -> dict[str, Any]:
         """Inject backlog and operational metrics into the Redis heartbeat (Phase 5)."""
+        backlog = self._backlog.get("birdnet")
         return {
             "analysis": {
-                "backlog_pending": self._backlog_pending,
+                "backlog_pending": backlog.pending,
+                "backlog_claimed": backlog.claimed,
                 "total_analyzed": self.stats.total_analyzed,
                 "total_detections": self.stats.total_hits,
                 "total_errors": self.stats.total_errors,
+                "windows_total": self.stats.total_windows,
+                "windows_skipped": self.stats.total_windows_skipped,
+                "invokes": dict(self.stats.invokes),
+                "model_variant": self.model_variant,
+                "stages": self.stats.stage_latencies(),
                 "avg_inference_ms": round(
                     (self.stats.total_duration_s / max(1, self.stats.total_analyzed)) * 1000, 1
                 ),
@@ -114,187 +169,836 @@ class BirdNETService(SilvaService):
             self.birdnet_config = BirdnetSettings(**configs.get("birdnet", {}))
             self.system_config = SystemSettings(**configs.get("system", {}))
 
-    def _get_allowed_species_mask(self, labels: list[str]) -> tuple[np.ndarray, bool]:
-        """Generate static numpy boolean mask for allowed species in current location."""
+    def _get_allowed_species_mask(self, labels: Sized) -> tuple[np.ndarray, bool]:
+        """Return the species mask for the configured station location.
+
+        With coordinates set this is the ``(48, classes)`` week table (see
+        :mod:`silvasonic.birdnet.species_mask`), loaded from the workspace
+        cache or computed in one meta-model invoke; each recording uses the
+        row of its own week.  Without coordinates every species is allowed.
+
+        Returns:
+            ``(allowed_mask, loc_filter_active)``.
+        """
         assert self.system_config is not None
 
-        loc_filter_active = False
-        allowed_mask = np.ones(len(labels), dtype=bool)
+        latitude = self.system_config.latitude
+        longitude = self.system_config.longitude
+        if latitude is None or longitude is None:
+            return np.ones(len(labels), dtype=bool), False
 
-        if self.system_config.latitude is not None and self.system_config.longitude is not None:
-            # We must run the meta-model to determine allowed species
-            loc_filter_active = True
-            try:
-                from datetime import UTC, datetime
+        try:
+            table = week_table(
+                Path(self.env_settings.WORKSPACE_DIR),
+                META_MODEL_PATH,
+                latitude,
+                longitude,
+                num_classes=len(labels),
+            )
+        except Exception as e:
+            log.warning("birdnet.location_filter_failed", error=str(e))
+            return np.ones(len(labels), dtype=bool), False
 
-                # Calculate week of year (1-52), mapping to 1-48 for BirdNET
-                week_48 = max(1, min(48, int(datetime.now(UTC).isocalendar()[1] * 48 / 52)))
+        log.info(
+            "birdnet.location_filter_active",
+            species_allowed_min=int(table.sum(axis=1).min()),
+            species_allowed_max=int(table.sum(axis=1).max()),
+        )
+        return table, True
 
-                meta_interp = Interpreter(model_path=str(META_MODEL_PATH), num_threads=1)
-                meta_interp.allocate_tensors()
-                meta_in = meta_interp.get_input_details()[0]["index"]
-                meta_out = meta_interp.get_output_details()[0]["index"]
+    def _select_model(self) -> Path:
+        """Return the classifier to load: the configured variant, unless it is refused.
 
-                meta_input = np.array(
-                    [[self.system_config.latitude, self.system_config.longitude, week_48]],
-                    dtype=np.float32,
+        A variant other than FP32 needs a passing validation report for its
+        exact model file (see :mod:`silvasonic.birdnet.variants`); otherwise
+        FP32 is loaded.  Detections of a variant carry its name in
+        ``model_version`` (e.g. ``v2.4-int8``).
+        """
+        assert self.birdnet_config is not None
+        variant: str = self.birdnet_config.model_variant
+        path = model_path(MODEL_DIR, variant)
+        reason = refusal(
+            variant,
+            path,
+            load_reports(self.variant_reports_path),
+            self.birdnet_config.min_variant_agreement,
+        )
+        if reason is not None:
+            log.error(
+                "birdnet.model_variant_refused",
+                variant=variant,
+                reason=reason,
+                fallback=REFERENCE_VARIANT,
+            )
+            variant, path = REFERENCE_VARIANT, MODEL_PATH
+
+        self.model_variant = variant
+        self.model_version = _derive_model_version(path.name)
+        if variant != REFERENCE_VARIANT:
+            self.model_version += f"-{variant.lower()}"
+        log.info("birdnet.model_selected", variant=variant, model_version=self.model_version)
+        return path
+
+    async def _run_inference(
+        self, interpreter: Interpreter | None, batch: np.ndarray
+    ) -> np.ndarray:
+        """Run one window batch on the process pool, or in-process on a thread."""
+        if self._inference_pool is not None:
+            return await self._inference_pool.infer(batch)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, invoke_batch, interpreter, batch)
+
+    async def _decode_audio(self, audio_path: Path, out: np.ndarray | None = None) -> np.ndarray:
+        """Decode a recording to mono float32 on the default executor (decode stage).
+
+        48 kHz mono 16-bit WAVs (every processed segment) take a fast path:
+        the samples are memory-mapped and returned as an ``int16`` array that
+        :meth:`_infer_audio` converts window by window.  Those pages belong to
+        the kernel page cache, not to ``out``; the caller's arena slot then
+        only bounds how many recordings are in flight.
+
+        Otherwise, with ``out`` (an :class:`AudioArena` buffer), mono recordings that fit
+        are decoded in place and a view into ``out`` is returned; anything
+        else falls back to a fresh allocation.  Recordings at any other rate
+        (raw-only devices) are resampled to 48 kHz block by block.
+        """
+        loop = asyncio.get_running_loop()
+
+        # Load audio blocking call bound to executor
+        def _load() -> np.ndarray:
+            pcm = open_pcm16(audio_path, MODEL_SR)
+            if pcm is not None:
+                return pcm
+            if out is None:
+                audio, sr = sf.read(str(audio_path), dtype="float32")
+                if audio.ndim > 1:
+                    audio = audio.mean(axis=1, dtype=np.float32)
+                if sr != MODEL_SR:
+                    audio = resample(audio, sr, MODEL_SR)
+                return audio  # type: ignore[no-any-return]
+
+            with sf.SoundFile(str(audio_path)) as f:
+                if f.samplerate != MODEL_SR:
+                    log.debug("birdnet.resampling", file=str(audio_path), actual_sr=f.samplerate)
+                    return resample_soundfile(f, MODEL_SR, out)
+                if f.channels == 1 and f.frames <= len(out):
+                    return f.read(dtype="float32", out=out[: f.frames])  # type: ignore[no-any-return]
+                audio = f.read(dtype="float32")
+            if audio.ndim > 1:
+                audio = audio.mean(axis=1, dtype=np.float32)
+            return audio  # type: ignore[no-any-return]
+
+        with self.stats.timed("decode"):
+            return await loop.run_in_executor(None, _load)
+
+    def _frame_audio(
+        self, audio: np.ndarray, step: int
+    ) -> tuple[np.ndarray | Pcm16Frames, np.ndarray]:
+        """Return all analysis windows of ``audio`` at hop ``step`` and their start offsets."""
+        min_samples = int(1.5 * MODEL_SR)
+        if audio.dtype == np.int16:
+            # Memory-mapped PCM: rows are converted per gate chunk / batch
+            frames = Pcm16Frames(audio, WINDOW_SAMPLES, step, min_samples)
+            return frames, frames.starts
+        # All windows as one strided view — no per-window slicing or padding copies
+        return frame_audio(audio, WINDOW_SAMPLES, step, min_samples)
+
+    async def _score_windows(
+        self,
+        frames: np.ndarray | Pcm16Frames,
+        rows: np.ndarray | None,
+        interpreter: Interpreter | None,
+        stage: str,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Gate and score the windows ``rows`` of ``frames`` (all windows if ``None``).
+
+        Returns:
+            ``(logits, scored)`` — raw model outputs and the row index in
+            ``frames`` of each scored window.
+        """
+        assert self.birdnet_config is not None
+
+        candidates: np.ndarray | Pcm16Frames | FrameRows = frames
+        if rows is None:
+            rows = np.arange(len(frames))
+        else:
+            candidates = FrameRows(frames, rows)
+
+        # Energy pre-gate: silent windows never reach the model
+        loop = asyncio.get_running_loop()
+        keep = await loop.run_in_executor(
+            None, gate_windows, candidates, MODEL_SR, self.birdnet_config.gate_threshold_db
+        )
+        kept = np.flatnonzero(keep)
+        self.stats.record_gate(len(candidates), len(candidates) - len(kept))
+        all_kept = len(kept) == len(candidates)
+
+        # Batched inference: one executor hop + one invoke per batch instead of per window
+        batch_size = max(1, self.birdnet_config.batch_size)
+        raw_batches: list[np.ndarray] = []
+        for batch_start in range(0, len(kept), batch_size):
+            if self._shutdown_event.is_set():
+                break
+            if all_kept:
+                batch = candidates[batch_start : batch_start + batch_size]
+            else:
+                # Gather only the kept windows of this batch (one batch-sized copy)
+                batch = candidates[kept[batch_start : batch_start + batch_size]]
+            raw_batches.append(await self._run_inference(interpreter, batch))
+        self.stats.record_invokes(stage, len(raw_batches))
+
+        if not raw_batches:
+            return np.empty((0, 0), dtype=np.float32), rows[:0]
+
+        logits = np.concatenate(raw_batches)
+        return logits, rows[kept[: len(logits)]]
+
+    async def _infer_audio(
+        self, audio: np.ndarray, interpreter: Interpreter | None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Run batched inference over all loud windows of ``audio`` (inference stage).
+
+        With ``adaptive_overlap`` set, the ``overlap`` grid is only a coarse
+        pass: windows on the dense ``adaptive_overlap`` grid are scored as
+        well, but only around coarse windows whose best class score reaches
+        ``interest_threshold``.
+
+        Returns:
+            ``(logits, starts)`` — raw model outputs of shape ``(windows, classes)``
+            and the sample offset of each scored window, ascending.  Windows
+            skipped by the energy pre-gate are absent; both arrays are empty if
+            the recording is too short, fully gated, or shutdown interrupted
+            before the first batch.
+        """
+        assert self.birdnet_config is not None
+        config = self.birdnet_config
+
+        with self.stats.timed("inference"):
+            step = int((WINDOW_SECS - config.overlap) * MODEL_SR)
+            frames, starts = self._frame_audio(audio, step)
+            logits, scored = await self._score_windows(frames, None, interpreter, "coarse")
+            if config.adaptive_overlap is None or len(logits) == 0 or self._shutdown_event.is_set():
+                return logits, starts[scored]
+
+            # Coarse-to-fine: the sigmoid is monotonic, so the best logit decides interest
+            best = logits_to_scores(logits.max(axis=1), config.sensitivity)
+            hot = starts[scored][best >= config.interest_threshold]
+            fine_step = int((WINDOW_SECS - config.adaptive_overlap) * MODEL_SR)
+            fine_frames, fine_starts = self._frame_audio(audio, fine_step)
+            rows = refine_rows(fine_starts, hot, starts, WINDOW_SAMPLES)
+            if len(rows) == 0:
+                return logits, starts[scored]
+
+            fine_logits, fine_scored = await self._score_windows(
+                fine_frames, rows, interpreter, "fine"
+            )
+            if len(fine_logits) == 0:
+                return logits, starts[scored]
+            all_starts = np.concatenate([starts[scored], fine_starts[fine_scored]])
+            order = np.argsort(all_starts, kind="stable")
+            return np.concatenate([logits, fine_logits])[order], all_starts[order]
+
+    async def _store_logits(
+        self, recording: Recording, starts: np.ndarray, logits: np.ndarray
+    ) -> None:
+        """Append window logits to the per-day logit store, if enabled (soft-fail)."""
+        assert self.birdnet_config is not None
+        mode = self.birdnet_config.logit_store
+        if mode == "off" or len(logits) == 0:
+            return
+
+        store = LogitStore(
+            self.logits_dir,
+            mode,
+            self.birdnet_config.logit_top_k,
+            num_classes=logits.shape[1],
+            model_version=self.model_version,
+            overlap=self.birdnet_config.overlap,
+        )
+        day = recording.time.astimezone(UTC).date()
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(None, store.append, recording.id, day, starts, logits)
+        except Exception as e:
+            log.warning("birdnet.logit_store_failed", recording_id=recording.id, error=str(e))
+
+    async def _extract_detections(
+        self,
+        recording: Recording,
+        audio: np.ndarray,
+        logits: np.ndarray,
+        starts: np.ndarray,
+        labels: LabelTable,
+        allowed_mask: np.ndarray,
+        loc_filter_active: bool,
+        offset: int = 0,
+        owned: tuple[int, int] | None = None,
+    ) -> list[DetectionRow]:
+        """Threshold window logits into detections and write their clips (writer stage).
+
+        ``allowed_mask`` is a static ``(classes,)`` mask or the ``(48, classes)``
+        week table; the row of the recording's week applies.  ``starts`` index
+        into ``audio``.  In stream analysis ``audio`` holds
+        several consecutive segments and ``offset`` is the sample position of
+        ``recording`` within it; clips may then extend into its neighbours.
+
+        With ``merge_events``, hits of one label in overlapping or touching
+        windows become one detection (see :mod:`silvasonic.birdnet.events`).
+        ``owned`` is then the ``[start, stop)`` sample range of ``recording``
+        in the stream: windows outside it only extend events across segment
+        boundaries, and only events starting inside it are kept.
+        """
+        assert self.birdnet_config is not None
+        assert self.system_config is not None
+
+        start = time.perf_counter()
+        detections: list[DetectionRow] = []
+
+        def _done(clip_s: float = 0.0) -> list[DetectionRow]:
+            # Post-processing time excludes the clip writes, which have their own stage
+            self.stats.record_stage("postprocess", time.perf_counter() - start - clip_s)
+            return detections
+
+        if len(logits) == 0:
+            return _done()
+
+        scores = logits_to_scores(logits, self.birdnet_config.sensitivity)
+
+        # Mask and threshold filter over the whole (windows, classes) score matrix
+        # Season of the recording itself, not of "now" (matters for backlogs)
+        mask = (scores >= self.birdnet_config.confidence_threshold) & mask_for(
+            allowed_mask, recording.time
+        )
+        hit_windows, hit_classes = np.nonzero(mask)
+        if len(hit_windows) == 0:
+            return _done()
+
+        hit_starts = starts[hit_windows]
+        hit_scores = scores[hit_windows, hit_classes]
+        merge = self.birdnet_config.merge_events
+        if merge:
+            events = merge_windows(hit_starts, hit_classes, hit_scores, WINDOW_SAMPLES)
+            if owned is not None:
+                # Bounds of the segment, not of its windows: it may have none left after gating
+                keep = (events.starts >= owned[0]) & (events.starts < owned[1])
+            else:
+                keep = np.ones(len(events), dtype=bool)
+        else:
+            events = single_windows(hit_starts, hit_classes, hit_scores, WINDOW_SAMPLES)
+            keep = np.ones(len(events), dtype=bool)
+
+        from datetime import timedelta
+
+        # Run parameters are the same for every hit — serialize them once
+        details = encode_details(
+            BirdnetDetectionDetails(
+                model_version=self.model_version,
+                sensitivity=self.birdnet_config.sensitivity,
+                overlap=self.birdnet_config.overlap,
+                confidence_threshold=self.birdnet_config.confidence_threshold,
+                location_filter_active=loc_filter_active,
+                lat=self.system_config.latitude,
+                lon=self.system_config.longitude,
+                week=week_48(recording.time) if loc_filter_active else None,
+                merge_events=merge,
+            ).model_dump()
+        )
+
+        kept = np.flatnonzero(keep)
+        if self.birdnet_config.clip_mode == "lazy":
+            # Only the best hits of each label get a clip now; the rest on request
+            clipped = top_per_label(
+                events.classes[kept], events.confidence[kept], self.birdnet_config.clip_top_n
+            )
+        else:
+            clipped = np.ones(len(kept), dtype=bool)
+
+        clip_start = time.perf_counter()
+        clip_paths = await self._write_clips(recording, audio, events, kept[clipped], offset)
+        clip_s = time.perf_counter() - clip_start
+        if clipped.any():
+            self.stats.record_stage("clip_write", clip_s)
+
+        # Label metadata is precomputed per class: the hit loop only indexes
+        for k in kept.tolist():
+            i = int(events.classes[k])
+            w_start_td = timedelta(seconds=(int(events.starts[k]) - offset) / MODEL_SR)
+            w_end_td = timedelta(seconds=(int(events.ends[k]) - offset) / MODEL_SR)
+
+            score = float(events.confidence[k])
+
+            detections.append(
+                DetectionRow(
+                    time=recording.time + w_start_td,
+                    end_time=recording.time + w_end_td,
+                    recording_id=recording.id,
+                    worker="birdnet",
+                    confidence=score,
+                    label=labels.labels[i],
+                    common_name=labels.common_names[i],
+                    clip_path=clip_paths.get(k),
+                    pinned=False,
+                    event=encode_event(events, k, MODEL_SR) if merge else None,
+                    details=details,
                 )
-                meta_interp.set_tensor(meta_in, meta_input)
-                meta_interp.invoke()
-
-                # Threshold >= 0.03 according to spike finding
-                loc_filter = meta_interp.get_tensor(meta_out)[0]
-                allowed_mask = loc_filter >= 0.03
-                log.info(
-                    "birdnet.location_filter_active",
-                    species_allowed=int(np.sum(allowed_mask)),
+            )
+
+        return _done(clip_s)
+
+    async def _write_clips(
+        self,
+        recording: Recording,
+        audio: np.ndarray,
+        events: Events,
+        clipped: np.ndarray,
+        offset: int,
+    ) -> dict[int, str]:
+        """Write one clip per distinct span among the ``clipped`` events.
+
+        Events of the same span (e.g. several species in one window) share
+        the clip, so each span is sliced, encoded and written once.  All
+        writes of the recording run concurrently on the :class:`ClipWriter`
+        pool.
+
+        Returns:
+            Clip path (``clips/<file>``) per event index; events whose clip
+            could not be written are missing.
+        """
+        assert self.birdnet_config is not None
+        if len(clipped) == 0:
+            return {}
+
+        spans = np.stack([events.starts[clipped], events.ends[clipped]], axis=1)
+        unique, owner = np.unique(spans, axis=0, return_inverse=True)
+
+        # Audio slicing logic: ± clip_padding_seconds
+        pad_samples = int(self.birdnet_config.clip_padding_seconds * MODEL_SR)
+        clip_format = self.birdnet_config.clip_format
+        filenames: list[str] = []
+        writes = []
+        for start_idx, end_idx in unique.tolist():
+            span = span_ms((start_idx - offset) / MODEL_SR, (end_idx - offset) / MODEL_SR)
+            filename = f"{clip_stem(recording.id, *span)}.{clip_format}"
+            filenames.append(filename)
+            slice_start = max(0, start_idx - pad_samples)
+            slice_end = min(len(audio), end_idx + pad_samples)
+            writes.append(
+                self._clip_writer.write(
+                    self.clips_dir / filename, audio[slice_start:slice_end], MODEL_SR
                 )
-            except Exception as e:
-                log.warning("birdnet.location_filter_failed", error=str(e))
-                loc_filter_active = False
+            )
+        written = await asyncio.gather(*writes)
 
-        return allowed_mask, loc_filter_active
+        return {
+            k: f"clips/{filenames[u]}"
+            for k, u in zip(clipped.tolist(), owner.reshape(-1).tolist(), strict=True)
+            if written[u]
+        }
 
     async def _process_recording(
         self,
         recording: Recording,
         audio_path: Path,
-        interpreter: Interpreter,
-        labels: list[str],
+        interpreter: Interpreter | None,
+        labels: LabelTable,
         allowed_mask: np.ndarray,
         loc_filter_active: bool,
-    ) -> list[Detection]:
-        """Perform native inference on a single recording."""
+    ) -> list[DetectionRow]:
+        """Perform native inference on a single recording, stage after stage.
+
+        The worker loop overlaps these stages across recordings instead
+        (see :meth:`_run_pipeline`).  ``interpreter`` is ``None`` when the
+        multi-process inference pool is active.
+        """
+        audio = await self._decode_audio(audio_path)
+        logits, starts = await self._infer_audio(audio, interpreter)
+        await self._store_logits(recording, starts, logits)
+        return await self._extract_detections(
+            recording, audio, logits, starts, labels, allowed_mask, loc_filter_active
+        )
+
+    async def _run_pipeline(
+        self,
+        recordings: list[Recording],
+        interpreter: Interpreter | None,
+        labels: LabelTable,
+        allowed_mask: np.ndarray,
+        loc_filter_active: bool,
+    ) -> dict[int, tuple[tuple[str, list[DetectionRow]] | None, float]]:
+        """Analyze leased recordings in a staged decode → infer → write pipeline.
+
+        Stages are connected by bounded queues (``prefetch`` deep): the decoder
+        reads the next recordings while the interpreter works on the current
+        one, and the writer thresholds scores and writes clips in the
+        background.  One inference task runs per inference worker.  No stage
+        touches the database.
+
+        With ``stream_analysis``, consecutive segments of one Recorder run are
+        decoded back to back into one buffer and travel through the pipeline
+        as a single stream, so windows span segment boundaries; each window is
+        attributed to the recording it starts in.
+
+        Decoded audio lives in :class:`AudioArena` buffers that are handed
+        back once the writer is done with a recording.
+
+        Returns:
+            Per recording ID: ``((state, detections) | None, elapsed_s)``.  The
+            outcome is ``None`` if shutdown interrupted the analysis and the
+            lease should be released instead.
+        """
         assert self.birdnet_config is not None
-        assert self.system_config is not None
 
+        # Queue items: (recordings, sample offset of each in audio, buffer, audio, ...)
+        depth = max(1, self.birdnet_config.prefetch)
+        merge_events = self.birdnet_config.merge_events
+        decoded: asyncio.Queue[tuple[list[Recording], list[int], np.ndarray, np.ndarray] | None] = (
+            asyncio.Queue(depth)
+        )
+        scored: asyncio.Queue[
+            tuple[list[Recording], list[int], np.ndarray, np.ndarray, np.ndarray, np.ndarray] | None
+        ] = asyncio.Queue(depth)
+        started: dict[int, float] = {}
+        results: dict[int, tuple[tuple[str, list[DetectionRow]] | None, float]] = {}
         loop = asyncio.get_running_loop()
 
-        # Load audio blocking call bound to executor
-        def _load() -> np.ndarray:
-            audio, sr = sf.read(str(audio_path), dtype="float32")
-            if sr != MODEL_SR:
-                log.warning(
-                    "birdnet.resampling_skipped",
-                    file=str(audio_path),
-                    actual_sr=sr,
-                    expected_sr=MODEL_SR,
+        if self._arena is None:
+            # Decoding + both queues + one per inference worker + writing
+            self._arena = AudioArena(
+                slots=2 * depth + self._workers + 2,
+                capacity=int(self.env_settings.AUDIO_BUFFER_S * MODEL_SR),
+            )
+        arena = self._arena
+
+        def _finish(
+            recording: Recording, outcome: tuple[str, list[DetectionRow]] | None, share: int = 1
+        ) -> None:
+            # Recordings of one stream split its analysis time evenly
+            elapsed = (time.perf_counter() - started[recording.id]) / share
+            results[recording.id] = (outcome, elapsed)
+
+        def _crashed(recording: Recording, exc: Exception) -> None:
+            self.stats.record_error(recording.id, exc)
+            # Store crash log in state
+            _finish(recording, (f"crashed: {str(exc)[:50]}", []))
+
+        async def _decode_stream(stream: list[Recording]) -> None:
+            """Decode consecutive segments back to back into one arena buffer."""
+            buffer = await arena.acquire()
+            members: list[Recording] = []
+            offsets: list[int] = []
+            filled = 0
+
+            async def _flush() -> None:
+                nonlocal buffer, members, offsets, filled
+                if members:
+                    await decoded.put((members, offsets, buffer, buffer[:filled]))
+                    buffer = await arena.acquire()
+                members, offsets, filled = [], [], 0
+
+            for recording in stream:
+                try:
+                    audio = await self._decode_audio(
+                        self.recordings_dir / (recording.file_processed or recording.file_raw),
+                        out=buffer[filled:],
+                    )
+                    if not np.may_share_memory(audio, buffer):
+                        # Memory-mapped PCM or a fresh decode: copy behind the previous segment
+                        if len(audio) > len(buffer) - filled:
+                            await _flush()
+                        if len(audio) > len(buffer):
+                            # Longer than a whole buffer: analyzed on its own
+                            await decoded.put(([recording], [0], buffer, audio))
+                            buffer = await arena.acquire()
+                            continue
+                        audio = await loop.run_in_executor(
+                            None, to_float32, audio, buffer[filled : filled + len(audio)]
+                        )
+                except Exception as e:
+                    _crashed(recording, e)
+                    # A failed segment is a gap: the stream continues after it
+                    await _flush()
+                    continue
+                members.append(recording)
+                offsets.append(filled)
+                filled += len(audio)
+
+            if members:
+                await decoded.put((members, offsets, buffer, buffer[:filled]))
+            else:
+                arena.release(buffer)
+
+        async def _decode_stage() -> None:
+            present: list[Recording] = []
+            for recording in recordings:
+                started[recording.id] = time.perf_counter()
+                if self._shutdown_event.is_set():
+                    _finish(recording, None)
+                    continue
+
+                # Check file existence — DB stores relative paths, prefix with recordings_dir
+                rel_path = recording.file_processed or recording.file_raw
+                audio_path = self.recordings_dir / rel_path
+                if not audio_path.exists():
+                    log.error("birdnet.file_missing", path=str(audio_path))
+                    # Mark as failed in DB to prevent infinite loop
+                    _finish(recording, ("failed_file_missing", []))
+                    continue
+                present.append(recording)
+
+            assert self.birdnet_config is not None
+            if self.birdnet_config.stream_analysis:
+                streams = group_streams(present, arena.capacity, MODEL_SR)
+            else:
+                streams = [[recording] for recording in present]
+
+            for stream in streams:
+                for recording in stream:
+                    started[recording.id] = time.perf_counter()
+                if self._shutdown_event.is_set():
+                    for recording in stream:
+                        _finish(recording, None)
+                    continue
+                if len(stream) > 1:
+                    await _decode_stream(stream)
+                    continue
+
+                recording = stream[0]
+                buffer = await arena.acquire()
+                try:
+                    # A memory-mapped segment leaves the buffer unused; holding the
+                    # slot still caps the recordings in flight
+                    audio = await self._decode_audio(
+                        self.recordings_dir / (recording.file_processed or recording.file_raw),
+                        out=buffer,
+                    )
+                except Exception as e:
+                    arena.release(buffer)
+                    _crashed(recording, e)
+                    continue
+                await decoded.put(([recording], [0], buffer, audio))
+
+            for _ in range(self._workers):
+                await decoded.put(None)
+
+        async def _infer_stage() -> None:
+            while (item := await decoded.get()) is not None:
+                members, offsets, buffer, audio = item
+                try:
+                    logits, starts = await self._infer_audio(audio, interpreter)
+                except BrokenExecutor as e:
+                    # A dead inference process, not a bad recording: retry after the pool restart
+                    arena.release(buffer)
+                    log.error("birdnet.inference_pool_broken", error=str(e))
+                    for recording in members:
+                        _finish(recording, (RETRY_STATE, []))
+                    continue
+                except Exception as e:
+                    arena.release(buffer)
+                    for recording in members:
+                        _crashed(recording, e)
+                    continue
+                await scored.put((members, offsets, buffer, audio, logits, starts))
+
+        async def _write_stage() -> None:
+            while (item := await scored.get()) is not None:
+                members, offsets, buffer, audio, logits, starts = item
+                del item
+                found: dict[int, list[DetectionRow]] = {}
+                try:
+                    owner = attribute_windows(starts, offsets)
+                    # Merged events may run on into the next segment of the stream
+                    span = merge_events and len(members) > 1
+                    for i, recording in enumerate(members):
+                        own = owner == i
+                        await self._store_logits(recording, starts[own] - offsets[i], logits[own])
+                        if span:
+                            stop = offsets[i + 1] if i + 1 < len(offsets) else len(audio)
+                            found[recording.id] = await self._extract_detections(
+                                recording,
+                                audio,
+                                logits,
+                                starts,
+                                labels,
+                                allowed_mask,
+                                loc_filter_active,
+                                offsets[i],
+                                (offsets[i], stop),
+                            )
+                            continue
+                        found[recording.id] = await self._extract_detections(
+                            recording,
+                            audio,
+                            logits[own],
+                            starts[own],
+                            labels,
+                            allowed_mask,
+                            loc_filter_active,
+                            offsets[i],
+                        )
+                except Exception as e:
+                    for recording in members:
+                        _crashed(recording, e)
+                    continue
+                finally:
+                    del audio
+                    arena.release(buffer)
+
+                for recording in members:
+                    if self._shutdown_event.is_set():
+                        # Possibly partial — let the next run re-analyze it from scratch
+                        _finish(recording, None, share=len(members))
+                    else:
+                        _finish(recording, ("done", found[recording.id]), share=len(members))
+
+        async def _infer_then_close() -> None:
+            await asyncio.gather(*(_infer_stage() for _ in range(self._workers)))
+            await scored.put(None)
+
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(_decode_stage())
+            tg.create_task(_infer_then_close())
+            tg.create_task(_write_stage())
+
+        return results
+
+    async def _analyze_batch(
+        self,
+        interpreter: Interpreter | None,
+        labels: LabelTable,
+        allowed_mask: np.ndarray,
+        loc_filter_active: bool,
+    ) -> bool:
+        """Lease a batch of recordings, analyze them, and commit results in bulk.
+
+        The claim transaction is committed immediately (Worker Pull, ADR-0018),
+        so no connection or row lock is held during decode and inference.
+        If the bulk commit fails, the leases simply expire and the batch is
+        reclaimed.  Results of recordings whose lease expired and was claimed
+        by another worker meanwhile are dropped.
+
+        Returns:
+            ``True`` if recordings were claimed, ``False`` if the queue was empty.
+        """
+        assert self.birdnet_config is not None
+
+        with self.stats.timed("claim"):
+            async with get_session() as session:
+                claim = await claim_recordings(
+                    session,
+                    "birdnet",
+                    limit=max(1, self.birdnet_config.claim_batch_size),
+                    lease_s=self.env_settings.LEASE_DURATION_S,
+                    newest_first=self.birdnet_config.processing_order == "newest_first",
+                    max_attempts=self.env_settings.MAX_ATTEMPTS,
                 )
-            if audio.ndim > 1:
-                audio = audio.mean(axis=1)
-            return audio  # type: ignore[no-any-return]
+                await session.commit()
 
-        audio = await loop.run_in_executor(None, _load)
+        recordings = claim.recordings
 
-        # Slice segments
-        overlap = self.birdnet_config.overlap
-        step = int((WINDOW_SECS - overlap) * MODEL_SR)
-        min_samples = int(1.5 * MODEL_SR)
+        if not recordings:
+            return False
 
-        detections: list[Detection] = []
-        input_idx = interpreter.get_input_details()[0]["index"]
-        output_idx = interpreter.get_output_details()[0]["index"]
+        self.health.update_status("birdnet", True, f"analyzing {len(recordings)} recordings")
+        results = await self._run_pipeline(
+            recordings, interpreter, labels, allowed_mask, loc_filter_active
+        )
 
-        # Fast inversion for sigmoid according to spike v3
-        adj_sens = max(0.5, min(1.0 - (self.birdnet_config.sensitivity - 1.0), 1.5))
+        states: dict[int, str] = {}
+        released: list[int] = []
+        retried: list[int] = []
+        detections: list[DetectionRow] = []
+        for recording in recordings:
+            outcome, _elapsed = results[recording.id]
+            if outcome is None:
+                released.append(recording.id)
+                continue
+            if outcome[0] == RETRY_STATE:
+                retried.append(recording.id)
+                continue
+            states[recording.id] = outcome[0]
+            detections.extend(outcome[1])
+
+        with self.stats.timed("commit"):
+            async with get_session() as session:
+                # Only recordings whose lease this worker still holds keep their results
+                kept = await complete_recordings(session, "birdnet", states, claim.claimed_at)
+                await insert_detections(session, [d for d in detections if d.recording_id in kept])
+                await release_recordings(session, "birdnet", released, claim.claimed_at)
+                if retried:
+                    await release_recordings(
+                        session,
+                        "birdnet",
+                        retried,
+                        claim.claimed_at,
+                        attempted=True,
+                        max_attempts=self.env_settings.MAX_ATTEMPTS,
+                    )
+                await session.commit()
 
-        for start_idx in range(0, len(audio), step):
-            if self._shutdown_event.is_set():
-                break
+        lost = sorted(set(states) - kept)
+        if lost:
+            log.warning("birdnet.lease_lost", recording_ids=lost)
 
-            chunk = audio[start_idx : start_idx + WINDOW_SAMPLES]
-            if len(chunk) < min_samples:
-                break
-            if len(chunk) < WINDOW_SAMPLES:
-                padded = np.zeros(WINDOW_SAMPLES, dtype=np.float32)
-                padded[: len(chunk)] = chunk
-                chunk = padded
-
-            # Inference
-            def _infer(c: np.ndarray = chunk) -> np.ndarray:
-                interpreter.set_tensor(input_idx, c.reshape(1, WINDOW_SAMPLES))
-                interpreter.invoke()
-                return interpreter.get_tensor(output_idx)[0]  # type: ignore[no-any-return]
-
-            raw = await loop.run_in_executor(None, _infer)
-            scores = _flat_sigmoid(raw, sensitivity=-adj_sens)
-
-            # Mask and threshold filter
-            mask = (scores >= self.birdnet_config.confidence_threshold) & allowed_mask
-            hits = np.where(mask)[0]
-
-            from datetime import timedelta
-
-            w_start_td = timedelta(seconds=start_idx / MODEL_SR)
-            w_end_td = w_start_td + timedelta(seconds=WINDOW_SECS)
-
-            for i in hits:
-                score = float(scores[i])
-                parts = labels[i].split("_")
-
-                label_basename = f"{parts[0]}_{parts[1]}" if len(parts) > 1 else parts[0]
-                common_name = parts[1] if len(parts) > 1 else ""
-
-                details = BirdnetDetectionDetails(
-                    model_version=self.model_version,
-                    sensitivity=self.birdnet_config.sensitivity,
-                    overlap=self.birdnet_config.overlap,
-                    confidence_threshold=self.birdnet_config.confidence_threshold,
-                    location_filter_active=loc_filter_active,
-                    lat=self.system_config.latitude,
-                    lon=self.system_config.longitude,
-                    week=None,  # Week logic simplified out of payload for brevity
-                )
+        for recording in recordings:
+            outcome, elapsed = results[recording.id]
+            if outcome is not None and outcome[0] == "done" and recording.id in kept:
+                self.stats.record_analyzed(recording.id, elapsed, len(outcome[1]))
 
-                # Extraction: Create a WAV file clip
-                start_ms = int(w_start_td.total_seconds() * 1000)
-                end_ms = int(w_end_td.total_seconds() * 1000)
-
-                safe_label = re.sub(r"[^a-zA-Z0-9]", "", label_basename)
-                clip_filename = f"{recording.id}_{start_ms}_{end_ms}_{safe_label}.wav"
-
-                clip_path = self.clips_dir / clip_filename
-
-                # Audio slicing logic: ± clip_padding_seconds
-                pad_samples = int(self.birdnet_config.clip_padding_seconds * MODEL_SR)
-                slice_start = max(0, start_idx - pad_samples)
-                slice_end = min(len(audio), start_idx + WINDOW_SAMPLES + pad_samples)
-
-                # Write audio inside executor, with IO try/except
-                def _write_clip(
-                    s_start: int = slice_start,
-                    s_end: int = slice_end,
-                    dest: Path = clip_path,
-                    aud: np.ndarray = audio,
-                ) -> bool:
-                    try:
-                        sf.write(str(dest), aud[s_start:s_end], MODEL_SR)
-                        return True
-                    except Exception as e:
-                        log.warning("birdnet.clip_extraction_failed", error=str(e), path=str(dest))
-                        return False
-
-                written = await loop.run_in_executor(None, _write_clip)
-                det_clip_path = f"clips/{clip_filename}" if written else None
-
-                det = Detection(
-                    recording_id=recording.id,
-                    worker="birdnet",
-                    time=recording.time + w_start_td,
-                    end_time=recording.time + w_end_td,
-                    label=label_basename,
-                    common_name=common_name,
-                    confidence=score,
-                    details=details.model_dump(),
-                    clip_path=det_clip_path,
-                )
-                detections.append(det)
+        # Decode buffers are reused, so a full collection is only a safety valve
+        collect_if_memory_pressure(self.env_settings.GC_MEMORY_PERCENT)
+
+        return True
+
+    async def _localize_labels(self, model_labels: LabelTable) -> LabelTable:
+        """Apply ``common_name_locale`` names from the ``taxonomy`` table (best-effort).
+
+        Labels without a name in that locale keep the model's English common
+        name; if the database is unavailable, all of them do.
+        """
+        assert self.birdnet_config is not None
+        locale = self.birdnet_config.common_name_locale
+        if locale is None:
+            return model_labels
+        try:
+            async with get_session() as session:
+                names = await load_common_names(session, locale)
+        except Exception as e:
+            log.warning("birdnet.common_names_failed", locale=locale, error=str(e))
+            return model_labels
+        log.info("birdnet.common_names_loaded", locale=locale, labels=len(names))
+        return model_labels.with_common_names(names)
 
-        # Explicit memory cleanup
-        del audio
-        gc.collect()
+    async def _materialize_pins(self) -> int:
+        """Cut the clips of pinned detections that have none yet.
 
-        return detections
+        Runs while the queue is empty, so pins are materialized before the
+        Janitor may delete their source recordings.  Runs in every clip mode:
+        in eager mode a pin still lacks its clip when the clip write failed.
+
+        Returns:
+            Number of clips written.
+        """
+        assert self.birdnet_config is not None
+        clips = ClipService(
+            self.clips_dir,
+            self.recordings_dir,
+            self.birdnet_config.clip_padding_seconds,
+            self.birdnet_config.clip_format,
+        )
+        async with get_session() as session:
+            written = await clips.materialize_pinned(session, PIN_BATCH_SIZE)
+            await session.commit()
+        return written
+
+    def _idle_timeout(self) -> float:
+        """Return how long an idle worker waits before re-polling the queue.
+
+        While subscribed to the work signal the poll is only a safety net for
+        lost messages; without Redis the short polling interval applies.
+        """
+        if self._work_signal.connected:
+            return self.env_settings.IDLE_FALLBACK_S
+        return self.env_settings.POLLING_INTERVAL_S
 
     async def run(self) -> None:
         """Main inference loop."""
@@ -303,16 +1007,28 @@ class BirdNETService(SilvaService):
 
         self.health.update_status("birdnet", True, "initializing native engine")
 
-        try:
-            with open(LABELS_PATH) as f:
-                labels = [line.strip() for line in f.readlines()]
+        # Worker count is fixed for the process lifetime (restart to change)
+        workers = max(1, self.birdnet_config.workers)
+        self._workers = workers
+        interpreter: Interpreter | None = None
 
-            interpreter = Interpreter(
-                model_path=str(MODEL_PATH), num_threads=self.birdnet_config.threads
-            )
-            interpreter.allocate_tensors()
+        try:
+            model_labels = LabelTable.from_file(LABELS_PATH)
+            # Variant is fixed for the process lifetime (restart to change)
+            classifier = self._select_model()
+
+            if workers > 1:
+                # One interpreter per worker process; none resident in this process
+                self._inference_pool = InferencePool(
+                    str(classifier), workers, threads=self.birdnet_config.threads
+                )
+            else:
+                interpreter = Interpreter(
+                    model_path=str(classifier), num_threads=self.birdnet_config.threads
+                )
+                interpreter.allocate_tensors()
 
-            allowed_mask, loc_filter_active = self._get_allowed_species_mask(labels)
+            allowed_mask, loc_filter_active = self._get_allowed_species_mask(model_labels)
 
         except Exception as e:
             log.error("birdnet.init_failed", error=str(e))
@@ -321,119 +1037,72 @@ class BirdNETService(SilvaService):
             # Crash fast
             return
 
+        labels = await self._localize_labels(model_labels)
+
+        # Long-lived init objects (interpreter, labels, mask) never become garbage
+        gc.freeze()
+
         self.health.update_status("birdnet", True, "idle")
 
-        while not self._shutdown_event.is_set():
-            self.health.touch()
-            self.stats.maybe_emit_summary()
-
-            # --- Snapshot Refresh: reload tuning parameters (ADR-0031) ---
-            prev_lat = self.system_config.latitude if self.system_config else None
-            prev_lon = self.system_config.longitude if self.system_config else None
-            await self._refresh_config()
-            # Recompute species mask only if location actually changed
-            if self.system_config and (
-                self.system_config.latitude != prev_lat or self.system_config.longitude != prev_lon
-            ):
-                allowed_mask, loc_filter_active = self._get_allowed_species_mask(labels)
-                log.info(
-                    "birdnet.species_mask_recomputed",
-                    lat=self.system_config.latitude,
-                    lon=self.system_config.longitude,
+        try:
+            while not self._shutdown_event.is_set():
+                self.health.touch()
+                self.stats.maybe_emit_summary()
+
+                # --- Snapshot Refresh: reload tuning parameters (ADR-0031) ---
+                prev_lat = self.system_config.latitude if self.system_config else None
+                prev_lon = self.system_config.longitude if self.system_config else None
+                prev_locale = (
+                    self.birdnet_config.common_name_locale if self.birdnet_config else None
                 )
-
-            # Backlog update (for heartbeat meta)
-            try:
-                async with get_session() as session:
-                    count_result = await session.execute(
-                        select(func.count())
-                        .select_from(Recording)
-                        .where(Recording.local_deleted.is_(False))
-                        .where(~Recording.analysis_state.has_key("birdnet"))
+                await self._refresh_config()
+                # Recompute species mask only if location actually changed
+                if self.system_config and (
+                    self.system_config.latitude != prev_lat
+                    or self.system_config.longitude != prev_lon
+                ):
+                    allowed_mask, loc_filter_active = self._get_allowed_species_mask(labels)
+                    log.info(
+                        "birdnet.species_mask_recomputed",
+                        lat=self.system_config.latitude,
+                        lon=self.system_config.longitude,
                     )
-                    self._backlog_pending = count_result.scalar_one()
-            except Exception:
-                pass  # Best-effort — keep last known value
-
-            try:
-                self.health.update_status("birdnet", True, "polling")
-
-                # Worker Pull ORM
-                async with get_session() as session:
-                    # Ascending / Descending processing order
-                    sort_col = Recording.time.asc()
-                    if self.birdnet_config.processing_order == "newest_first":
-                        sort_col = Recording.time.desc()
-
-                    # SELECT FOR UPDATE SKIP LOCKED
-                    stmt = (
-                        select(Recording)
-                        .where(Recording.local_deleted.is_(False))
-                        .where(~Recording.analysis_state.has_key("birdnet"))
+                if self.birdnet_config and self.birdnet_config.common_name_locale != prev_locale:
+                    labels = await self._localize_labels(model_labels)
+
+                # Backlog update (for heartbeat meta) — throttled counter read
+                await self._backlog.maybe_refresh()
+
+                pool = self._inference_pool
+                if pool is not None and pool.broken and not await pool.restart():
+                    # No claims until inference works again; the leases would only bounce
+                    self.health.update_status("birdnet", False, "inference_pool_broken")
+                    await asyncio.sleep(self.env_settings.DB_RETRY_INTERVAL_S)
+                    continue
+
+                try:
+                    self.health.update_status("birdnet", True, "polling")
+
+                    found = await self._analyze_batch(
+                        interpreter, labels, allowed_mask, loc_filter_active
                     )
-                    stmt = stmt.order_by(sort_col).limit(1).with_for_update(skip_locked=True)
-
-                    result = await session.execute(stmt)
-                    recording = result.scalar_one_or_none()
-
-                    if recording is None:
-                        # No work found, sleep
-                        await asyncio.sleep(self.env_settings.POLLING_INTERVAL_S)
-                        continue
-
-                    # Check file existence — DB stores relative paths, prefix with recordings_dir
-                    rel_path = recording.file_processed or recording.file_raw
-                    audio_path = self.recordings_dir / rel_path
-                    if not audio_path.exists():
-                        log.error("birdnet.file_missing", path=str(audio_path))
-                        # Mark as failed in DB to prevent infinite loop
-                        recording.analysis_state = {"birdnet": "failed_file_missing"}
-                        await session.commit()
-                        continue
-
-                    # Process
-                    self.health.update_status("birdnet", True, f"analyzing {recording.id}")
-                    start_time = time.perf_counter()
-
-                    try:
-                        detections = await self._process_recording(
-                            recording,
-                            audio_path,
-                            interpreter,
-                            labels,
-                            allowed_mask,
-                            loc_filter_active,
-                        )
 
-                        if detections:
-                            session.add_all(detections)
-
-                        # Update analysis state using direct mutation / JSON merging
-                        # Copy the dict and update to ensure SQLAlchemy notices the mutation
-                        new_state = dict(recording.analysis_state)
-                        new_state["birdnet"] = "done"
-                        recording.analysis_state = new_state
-
-                        await session.commit()
-                        elapsed = time.perf_counter() - start_time
-                        self.stats.record_analyzed(recording.id, elapsed, len(detections))
-
-                    except Exception as e:
-                        self.stats.record_error(recording.id, e)
-                        await session.rollback()
-
-                        # Store crash log in state
-                        new_state = dict(recording.analysis_state)
-                        new_state["birdnet"] = f"crashed: {str(e)[:50]}"
-                        recording.analysis_state = new_state
-                        await session.commit()
-
-            except Exception as exc:
-                # Soft-fail transient DB errors or post-rollback persistence failures (ADR-0030)
-                log.warning("birdnet.db_cycle_failed", error=str(exc))
-                self.health.update_status("birdnet", False, "database_unavailable")
-                await asyncio.sleep(self.env_settings.DB_RETRY_INTERVAL_S)
-                continue
+                    if not found and not await self._materialize_pins():
+                        # No work found: block until the Indexer signals new recordings
+                        await self._work_signal.wait(self._idle_timeout())
+
+                except Exception as exc:
+                    # Soft-fail transient DB errors or post-rollback persistence failures (ADR-0030)
+                    log.warning("birdnet.db_cycle_failed", error=str(exc))
+                    self.health.update_status("birdnet", False, "database_unavailable")
+                    await asyncio.sleep(self.env_settings.DB_RETRY_INTERVAL_S)
+                    continue
+        finally:
+            await self._work_signal.stop()
+            if self._inference_pool is not None:
+                self._inference_pool.shutdown()
+                self._inference_pool = None
+            self._clip_writer.shutdown()
 
         # Emit final summary on shutdown
         self.stats.emit_final_summary()
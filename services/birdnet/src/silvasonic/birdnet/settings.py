@@ -1,4 +1,5 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
+from silvasonic.core.database.analysis_queue import DEFAULT_MAX_ATTEMPTS
 from silvasonic.core.heartbeat import DEFAULT_HEARTBEAT_INTERVAL_S
 
 
@@ -19,7 +20,21 @@ class BirdnetEnvSettings(BaseSettings):
 
     # Worker orchestration timings
     DB_RETRY_INTERVAL_S: float = 5.0
+    # Idle re-poll interval while the Redis work signal is unavailable
     POLLING_INTERVAL_S: float = 2.0
+    # Idle fallback re-poll while subscribed to the work signal (lost-message safety net)
+    IDLE_FALLBACK_S: float = 30.0
+    # Claim lease: unfinished recordings become reclaimable after this long
+    LEASE_DURATION_S: float = 300.0
+    # Expired leases after which a recording is marked failed_max_attempts
+    MAX_ATTEMPTS: int = DEFAULT_MAX_ATTEMPTS
+
+    # Decode buffer arena: samples per reusable buffer, in seconds of 48 kHz audio
+    AUDIO_BUFFER_S: float = 60.0
+    # Run an explicit gc.collect() only above this system memory use (percent)
+    GC_MEMORY_PERCENT: float = 85.0
+    # Threads encoding clips (FLAC/Opus) in the background
+    CLIP_WRITER_THREADS: int = 2
 
     # Path to Recorder workspace (mounted read-only from Controller)
     RECORDINGS_DIR: str = "/data/recorder"
@@ -0,0 +1,149 @@
+"""Seasonal species location mask — one row per BirdNET week, cached on disk.
+
+BirdNET's meta-model predicts which species occur at a location in a given
+week (48 "weeks" per year, four per month).  Instead of computing a single
+mask for the current week at startup — which goes stale in a long-running
+container and assigns the wrong season to backlog recordings — the mask of
+all 48 weeks is computed in one batched meta-model invoke and persisted to
+the BirdNET workspace::
+
+    {workspace}/species_mask.npz   # lat, lon, meta-model name, (48, classes) bool
+
+Each recording then uses the row of its own week, so a lookup costs one
+array index.  The table is recomputed only when the location or the
+meta-model changes.
+"""
+
+from __future__ import annotations
+
+import os
+from datetime import UTC, datetime
+from pathlib import Path
+
+import numpy as np
+import structlog
+from ai_edge_litert.interpreter import Interpreter  # type: ignore[import-untyped]
+
+log = structlog.get_logger()
+
+WEEKS = 48
+
+# Meta-model occurrence probability for a species to count as present
+LOCATION_THRESHOLD = 0.03
+
+CACHE_FILENAME = "species_mask.npz"
+
+
+def week_48(when: datetime) -> int:
+    """Map a timestamp to its BirdNET week (1-48) via the ISO week of its UTC date."""
+    iso_week = when.astimezone(UTC).isocalendar()[1]
+    return max(1, min(WEEKS, int(iso_week * WEEKS / 52)))
+
+
+def mask_for(allowed_mask: np.ndarray, when: datetime) -> np.ndarray:
+    """Return the ``(classes,)`` species mask that applies at ``when``.
+
+    Args:
+        allowed_mask: A static ``(classes,)`` mask, or a ``(48, classes)``
+            week table from :func:`compute_week_table`.
+        when: Recording (or window) timestamp.
+    """
+    if np.ndim(allowed_mask) == 2:
+        return allowed_mask[week_48(when) - 1]  # type: ignore[no-any-return]
+    return allowed_mask
+
+
+def compute_week_table(meta_model_path: Path, latitude: float, longitude: float) -> np.ndarray:
+    """Run the meta-model for all 48 weeks at one location.
+
+    The input is resized to ``[48, 3]`` so a single invoke covers the year;
+    models without a resizable batch dimension fall back to one invoke per
+    week.
+
+    Returns:
+        ``(48, classes)`` boolean mask; row ``w - 1`` is week ``w``.
+    """
+    interpreter = Interpreter(model_path=str(meta_model_path), num_threads=1)
+    interpreter.allocate_tensors()
+    in_index = interpreter.get_input_details()[0]["index"]
+    out_index = interpreter.get_output_details()[0]["index"]
+
+    # One (latitude, longitude, week) row per week
+    inputs = np.empty((WEEKS, 3), dtype=np.float32)
+    inputs[:, 0] = latitude
+    inputs[:, 1] = longitude
+    inputs[:, 2] = np.arange(1, WEEKS + 1)
+
+    try:
+        interpreter.resize_tensor_input(in_index, [WEEKS, 3])
+        interpreter.allocate_tensors()
+        interpreter.set_tensor(in_index, inputs)
+        interpreter.invoke()
+        probabilities = np.array(interpreter.get_tensor(out_index))
+    except (RuntimeError, ValueError):
+        log.debug("birdnet.species_mask_unbatched")
+        interpreter.resize_tensor_input(in_index, [1, 3])
+        interpreter.allocate_tensors()
+        rows = []
+        for row in inputs:
+            interpreter.set_tensor(in_index, row[None, :])
+            interpreter.invoke()
+            rows.append(np.array(interpreter.get_tensor(out_index))[0])
+        probabilities = np.stack(rows)
+
+    return probabilities >= LOCATION_THRESHOLD
+
+
+def load_week_table(
+    path: Path, latitude: float, longitude: float, model_name: str, num_classes: int
+) -> np.ndarray | None:
+    """Return the cached week table if it matches location, model and class count."""
+    try:
+        with np.load(path) as cached:
+            if (
+                float(cached["latitude"]) == latitude
+                and float(cached["longitude"]) == longitude
+                and str(cached["model"]) == model_name
+                and cached["mask"].shape == (WEEKS, num_classes)
+            ):
+                return np.array(cached["mask"], dtype=bool)
+    except (OSError, KeyError, ValueError):
+        return None
+    return None
+
+
+def save_week_table(
+    path: Path, mask: np.ndarray, latitude: float, longitude: float, model_name: str
+) -> None:
+    """Persist the week table atomically (write to a temporary file, then rename)."""
+    tmp = path.with_name(f".{path.name}.tmp")
+    with open(tmp, "wb") as f:
+        np.savez_compressed(
+            f, mask=mask, latitude=latitude, longitude=longitude, model=np.str_(model_name)
+        )
+    os.replace(tmp, path)
+
+
+def week_table(
+    cache_dir: Path,
+    meta_model_path: Path,
+    latitude: float,
+    longitude: float,
+    num_classes: int,
+) -> np.ndarray:
+    """Load the week table for a location from ``cache_dir``, computing it if needed.
+
+    A cache that cannot be written is logged and skipped; the table is then
+    recomputed on the next start.
+    """
+    path = cache_dir / CACHE_FILENAME
+    cached = load_week_table(path, latitude, longitude, meta_model_path.name, num_classes)
+    if cached is not None:
+        return cached
+
+    mask = compute_week_table(meta_model_path, latitude, longitude)
+    try:
+        save_week_table(path, mask, latitude, longitude, meta_model_path.name)
+    except OSError as e:
+        log.warning("birdnet.species_mask_cache_failed", path=str(path), error=str(e))
+    return mask
@@ -0,0 +1,123 @@
+"""Cross-segment stream analysis for BirdNET.
+
+The Recorder cuts its continuous capture into short segments
+(``segment_duration_s``, typically 10 s), and analyzing every segment in
+isolation drops or zero-pads the tail window, so calls that straddle a
+boundary are missed or scored low.  Consecutive segments of one recording
+run are instead joined into a single contiguous stream: windows slide across
+the boundaries, and each window is attributed back to the recording in which
+it starts.
+
+Segments belong to the same stream when they share the sensor and the
+Recorder's ``run_id`` and their sequence numbers are consecutive — both are
+encoded in the segment filename::
+
+    2026-03-26T01-35-00Z_10s_1a2b3c4d_00000007.wav
+                             ^^^^^^^^ ^^^^^^^^
+                             run_id   seq
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Sequence
+from pathlib import PurePosixPath
+from typing import NamedTuple
+
+import numpy as np
+from silvasonic.core.database.models.recordings import Recording
+
+# Tail of the Recorder's segment filename (see processor indexer)
+_SEGMENT_REGEX = re.compile(r"_(?P<run_id>[a-f0-9]{8})_(?P<seq>\d{8})\.wav$")
+
+
+class SegmentKey(NamedTuple):
+    """Position of a segment within its Recorder run."""
+
+    sensor_id: str
+    run_id: str
+    seq: int
+
+
+def segment_key(recording: Recording) -> SegmentKey | None:
+    """Parse the run position of ``recording`` from its filename.
+
+    Returns:
+        The key, or ``None`` if the filename does not follow the Recorder's
+        segment naming (such recordings are analyzed on their own).
+    """
+    name = PurePosixPath(recording.file_processed or recording.file_raw).name
+    match = _SEGMENT_REGEX.search(name)
+    if match is None:
+        return None
+    return SegmentKey(recording.sensor_id, match["run_id"], int(match["seq"]))
+
+
+def group_streams(
+    recordings: Sequence[Recording],
+    max_samples: int,
+    sample_rate: int,
+) -> list[list[Recording]]:
+    """Group recordings into streams of consecutive segments.
+
+    A stream is extended while the next segment has the same sensor and run
+    and directly follows the previous one, and the estimated stream length
+    stays within ``max_samples`` (the decode buffer size).  Recordings
+    without a parsable segment name form single-recording streams.
+
+    Only ``recordings`` (one claimed batch) are grouped; the tail samples of
+    the last segment are not carried over to the next claim.  A window that
+    straddles a batch boundary is therefore still zero-padded, exactly as
+    without stream analysis.  With a claim batch of ``N`` segments this
+    affects at most one boundary in ``N``; carrying audio across claims
+    would tie a lease to a segment another worker may already hold.
+
+    Returns:
+        Streams in the order of their first recording in ``recordings``, each
+        ordered by sequence number.
+    """
+    order = {recording.id: i for i, recording in enumerate(recordings)}
+    keyed: list[tuple[SegmentKey, Recording]] = []
+    streams: list[list[Recording]] = []
+    for recording in recordings:
+        key = segment_key(recording)
+        if key is None:
+            streams.append([recording])
+        else:
+            keyed.append((key, recording))
+
+    keyed.sort(key=lambda item: item[0])
+    prev: SegmentKey | None = None
+    current: list[Recording] = []
+    filled = 0
+    for key, recording in keyed:
+        samples = round(recording.duration * sample_rate)
+        if (
+            prev is None
+            or key.sensor_id != prev.sensor_id
+            or key.run_id != prev.run_id
+            or key.seq != prev.seq + 1
+            or filled + samples > max_samples
+        ):
+            if current:
+                streams.append(current)
+            current, filled = [], 0
+        current.append(recording)
+        filled += samples
+        prev = key
+    if current:
+        streams.append(current)
+
+    streams.sort(key=lambda stream: min(order[r.id] for r in stream))
+    return streams
+
+
+def attribute_windows(starts: np.ndarray, offsets: Sequence[int]) -> np.ndarray:
+    """Return the index of the stream segment each window starts in.
+
+    Args:
+        starts: Sample offset of each window in the stream.
+        offsets: Sample offset of each segment in the stream (ascending,
+            starting at 0).
+    """
+    return np.searchsorted(np.asarray(offsets), starts, side="right") - 1
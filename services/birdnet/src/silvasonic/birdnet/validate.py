@@ -0,0 +1,236 @@
+"""Offline validation of BirdNET model variants against FP32.
+
+Scores every window of a labelled fixture set with FP32 and with each
+variant through the worker's own decode and inference path, and records
+per variant (see :mod:`silvasonic.birdnet.variants`)::
+
+    "INT8": {"agreement": 0.97, "top1_agreement": 0.99, "label_recall": 1.0,
+             "window_ms_p50": 14.2, "speedup": 2.6, "sha256": "...", ...}
+
+* ``agreement`` — F1 score of the variant's (window, class) hits above the
+  default ``confidence_threshold`` against FP32's hits; the worker gates on it
+* ``top1_agreement`` — share of windows with the same best class
+* ``label_recall`` — share of labelled files whose species the variant detects
+* ``window_ms_p50`` / ``window_ms_p95`` / ``speedup`` — invoke time per
+  window, and FP32's median divided by the variant's
+
+Fixture files are labelled by name, ``<id> - <common name> - <scientific
+name>.wav`` (as in ``tests/fixtures/audio``).
+
+Usage (from the repository root, models in ``SILVASONIC_BIRDNET_MODEL_DIR``)::
+
+    silvasonic-birdnet-validate --variant FP16 INT8
+    silvasonic-birdnet-validate --audio-dir /data/fixtures --report ./variants.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import numpy as np
+from ai_edge_litert.interpreter import Interpreter  # type: ignore[import-untyped]
+from silvasonic.birdnet.bench import (
+    DEFAULT_AUDIO_DIR,
+    TimedInterpreter,
+    audio_files,
+    scratch_workspace,
+)
+from silvasonic.birdnet.inference import logits_to_scores
+from silvasonic.birdnet.labels import LabelTable
+from silvasonic.birdnet.variants import (
+    MODEL_VARIANTS,
+    REFERENCE_VARIANT,
+    REPORT_FILENAME,
+    file_sha256,
+    load_reports,
+    model_path,
+)
+
+
+@dataclass(frozen=True)
+class VariantReport:
+    """Validation result of one variant against FP32."""
+
+    variant: str
+    sha256: str
+    files: int
+    windows: int
+    agreement: float
+    top1_agreement: float
+    label_recall: float
+    window_ms_p50: float
+    window_ms_p95: float
+    speedup: float
+
+
+@dataclass(frozen=True)
+class Scored:
+    """Window logits of one model per fixture file, and its invoke times."""
+
+    logits: list[np.ndarray]
+    window_ms: list[float]
+
+
+def expected_species(path: Path) -> str | None:
+    """Return the scientific name a fixture file is labelled with, if any."""
+    parts = path.stem.split(" - ")
+    return parts[-1] if len(parts) >= 3 else None
+
+
+def hit_agreement(reference: np.ndarray, candidate: np.ndarray) -> float:
+    """F1 score of ``candidate``'s boolean (window, class) hits against ``reference``."""
+    both = int((reference & candidate).sum())
+    total = int(reference.sum() + candidate.sum())
+    return 1.0 if total == 0 else 2 * both / total
+
+
+def compare(
+    variant: str,
+    sha256: str,
+    reference: Scored,
+    candidate: Scored,
+    files: Sequence[Path],
+    labels: LabelTable,
+    threshold: float,
+    sensitivity: float,
+) -> VariantReport:
+    """Compare a variant's window scores with the reference (FP32) scores."""
+    ref = np.concatenate(reference.logits)
+    cand = np.concatenate(candidate.logits)
+
+    recalled = []
+    for file_logits, species in zip(candidate.logits, map(expected_species, files), strict=True):
+        if species is None:
+            continue
+        detected = (logits_to_scores(file_logits, sensitivity) >= threshold).any(axis=0)
+        recalled.append(bool((detected & (labels.scientific_names == species)).any()))
+
+    ref_p50 = float(np.median(reference.window_ms)) if reference.window_ms else 0.0
+    window_ms = np.array(candidate.window_ms or [0.0])
+    p50 = float(np.percentile(window_ms, 50))
+    return VariantReport(
+        variant=variant,
+        sha256=sha256,
+        files=len(files),
+        windows=len(ref),
+        agreement=round(
+            hit_agreement(
+                logits_to_scores(ref, sensitivity) >= threshold,
+                logits_to_scores(cand, sensitivity) >= threshold,
+            ),
+            4,
+        ),
+        top1_agreement=round(
+            float((ref.argmax(axis=1) == cand.argmax(axis=1)).mean()) if len(ref) else 1.0, 4
+        ),
+        label_recall=round(float(np.mean(recalled)) if recalled else 0.0, 4),
+        window_ms_p50=round(p50, 3),
+        window_ms_p95=round(float(np.percentile(window_ms, 95)), 3),
+        speedup=round(ref_p50 / p50, 2) if p50 > 0 else 0.0,
+    )
+
+
+async def score_fixtures(model_file: Path, files: Sequence[Path], threads: int) -> Scored:
+    """Score every window of the fixture set with one model through the worker path."""
+    from silvasonic.birdnet.service import BirdNETService
+    from silvasonic.core.schemas.system_config import BirdnetSettings
+
+    with scratch_workspace("birdnet-validate-"):
+        svc = BirdNETService()
+        # No energy gate: variants are compared on every window
+        svc.birdnet_config = BirdnetSettings(threads=threads, gate_threshold_db=None)
+        interpreter = Interpreter(model_path=str(model_file), num_threads=threads)
+        interpreter.allocate_tensors()
+        timed = TimedInterpreter(interpreter)
+        logits = []
+        for path in files:
+            audio = await svc._decode_audio(path)
+            window_logits, _ = await svc._infer_audio(audio, timed)
+            logits.append(window_logits)
+    return Scored(logits, timed.window_ms)
+
+
+async def validate(
+    model_dir: Path,
+    variants: Sequence[str],
+    files: Sequence[Path],
+    labels: LabelTable,
+    threshold: float,
+    sensitivity: float,
+    threads: int = 1,
+) -> list[VariantReport]:
+    """Validate ``variants`` against FP32 on the fixture set."""
+    reference = await score_fixtures(model_path(model_dir, REFERENCE_VARIANT), files, threads)
+    reports = []
+    for variant in variants:
+        model_file = model_path(model_dir, variant)
+        scored = await score_fixtures(model_file, files, threads)
+        reports.append(
+            compare(
+                variant,
+                file_sha256(model_file),
+                reference,
+                scored,
+                files,
+                labels,
+                threshold,
+                sensitivity,
+            )
+        )
+    return reports
+
+
+def main() -> None:
+    """Validate BirdNET model variants against FP32 and store the reports."""
+    from silvasonic.birdnet.service import LABELS_PATH, MODEL_DIR
+    from silvasonic.birdnet.settings import BirdnetEnvSettings
+    from silvasonic.core.schemas.system_config import BirdnetSettings
+
+    parser = argparse.ArgumentParser(
+        description="Validate BirdNET model variants against FP32 on labelled audio."
+    )
+    parser.add_argument(
+        "--variant", nargs="+", choices=MODEL_VARIANTS, default=list(MODEL_VARIANTS[1:])
+    )
+    parser.add_argument("--audio-dir", type=Path, default=DEFAULT_AUDIO_DIR)
+    parser.add_argument("--threads", type=int, default=1)
+    parser.add_argument(
+        "--report",
+        type=Path,
+        default=Path(BirdnetEnvSettings().WORKSPACE_DIR) / REPORT_FILENAME,
+        help="Report file read by the worker (updated per variant).",
+    )
+    args = parser.parse_args()
+
+    files = audio_files(args.audio_dir)
+    if not files:
+        parser.error(f"no audio files in {args.audio_dir}")
+    missing = [v for v in args.variant if not model_path(MODEL_DIR, v).exists()]
+    if missing:
+        parser.error(f"model file missing for {', '.join(missing)} in {MODEL_DIR}")
+
+    defaults = BirdnetSettings()
+    results = asyncio.run(
+        validate(
+            MODEL_DIR,
+            args.variant,
+            files,
+            LabelTable.from_file(LABELS_PATH),
+            defaults.confidence_threshold,
+            defaults.sensitivity,
+            args.threads,
+        )
+    )
+    reports = load_reports(args.report)
+    reports.update({r.variant: asdict(r) for r in results})
+    args.report.write_text(json.dumps(reports, indent=2) + "\n")
+    print(json.dumps([asdict(r) for r in results], indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""BirdNET classifier variants (FP32, FP16, INT8) and their validation gate.
+
+Reduced-precision classifiers run faster on the Pi 5's cores but may score
+differently.  Before the worker loads a variant other than FP32,
+``silvasonic-birdnet-validate`` (:mod:`silvasonic.birdnet.validate`) must
+have compared it with FP32 on a labelled fixture set and recorded the result
+in ``/data/birdnet/model_variants.json``.  At startup the worker refuses a
+variant, and loads FP32 instead, if its model file is missing or has no
+report, changed since it was validated, or its ``agreement`` with FP32 is
+below ``min_variant_agreement``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+
+MODEL_VARIANTS = ("FP32", "FP16", "INT8")
+REFERENCE_VARIANT = "FP32"
+REPORT_FILENAME = "model_variants.json"
+
+
+def model_path(model_dir: Path, variant: str) -> Path:
+    """Return the classifier model file of a variant."""
+    return model_dir / f"BirdNET_GLOBAL_6K_V2.4_Model_{variant}.tflite"
+
+
+def file_sha256(path: Path) -> str:
+    """Return the SHA-256 hex digest of a model file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def load_reports(path: Path) -> dict[str, dict[str, Any]]:
+    """Load the validation reports by variant (empty if none were written)."""
+    try:
+        return json.loads(path.read_text())  # type: ignore[no-any-return]
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def refusal(
+    variant: str, model_file: Path, reports: Mapping[str, Mapping[str, Any]], floor: float
+) -> str | None:
+    """Return why ``variant`` must not be loaded, or ``None`` if it may be."""
+    if variant == REFERENCE_VARIANT:
+        return None
+    if not model_file.exists():
+        return "model file missing"
+    report = reports.get(variant)
+    if report is None:
+        return "not validated"
+    if report.get("sha256") != file_sha256(model_file):
+        return "model file changed since validation"
+    if report["agreement"] < floor:
+        return f"agreement {report['agreement']} below floor {floor}"
+    return None
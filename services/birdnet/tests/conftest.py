@@ -0,0 +1,90 @@
+"""Shared fixtures for BirdNET tests.
+
+``service`` builds a :class:`BirdNETService` against a temporary workspace.
+Modules and classes that need different settings override
+``birdnet_settings``, ``system_settings`` or ``service_env`` (which may
+request the conftest version to extend it) instead of repeating the
+construction.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from silvasonic.birdnet.service import BirdNETService
+from silvasonic.core.schemas.system_config import BirdnetSettings, SystemSettings
+
+Scorer = Callable[[np.ndarray], np.ndarray]
+
+
+class FakeInference:
+    """Stand-in for ``BirdNETService._run_inference`` that records every batch."""
+
+    def __init__(self, score: Scorer) -> None:
+        """Answer each batch with ``score(batch)``."""
+        self.batches: list[np.ndarray] = []
+        self._score = score
+
+    @property
+    def windows(self) -> np.ndarray:
+        """All windows the model was invoked on, in order."""
+        return np.concatenate(self.batches)
+
+    async def __call__(self, interpreter: Any, batch: np.ndarray) -> np.ndarray:
+        """Record ``batch`` and return its logits."""
+        self.batches.append(np.array(batch, dtype=np.float32))
+        return self._score(self.batches[-1])
+
+
+@pytest.fixture
+def service_env(tmp_path: Path) -> dict[str, str]:
+    """Environment the service is constructed under."""
+    return {
+        "SILVASONIC_INSTANCE_ID": "birdnet-test",
+        "SILVASONIC_WORKSPACE_DIR": str(tmp_path),
+    }
+
+
+@pytest.fixture
+def birdnet_settings() -> BirdnetSettings:
+    """BirdNET settings of the service."""
+    return BirdnetSettings()
+
+
+@pytest.fixture
+def system_settings() -> SystemSettings:
+    """System settings of the service."""
+    return SystemSettings()
+
+
+@pytest.fixture
+def service(
+    service_env: dict[str, str],
+    birdnet_settings: BirdnetSettings,
+    system_settings: SystemSettings,
+) -> BirdNETService:
+    """A configured service that has not been started."""
+    with patch.dict("os.environ", service_env):
+        svc = BirdNETService()
+    svc.birdnet_config = birdnet_settings
+    svc.system_config = system_settings
+    return svc
+
+
+@pytest.fixture
+def fake_inference(
+    service: BirdNETService, monkeypatch: pytest.MonkeyPatch
+) -> Callable[[Scorer], FakeInference]:
+    """Replace the service's model invocation with a scorer for the rest of the test."""
+
+    def install(score: Scorer) -> FakeInference:
+        fake = FakeInference(score)
+        monkeypatch.setattr(service, "_run_inference", fake)
+        return fake
+
+    return install
@@ -10,7 +10,7 @@ import pytest
 from silvasonic.birdnet.service import BirdNETService
 from silvasonic.core.database.check import check_database_connection
 from silvasonic.core.database.models.profiles import MicrophoneProfile
-from silvasonic.core.database.models.recordings import Recording
+from silvasonic.core.database.models.recordings import Recording, RecordingAnalysis
 from silvasonic.core.database.models.system import Device
 from silvasonic.core.database.session import get_session
 from testcontainers.postgres import PostgresContainer
@@ -76,6 +76,16 @@ async def seeded_backlog_db(postgres_container: PostgresContainer) -> AsyncGener
         )
 
         session.add_all([r1, r2, r3, r4])
+        await session.flush()
+
+        # Work queue rows as the Indexer and Janitor leave them
+        states = {r1: "pending", r2: "pending", r3: "done", r4: "deleted"}
+        session.add_all(
+            RecordingAnalysis(
+                recording_id=r.id, worker="birdnet", recording_time=r.time, state=state
+            )
+            for r, state in states.items()
+        )
         await session.commit()
 
     yield
@@ -121,9 +131,9 @@ class TestBacklogMetrics:
                 svc.birdnet_config.threads = 1
                 await svc.run()
 
-        # After one iteration of the run() loop, _backlog_pending should be populated
+        # After one iteration of the run() loop, the backlog gauge should be populated
         # There are 4 recordings: 2 pending, 1 done, 1 deleted. Backlog should be 2.
-        assert svc._backlog_pending == 2
+        assert svc._backlog.get("birdnet").pending == 2
 
     async def test_backlog_zero_when_all_analyzed(
         self,
@@ -166,6 +176,13 @@ class TestBacklogMetrics:
                 local_deleted=True,
             )
             session.add_all([r1, r2])
+            await session.flush()
+            session.add_all(
+                RecordingAnalysis(
+                    recording_id=r.id, worker="birdnet", recording_time=r.time, state=state
+                )
+                for r, state in ((r1, "done"), (r2, "deleted"))
+            )
             await session.commit()
 
         with patch.dict(
@@ -196,4 +213,4 @@ class TestBacklogMetrics:
                 await svc.run()
 
         # Only 'done' or 'deleted' recordings, backlog is 0
-        assert svc._backlog_pending == 0
+        assert svc._backlog.get("birdnet").pending == 0
@@ -13,7 +13,7 @@ from silvasonic.birdnet.service import MODEL_SR, BirdNETService
 from silvasonic.core.database.check import check_database_connection
 from silvasonic.core.database.models.detections import Detection
 from silvasonic.core.database.models.profiles import MicrophoneProfile
-from silvasonic.core.database.models.recordings import Recording
+from silvasonic.core.database.models.recordings import Recording, RecordingAnalysis
 from silvasonic.core.database.models.system import Device
 from silvasonic.core.database.session import get_session
 from testcontainers.postgres import PostgresContainer
@@ -54,6 +54,8 @@ async def seeded_clip_db(
             analysis_state={},
         )
         session.add(r1)
+        await session.flush()
+        session.add(RecordingAnalysis(recording_id=r1.id, worker="birdnet", recording_time=r1.time))
         await session.commit()
 
     yield tmp_path
@@ -131,6 +133,11 @@ class TestClipPipeline:
             svc.birdnet_config.sensitivity = 1.0
             svc.birdnet_config.confidence_threshold = 0.1
             svc.birdnet_config.clip_padding_seconds = 3.0
+            svc.birdnet_config.batch_size = 8
+            svc.birdnet_config.workers = 1
+            svc.birdnet_config.claim_batch_size = 8
+            svc.birdnet_config.prefetch = 2
+            svc.birdnet_config.gate_threshold_db = None
 
             svc.system_config.latitude = 0.0
             svc.system_config.longitude = 0.0
@@ -158,4 +165,4 @@ class TestClipPipeline:
         assert det.common_name == "rubecula"
         assert det.clip_path is not None
         assert det.clip_path.startswith("clips/")
-        assert det.clip_path.endswith("Erithacusrubecula.wav")
+        assert det.clip_path.endswith(".flac")
@@ -9,15 +9,28 @@ from unittest.mock import patch
 import pytest
 from silvasonic.birdnet.service import BirdNETService
 from silvasonic.core.database.check import check_database_connection
+from silvasonic.core.database.detection_writer import DetectionRow, encode_details
 from silvasonic.core.database.models.detections import Detection
 from silvasonic.core.database.models.profiles import MicrophoneProfile
-from silvasonic.core.database.models.recordings import Recording
+from silvasonic.core.database.models.recordings import Recording, RecordingAnalysis
 from silvasonic.core.database.models.system import Device, SystemConfig
 from silvasonic.core.database.session import get_session
 from sqlalchemy import select
 from testcontainers.postgres import PostgresContainer
 
 
+async def _mock_decode(self: Any, audio_path: Path, out: Any = None) -> Any:
+    import numpy as np
+
+    return np.zeros(3 * 48000, dtype=np.float32)
+
+
+async def _mock_score(self: Any, audio: Any, interpreter: Any) -> Any:
+    import numpy as np
+
+    return np.zeros((1, 1), dtype=np.float32), np.zeros(1, dtype=np.int64)
+
+
 @pytest.fixture
 async def seeded_db(postgres_container: PostgresContainer) -> AsyncGenerator[None]:
     """Seed the database with a device, profile, and system config."""
@@ -72,6 +85,11 @@ async def seeded_db(postgres_container: PostgresContainer) -> AsyncGenerator[Non
         )
         session.add(r1)
         session.add(r2)
+        await session.flush()
+        for r in (r1, r2):
+            session.add(
+                RecordingAnalysis(recording_id=r.id, worker="birdnet", recording_time=r.time)
+            )
         await session.commit()
 
     yield
@@ -98,10 +116,10 @@ async def test_worker_pull_concurrency(
 
     # Mock OS Path existence check so they process the fake recordings
     with patch("silvasonic.birdnet.service.Path.exists", return_value=True):
-        # Mock the entire _process_recording function strictly to return 1 dummy Detection
+        # Mock the writer stage strictly to return 1 dummy detection row
         async def mock_process(
             self: Any, recording: Recording, *args: list[Any], **kwargs: dict[str, Any]
-        ) -> list[Detection]:
+        ) -> list[DetectionRow]:
             from silvasonic.core.schemas.detections import BirdnetDetectionDetails
 
             # Simulate processing time
@@ -116,20 +134,25 @@ async def test_worker_pull_concurrency(
             from datetime import timedelta
 
             return [
-                Detection(
-                    recording_id=recording.id,
-                    worker="birdnet",
+                DetectionRow(
                     time=recording.time,
                     end_time=recording.time + timedelta(seconds=3),
+                    recording_id=recording.id,
+                    worker="birdnet",
+                    confidence=0.99,
                     label="Turdus",
                     common_name="merula",
-                    confidence=0.99,
-                    details=details.model_dump(),
+                    clip_path=None,
+                    pinned=False,
+                    event=None,
+                    details=encode_details(details.model_dump()),
                 )
             ]
 
         with (
-            patch.object(BirdNETService, "_process_recording", new=mock_process),
+            patch.object(BirdNETService, "_decode_audio", new=_mock_decode),
+            patch.object(BirdNETService, "_infer_audio", new=_mock_score),
+            patch.object(BirdNETService, "_extract_detections", new=mock_process),
             patch("silvasonic.birdnet.service.Interpreter"),
             patch.object(BirdNETService, "_get_allowed_species_mask", return_value=(None, False)),
             patch("builtins.open"),
@@ -220,6 +243,10 @@ async def test_worker_resolves_relative_db_paths(
             analysis_state={},
         )
         session.add(rec)
+        await session.flush()
+        session.add(
+            RecordingAnalysis(recording_id=rec.id, worker="birdnet", recording_time=rec.time)
+        )
         await session.commit()
 
     # Create service with RECORDINGS_DIR pointing at tmp_path
@@ -235,14 +262,15 @@ async def test_worker_resolves_relative_db_paths(
 
     await svc.load_config()
 
-    # Run one iteration with real path resolution but mocked inference
+    # Run one iteration with real path resolution and decoding but mocked inference
     async def mock_process(
         self: Any, recording: Recording, *args: list[Any], **kwargs: dict[str, Any]
-    ) -> list[Detection]:
+    ) -> list[DetectionRow]:
         return []
 
     with (
-        patch.object(BirdNETService, "_process_recording", new=mock_process),
+        patch.object(BirdNETService, "_infer_audio", new=_mock_score),
+        patch.object(BirdNETService, "_extract_detections", new=mock_process),
         patch("silvasonic.birdnet.service.Interpreter"),
         patch.object(BirdNETService, "_get_allowed_species_mask", return_value=(None, False)),
         patch("builtins.open"),
@@ -0,0 +1,71 @@
+"""Unit tests for coarse-to-fine adaptive overlap in BirdNET inference."""
+
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+import pytest
+from silvasonic.birdnet.service import MODEL_SR, BirdNETService
+from silvasonic.core.schemas.system_config import BirdnetSettings
+
+
+@pytest.fixture
+def birdnet_settings() -> BirdnetSettings:
+    return BirdnetSettings(gate_threshold_db=None, adaptive_overlap=2.0)
+
+
+def _loud_windows_hit(batch: np.ndarray) -> np.ndarray:
+    # Class 0 fires on windows containing the call; class 1 never does
+    loud = batch.max(axis=1) > 0.5
+    logits = np.full((len(batch), 2), -10.0, dtype=np.float32)
+    logits[loud, 0] = 10.0
+    return logits
+
+
+@pytest.fixture(autouse=True)
+def _model(fake_inference: Callable[..., Any]) -> None:
+    fake_inference(_loud_windows_hit)
+
+
+def _call_at(start_s: float, end_s: float, seconds: float = 12.0) -> np.ndarray:
+    """Silence with one loud 'call' between ``start_s`` and ``end_s``."""
+    audio = np.zeros(int(seconds * MODEL_SR), dtype=np.float32)
+    audio[int(start_s * MODEL_SR) : int(end_s * MODEL_SR)] = 0.8
+    return audio
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestAdaptiveOverlap:
+    async def test_dense_windows_only_around_hot_regions(self, service: BirdNETService) -> None:
+        """Coarse grid 0/3/6/9 s; only the hot 6 s window gets 1 s-hop neighbours."""
+        logits, starts = await service._infer_audio(_call_at(6.2, 6.8), None)
+
+        assert (starts / MODEL_SR).tolist() == [0, 3, 4, 5, 6, 7, 8, 9]
+        assert logits.shape == (8, 2)
+        # Fine windows are scored against their own audio
+        assert (logits[:, 0] > 0).tolist() == [False, False, True, True, True, False, False, False]
+        assert service.stats.invokes == {"coarse": 1, "fine": 1}
+
+    async def test_quiet_recording_costs_only_the_coarse_pass(
+        self, service: BirdNETService
+    ) -> None:
+        _, starts = await service._infer_audio(np.zeros(12 * MODEL_SR, dtype=np.float32), None)
+
+        assert (starts / MODEL_SR).tolist() == [0, 3, 6, 9]
+        assert service.stats.invokes == {"coarse": 1}
+
+    async def test_call_across_coarse_boundary_is_caught(self, service: BirdNETService) -> None:
+        """A call split by the coarse grid is still seen whole by a fine window."""
+        logits, starts = await service._infer_audio(_call_at(5.5, 6.5), None)
+
+        hits = starts[logits[:, 0] > 0] / MODEL_SR
+        assert 4.0 in hits.tolist()
+
+    async def test_disabled_uses_the_configured_overlap_only(self, service: BirdNETService) -> None:
+        assert service.birdnet_config is not None
+        service.birdnet_config.adaptive_overlap = None
+        _, starts = await service._infer_audio(_call_at(6.2, 6.8), None)
+
+        assert (starts / MODEL_SR).tolist() == [0, 3, 6, 9]
+        assert service.stats.invokes == {"coarse": 1}
@@ -0,0 +1,170 @@
+"""Unit tests for the reusable decode buffer arena."""
+
+import asyncio
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pytest
+import soundfile as sf  # type: ignore[import-untyped]
+from silvasonic.birdnet.audio_arena import AudioArena, collect_if_memory_pressure
+from silvasonic.birdnet.labels import LabelTable
+from silvasonic.birdnet.service import MODEL_SR, BirdNETService
+
+NO_LABELS = LabelTable.from_labels([])
+
+
+@pytest.fixture
+def service_env(service_env: dict[str, str], tmp_path: Path) -> dict[str, str]:
+    return {
+        **service_env,
+        "SILVASONIC_RECORDINGS_DIR": str(tmp_path),
+        "SILVASONIC_AUDIO_BUFFER_S": "1.0",
+    }
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestAudioArena:
+    async def test_acquire_blocks_until_release(self) -> None:
+        arena = AudioArena(slots=1, capacity=8)
+        buffer = await arena.acquire()
+        assert arena.available == 0
+
+        waiter = asyncio.create_task(arena.acquire())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        arena.release(buffer)
+        assert await waiter is buffer
+
+    async def test_decode_fills_buffer_in_place(
+        self, service: BirdNETService, tmp_path: Path
+    ) -> None:
+        signal = np.linspace(-0.5, 0.5, MODEL_SR // 2, dtype=np.float32)
+        sf.write(tmp_path / "a.wav", signal, MODEL_SR, subtype="FLOAT")
+        buffer = np.zeros(MODEL_SR, dtype=np.float32)
+
+        audio = await service._decode_audio(tmp_path / "a.wav", out=buffer)
+
+        assert np.shares_memory(audio, buffer)
+        np.testing.assert_array_equal(audio, signal)
+
+    @pytest.mark.parametrize("channels, seconds", [(2, 0.5), (1, 2.0)])
+    async def test_stereo_or_oversized_falls_back_to_allocation(
+        self, service: BirdNETService, tmp_path: Path, channels: int, seconds: float
+    ) -> None:
+        signal = np.full((int(seconds * MODEL_SR), channels), 0.25, dtype=np.float32)
+        sf.write(tmp_path / "b.wav", signal, MODEL_SR, subtype="FLOAT")
+        buffer = np.zeros(MODEL_SR, dtype=np.float32)
+
+        audio = await service._decode_audio(tmp_path / "b.wav", out=buffer)
+
+        assert not np.shares_memory(audio, buffer)
+        assert audio.shape == (len(signal),)
+        assert float(audio[0]) == pytest.approx(0.25)
+
+    async def test_pipeline_returns_every_buffer(
+        self, service: BirdNETService, tmp_path: Path
+    ) -> None:
+        """Buffers come back after success and after a crash in any stage."""
+        recordings: list[Any] = []
+        for rid in range(1, 5):
+            sf.write(tmp_path / f"{rid}.wav", np.zeros(100, dtype=np.float32), MODEL_SR)
+            recordings.append(MagicMock(id=rid, file_processed=f"{rid}.wav"))
+
+        async def fake_score(audio: np.ndarray, interpreter: Any) -> tuple[Any, Any]:
+            return np.zeros((1, 2), dtype=np.float32), np.zeros(1, dtype=np.int64)
+
+        async def fake_extract(recording: Any, *args: Any) -> list[Any]:
+            if recording.id == 2:
+                raise OSError("disk full")
+            return []
+
+        with (
+            patch.object(service, "_infer_audio", side_effect=fake_score),
+            patch.object(service, "_extract_detections", side_effect=fake_extract),
+            patch.object(service, "_store_logits", new=AsyncMock()),
+        ):
+            results = await service._run_pipeline(recordings, None, NO_LABELS, MagicMock(), False)
+            assert service._arena is not None
+            arena = service._arena
+            # The arena survives across batches
+            await service._run_pipeline(recordings, None, NO_LABELS, MagicMock(), False)
+
+        assert service._arena is arena
+        assert arena.available == arena.slots
+        outcome = results[2][0]
+        assert outcome is not None
+        assert outcome[0].startswith("crashed")
+
+    async def _analyzed(self, service: BirdNETService, recording: Any) -> tuple[Any, list[Any]]:
+        """Run the pipeline on one recording; return the audio inferred and the buffers."""
+        arena = AudioArena(slots=4, capacity=MODEL_SR)
+        buffers = [await arena.acquire() for _ in range(arena.slots)]
+        for buffer in buffers:
+            arena.release(buffer)
+        service._arena = arena
+        seen: list[np.ndarray] = []
+
+        async def fake_score(audio: np.ndarray, interpreter: Any) -> tuple[Any, Any]:
+            seen.append(audio)
+            return np.zeros((1, 2), dtype=np.float32), np.zeros(1, dtype=np.int64)
+
+        with (
+            patch.object(service, "_infer_audio", side_effect=fake_score),
+            patch.object(service, "_extract_detections", new=AsyncMock(return_value=[])),
+            patch.object(service, "_store_logits", new=AsyncMock()),
+        ):
+            await service._run_pipeline([recording], None, NO_LABELS, MagicMock(), False)
+
+        assert arena.available == arena.slots
+        (audio,) = seen
+        return audio, buffers
+
+    async def test_default_settings_decode_raw_source_into_arena(
+        self, service: BirdNETService, tmp_path: Path
+    ) -> None:
+        """A raw-only recording is resampled into an arena buffer."""
+        sf.write(tmp_path / "raw.wav", np.full(16_000, 0.25, dtype=np.float32), 32_000)
+        recording = MagicMock(id=1, file_processed=None, file_raw="raw.wav")
+
+        audio, buffers = await self._analyzed(service, recording)
+
+        assert audio.dtype == np.float32
+        assert len(audio) == MODEL_SR // 2
+        assert any(np.shares_memory(audio, buffer) for buffer in buffers)
+
+    async def test_default_settings_map_processed_segment_outside_arena(
+        self, service: BirdNETService, tmp_path: Path
+    ) -> None:
+        """A processed segment is memory-mapped and leaves its slot's buffer unused."""
+        sf.write(tmp_path / "seg.wav", np.zeros(MODEL_SR // 2, dtype=np.int16), MODEL_SR)
+        recording = MagicMock(id=1, file_processed="seg.wav")
+
+        audio, buffers = await self._analyzed(service, recording)
+
+        assert isinstance(audio, np.memmap)
+        assert not any(np.shares_memory(audio, buffer) for buffer in buffers)
+
+
+@pytest.mark.unit
+class TestMemoryPressureCollect:
+    def test_skips_collection_below_threshold(self) -> None:
+        with (
+            patch("silvasonic.birdnet.audio_arena.psutil.virtual_memory") as vm,
+            patch("silvasonic.birdnet.audio_arena.gc.collect") as collect,
+        ):
+            vm.return_value.percent = 40.0
+            assert collect_if_memory_pressure(85.0) is False
+        collect.assert_not_called()
+
+    def test_collects_under_pressure(self) -> None:
+        with (
+            patch("silvasonic.birdnet.audio_arena.psutil.virtual_memory") as vm,
+            patch("silvasonic.birdnet.audio_arena.gc.collect", return_value=0) as collect,
+        ):
+            vm.return_value.percent = 92.0
+            assert collect_if_memory_pressure(85.0) is True
+        collect.assert_called_once()
@@ -0,0 +1,138 @@
+"""Unit tests for batched multi-window BirdNET inference."""
+
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+from silvasonic.birdnet.inference import invoke_batch
+from silvasonic.birdnet.labels import LabelTable
+from silvasonic.birdnet.service import MODEL_SR, WINDOW_SAMPLES, BirdNETService
+from silvasonic.core.schemas.system_config import BirdnetSettings
+
+
+class FakeInterpreter:
+    """Minimal stand-in for the LiteRT interpreter with a dynamic batch dimension."""
+
+    def __init__(self, num_classes: int = 3, hot_windows: tuple[int, ...] = ()) -> None:
+        """Start with the model's default batch dimension of 1."""
+        self.shape = np.array([1, WINDOW_SAMPLES])
+        self.num_classes = num_classes
+        self.hot_windows = hot_windows
+        self.resize_calls: list[list[int]] = []
+        self.batches: list[np.ndarray] = []
+        self._output = np.zeros((1, num_classes), dtype=np.float32)
+        self._offset = 0
+
+    def get_input_details(self) -> list[dict[str, Any]]:
+        return [{"index": 0, "shape": self.shape}]
+
+    def get_output_details(self) -> list[dict[str, Any]]:
+        return [{"index": 1}]
+
+    def resize_tensor_input(self, index: int, shape: list[int]) -> None:
+        self.resize_calls.append(shape)
+        self.shape = np.array(shape)
+
+    def allocate_tensors(self) -> None:
+        pass
+
+    def set_tensor(self, index: int, batch: np.ndarray) -> None:
+        assert batch.shape == tuple(self.shape)
+        self.batches.append(np.array(batch))
+
+    def invoke(self) -> None:
+        n = len(self.batches[-1])
+        out = np.full((n, self.num_classes), -10.0, dtype=np.float32)
+        for row in range(n):
+            if self._offset + row in self.hot_windows:
+                out[row, 1] = 10.0
+        self._offset += n
+        self._output = out
+
+    def get_tensor(self, index: int) -> np.ndarray:
+        return self._output
+
+
+@pytest.fixture
+def birdnet_settings() -> BirdnetSettings:
+    return BirdnetSettings(batch_size=2, gate_threshold_db=None)
+
+
+@pytest.mark.unit
+class TestInvokeBatch:
+    def test_resizes_only_when_batch_size_changes(self) -> None:
+        interp = FakeInterpreter()
+        batch = np.zeros((4, WINDOW_SAMPLES), dtype=np.float32)
+
+        out1 = invoke_batch(interp, batch)
+        out2 = invoke_batch(interp, batch)
+
+        assert out1.shape == (4, 3)
+        assert out2.shape == (4, 3)
+        assert interp.resize_calls == [[4, WINDOW_SAMPLES]]
+
+    def test_shrinks_for_tail_batch(self) -> None:
+        interp = FakeInterpreter()
+        invoke_batch(interp, np.zeros((4, WINDOW_SAMPLES), dtype=np.float32))
+        invoke_batch(interp, np.zeros((1, WINDOW_SAMPLES), dtype=np.float32))
+
+        assert interp.resize_calls == [[4, WINDOW_SAMPLES], [1, WINDOW_SAMPLES]]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestBatchedProcessRecording:
+    async def test_windows_are_batched_and_hits_mapped(self, service: BirdNETService) -> None:
+        """A 10 s recording yields 3 windows, invoked as batches of 2 + 1."""
+        audio = np.ones(10 * MODEL_SR, dtype=np.float32)
+        interp = FakeInterpreter(hot_windows=(2,))
+
+        recording = MagicMock()
+        recording.id = 7
+        recording.time = datetime(2024, 1, 1, tzinfo=UTC)
+
+        with (
+            patch("silvasonic.birdnet.service.sf.read", return_value=(audio, MODEL_SR)),
+            patch("silvasonic.birdnet.service.sf.write"),
+        ):
+            detections = await service._process_recording(
+                recording,
+                Path("/tmp/fake.wav"),
+                interp,
+                LabelTable.from_labels(["A_a", "Turdus merula_Eurasian Blackbird", "C_c"]),
+                np.ones(3, dtype=bool),
+                loc_filter_active=False,
+            )
+
+        assert [len(b) for b in interp.batches] == [2, 1]
+        assert len(detections) == 1
+        det = detections[0]
+        assert det.label == "Turdus merula_Eurasian Blackbird"
+        assert det.time == recording.time.replace(second=6)
+
+    async def test_allowed_mask_applies_to_score_matrix(self, service: BirdNETService) -> None:
+        """Classes excluded by the location mask never produce detections."""
+        audio = np.ones(6 * MODEL_SR, dtype=np.float32)
+        interp = FakeInterpreter(hot_windows=(0, 1))
+
+        recording = MagicMock()
+        recording.id = 8
+        recording.time = datetime(2024, 1, 1, tzinfo=UTC)
+
+        with (
+            patch("silvasonic.birdnet.service.sf.read", return_value=(audio, MODEL_SR)),
+            patch("silvasonic.birdnet.service.sf.write"),
+        ):
+            detections = await service._process_recording(
+                recording,
+                Path("/tmp/fake.wav"),
+                interp,
+                LabelTable.from_labels(["A_a", "B_b", "C_c"]),
+                np.array([True, False, True]),
+                loc_filter_active=True,
+            )
+
+        assert detections == []
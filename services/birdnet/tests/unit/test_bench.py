@@ -0,0 +1,98 @@
+"""Unit tests for the offline BirdNET benchmark."""
+
+import json
+import os
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+import soundfile as sf  # type: ignore[import-untyped]
+from silvasonic.birdnet.bench import (
+    BenchConfig,
+    MemorySession,
+    audio_files,
+    report,
+    run_config,
+)
+from silvasonic.birdnet.service import MODEL_SR, WINDOW_SAMPLES
+from silvasonic.core.database.detection_writer import DetectionRow, insert_detections
+
+
+def _interpreter() -> MagicMock:
+    """Mock interpreter scoring class 0 high in every window."""
+    interpreter = MagicMock()
+    interpreter.get_input_details.return_value = [
+        {"index": 0, "shape": np.array([1, WINDOW_SAMPLES])}
+    ]
+    interpreter.get_output_details.return_value = [{"index": 0}]
+
+    def set_tensor(index: int, batch: np.ndarray) -> None:
+        logits = np.full((len(batch), 2), -10.0, dtype=np.float32)
+        logits[:, 0] = 5.0
+        interpreter.get_tensor.return_value = logits
+
+    interpreter.set_tensor.side_effect = set_tensor
+    return interpreter
+
+
+@pytest.fixture
+def audio_dir(tmp_path: Path) -> Path:
+    audio = tmp_path / "audio"
+    audio.mkdir()
+    rng = np.random.default_rng(0)
+    for name in ("a.wav", "b.wav"):
+        sf.write(audio / name, rng.normal(0, 0.1, 9 * MODEL_SR), MODEL_SR, subtype="PCM_16")
+    (audio / "notes.txt").write_text("not audio")
+    return audio
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestBench:
+    async def test_run_config(self, audio_dir: Path, tmp_path: Path) -> None:
+        labels = tmp_path / "labels.txt"
+        labels.write_text("A_a\nB_b\n")
+        files = audio_files(audio_dir)
+        assert [f.name for f in files] == ["a.wav", "b.wav"]
+
+        with (
+            patch.dict("os.environ", {"SILVASONIC_INSTANCE_ID": "birdnet-bench"}),
+            patch("silvasonic.birdnet.service.LABELS_PATH", labels),
+            patch("silvasonic.birdnet.bench.Interpreter", return_value=_interpreter()),
+        ):
+            workspace = os.environ.get("SILVASONIC_WORKSPACE_DIR")
+            result = await run_config(BenchConfig("FP32", 1, 0.0, 2), files, repeat=2)
+            # The temporary workspace does not leak into the environment
+            assert os.environ.get("SILVASONIC_WORKSPACE_DIR") == workspace
+
+        # 2 files x 2 repeats x 3 windows, warm-up excluded
+        assert result.files == 4
+        assert result.audio_s == pytest.approx(36.0)
+        assert result.windows == 12
+        assert result.detections == 12
+        assert result.rtf == pytest.approx(result.wall_s / 36.0, rel=0.01)
+        assert result.window_ms_p50 <= result.window_ms_p95
+        assert result.peak_rss_mb > 0
+
+        doc = json.loads(json.dumps(report([result], files)))
+        assert doc["results"][0]["config"] == {
+            "variant": "FP32",
+            "threads": 1,
+            "overlap": 0.0,
+            "batch_size": 2,
+        }
+
+    async def test_memory_session_commits_rows(self) -> None:
+        from datetime import UTC, datetime
+
+        session = MemorySession()
+        t = datetime(2026, 5, 1, tzinfo=UTC)
+        rows = [
+            DetectionRow(t, t, 1, "birdnet", 0.9, "A_a", "a", None, False, None, details)
+            for details in ('{"x":1}', '{"x":1}', '{"x":2}')
+        ]
+
+        assert await insert_detections(session, rows) == 3  # type: ignore[arg-type]
+        assert session.runs == {'{"x":1}': 1, '{"x":2}': 2}
+        assert [r[-1] for r in session.rows] == [1, 1, 2]
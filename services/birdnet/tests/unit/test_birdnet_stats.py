@@ -3,7 +3,7 @@ from __future__ import annotations
 from unittest.mock import patch
 
 import pytest
-from silvasonic.birdnet.birdnet_stats import BirdnetStats
+from silvasonic.birdnet.birdnet_stats import STAGES, BirdnetStats
 
 
 @pytest.mark.unit
@@ -117,6 +117,54 @@ class TestBirdnetStatsSteadyState:
         assert last.kwargs["total_analyzed"] == 3
         assert last.kwargs["total_hits"] == 10
 
+    def test_summary_reports_gated_windows(self) -> None:
+        stats = self._make_steady_state_stats(summary_interval_s=0.0)
+
+        with patch("silvasonic.birdnet.birdnet_stats.log") as mock_log:
+            stats.record_gate(10, 7)
+            stats.record_analyzed(1, 1.0, 0)
+            stats.maybe_emit_summary()
+
+        last = [c for c in mock_log.info.call_args_list if c[0][0] == "birdnet.summary"][-1]
+        assert last.kwargs["windows_recent"] == 10
+        assert last.kwargs["windows_skipped_recent"] == 7
+
+    def test_summary_reports_invokes_per_stage(self) -> None:
+        stats = self._make_steady_state_stats(summary_interval_s=0.0)
+
+        with patch("silvasonic.birdnet.birdnet_stats.log") as mock_log:
+            stats.record_invokes("coarse", 4)
+            stats.record_invokes("fine", 1)
+            stats.record_analyzed(1, 1.0, 0)
+            stats.maybe_emit_summary()
+            stats.record_invokes("coarse", 2)
+            stats.record_analyzed(2, 1.0, 0)
+            stats.maybe_emit_summary()
+
+        last = [c for c in mock_log.info.call_args_list if c[0][0] == "birdnet.summary"][-1]
+        assert last.kwargs["invokes_recent"] == {"coarse": 2, "fine": 0}
+        assert stats.invokes == {"coarse": 6, "fine": 1}
+
+    def test_summary_reports_stage_latencies_of_interval(self) -> None:
+        stats = self._make_steady_state_stats(summary_interval_s=0.0)
+
+        with patch("silvasonic.birdnet.birdnet_stats.log") as mock_log:
+            stats.record_stage("decode", 5.0)
+            stats.record_analyzed(1, 1.0, 0)
+            stats.maybe_emit_summary()
+            stats.record_stage("decode", 0.004)
+            stats.record_stage("commit", 0.04)
+            stats.record_analyzed(2, 1.0, 0)
+            stats.maybe_emit_summary()
+
+        last = [c for c in mock_log.info.call_args_list if c[0][0] == "birdnet.summary"][-1]
+        stages = last.kwargs["stages_recent"]
+        assert set(stages) == set(STAGES)
+        assert stages["decode"]["count"] == 1
+        assert stages["decode"]["p99_ms"] <= 5.0
+        assert stages["commit"]["count"] == 1
+        assert stages["claim"] == {"count": 0, "p50_ms": 0.0, "p95_ms": 0.0, "p99_ms": 0.0}
+
 
 @pytest.mark.unit
 class TestBirdnetStatsFinalSummary:
@@ -136,3 +184,14 @@ class TestBirdnetStatsFinalSummary:
         assert final.kwargs["total_hits"] == 2
         assert final.kwargs["total_errors"] == 1
         assert final.kwargs["total_duration_s"] == 4.5
+        assert set(final.kwargs["stages"]) == set(STAGES)
+
+    def test_timed_skips_failed_blocks(self) -> None:
+        stats = BirdnetStats()
+
+        with stats.timed("claim"):
+            pass
+        with pytest.raises(RuntimeError), stats.timed("claim"):
+            raise RuntimeError("db down")
+
+        assert stats.stages["claim"].count == 1
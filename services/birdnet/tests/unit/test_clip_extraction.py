@@ -5,40 +5,39 @@ from unittest.mock import MagicMock, patch
 
 import numpy as np
 import pytest
-from silvasonic.birdnet.service import MODEL_SR, BirdNETService
+from silvasonic.birdnet.labels import LabelTable
+from silvasonic.birdnet.service import MODEL_SR, WINDOW_SAMPLES, BirdNETService
+from silvasonic.core.schemas.system_config import BirdnetSettings
 
 
 @pytest.fixture
-def service(tmp_path: Path) -> BirdNETService:
-    with patch.dict(
-        "os.environ",
-        {
-            "SILVASONIC_INSTANCE_ID": "birdnet-test",
-            "SILVASONIC_WORKSPACE_DIR": str(tmp_path),
-        },
-    ):
-        from silvasonic.birdnet.settings import BirdnetEnvSettings
-        from silvasonic.core.schemas.system_config import BirdnetSettings, SystemSettings
+def birdnet_settings() -> BirdnetSettings:
+    return BirdnetSettings(clip_padding_seconds=1.0, gate_threshold_db=None)
 
-        env_settings = BirdnetEnvSettings()
-        svc = BirdNETService()
-        svc.env_settings = env_settings
 
-        svc.clips_dir = tmp_path / "clips"
-        svc.clips_dir.mkdir(exist_ok=True)
+def _first_window_hit_interpreter() -> MagicMock:
+    """Mock interpreter that returns a high score for class 0 in the first window only."""
+    mock_interpreter = MagicMock()
+    mock_interpreter.get_input_details.return_value = [
+        {"index": 0, "shape": np.array([1, WINDOW_SAMPLES])}
+    ]
+    mock_interpreter.get_output_details.return_value = [{"index": 0}]
 
-        svc.birdnet_config = BirdnetSettings(clip_padding_seconds=1.0)
-        svc.system_config = SystemSettings()
+    def mock_set_tensor(index: int, batch: np.ndarray) -> None:
+        res = np.full((len(batch), 2), -10.0, dtype=np.float32)
+        res[0, 0] = 5.0
+        mock_interpreter.get_tensor.return_value = res
 
-        return svc
+    mock_interpreter.set_tensor.side_effect = mock_set_tensor
+    return mock_interpreter
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
 class TestClipExtraction:
-    """Test BirdNET extraction of 3-second padded WAV files."""
+    """Test BirdNET extraction of padded detection clips (FLAC by default)."""
 
-    async def test_clip_extraction_writes_wav(self, service: BirdNETService) -> None:
+    async def test_clip_extraction_writes_flac(self, service: BirdNETService) -> None:
         """The loop should write bounded audio clips using Soundfile."""
         # Setup dummy audio (10 seconds)
         audio_length = 10 * MODEL_SR
@@ -56,18 +55,8 @@ class TestClipExtraction:
         # Actually it's easier to assert that slice is properly requested
         # without running the full massive run_loop.
 
-        mock_interpreter = MagicMock()
-        mock_interpreter.get_input_details.return_value = [{"index": 0}]
-        mock_interpreter.get_output_details.return_value = [{"index": 0}]
-
-        # Simulate an immediate positive hit for the first 3s
-        def mock_infer() -> None:
-            # Return high score array so index 0 is > threshold
-            res = np.full((1, 2), -10.0, dtype=np.float32)
-            res[0, 0] = 5.0
-            mock_interpreter.get_tensor.return_value = res
-
-        mock_interpreter.invoke.side_effect = mock_infer
+        # Simulate an immediate positive hit for the first 3s window only
+        mock_interpreter = _first_window_hit_interpreter()
 
         # To speed up test, stop processing immediately after first window iteration
         service._shutdown_event = MagicMock()
@@ -81,7 +70,7 @@ class TestClipExtraction:
 
         recording.time = datetime(2024, 1, 1, tzinfo=UTC)
 
-        labels = ["Turdus_merula"]
+        labels = LabelTable.from_labels(["Turdus_merula"])
         allowed_mask = np.array([True, True])
 
         with (
@@ -101,15 +90,15 @@ class TestClipExtraction:
         assert len(detections) == 1
 
         # 1. Assert Database payload path
-        # 42_0_3000_Turdusmerula.wav
-        assert detections[0].clip_path == "clips/42_0_3000_Turdusmerula.wav"
+        # 42_0_3000.flac
+        assert detections[0].clip_path == "clips/42_0_3000.flac"
 
         # 2. Assert padding slice
         # First chunk starts at 0. Window is 3.0s (144000 samples). Padding is 1.0s (48000 samples)
         # Bounded between 0 and 10s. So start=0, end=144000+48000 = 192000
         mock_sf_write.assert_called_once()
         args, _ = mock_sf_write.call_args
-        assert args[0] == str(service.clips_dir / "42_0_3000_Turdusmerula.wav")
+        assert args[0] == str(service.clips_dir / "42_0_3000.flac")
         assert len(args[1]) == int(4.0 * MODEL_SR)
 
     async def _sync_to_async(self, func: Any, *args: Any) -> Any:
@@ -125,16 +114,7 @@ class TestClipExtraction:
 
         mock_loop.run_in_executor.side_effect = run_in_executor_mock
 
-        mock_interpreter = MagicMock()
-        mock_interpreter.get_input_details.return_value = [{"index": 0}]
-        mock_interpreter.get_output_details.return_value = [{"index": 0}]
-
-        def mock_infer() -> None:
-            res = np.full((1, 2), -10.0, dtype=np.float32)
-            res[0, 0] = 5.0
-            mock_interpreter.get_tensor.return_value = res
-
-        mock_interpreter.invoke.side_effect = mock_infer
+        mock_interpreter = _first_window_hit_interpreter()
         service._shutdown_event = MagicMock()
         service._shutdown_event.is_set.side_effect = [False, True]
 
@@ -144,7 +124,7 @@ class TestClipExtraction:
 
         recording.time = datetime(2024, 1, 1, tzinfo=UTC)
 
-        labels = ["Corvus_corax"]
+        labels = LabelTable.from_labels(["Corvus_corax"])
         allowed_mask = np.array([True, True])
 
         with (
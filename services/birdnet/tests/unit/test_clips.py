@@ -0,0 +1,269 @@
+"""Unit tests for BirdNET clips (formats, shared spans, lazy materialization)."""
+
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pytest
+import soundfile as sf  # type: ignore[import-untyped]
+from silvasonic.birdnet.clips import (
+    ClipService,
+    extract_clip,
+    span_ms,
+    top_per_label,
+    write_clip,
+)
+from silvasonic.birdnet.labels import LabelTable
+from silvasonic.birdnet.service import MODEL_SR, BirdNETService
+from silvasonic.core.schemas.system_config import BirdnetSettings
+
+T0 = datetime(2026, 5, 1, 4, 0, tzinfo=UTC)
+
+
+def _ramp(path: Path, seconds: float, sample_rate: int = MODEL_SR, channels: int = 1) -> None:
+    """A WAV whose sample values encode their position (in seconds / 100)."""
+    t = np.arange(int(seconds * sample_rate), dtype=np.float32) / sample_rate / 100
+    path.parent.mkdir(parents=True, exist_ok=True)
+    sf.write(path, np.repeat(t[:, None], channels, axis=1), sample_rate, subtype="FLOAT")
+
+
+def _session(row: tuple[Any, ...] | None) -> MagicMock:
+    session = MagicMock()
+    result = MagicMock()
+    result.first.return_value = row
+    result.all.return_value = [row] if row else []
+    session.execute = AsyncMock(return_value=result)
+    return session
+
+
+@pytest.mark.unit
+class TestClipHelpers:
+    def test_top_per_label(self) -> None:
+        classes = np.array([0, 1, 0, 0, 1])
+        scores = np.array([0.7, 0.6, 0.9, 0.8, 0.95])
+
+        assert top_per_label(classes, scores, 1).tolist() == [False, False, True, False, True]
+        assert top_per_label(classes, scores, 2).tolist() == [False, True, True, True, True]
+
+    def test_span_ms_survives_the_database_round_trip(self) -> None:
+        """Eager (sample index) and lazy (stored timestamp) clips get the same stem."""
+        for idx in range(0, 10 * MODEL_SR, 37):
+            eager = idx / MODEL_SR
+            stored = (T0 + timedelta(seconds=eager) - T0).total_seconds()
+            assert span_ms(eager, eager + 3.0) == span_ms(stored, stored + 3.0)
+        assert span_ms(1.4999996, 2.9999999) == (1500, 3000)
+
+    @pytest.mark.parametrize("clip_format", ["flac", "opus", "wav"])
+    def test_write_clip_formats(self, tmp_path: Path, clip_format: str) -> None:
+        t = np.arange(3 * MODEL_SR) / MODEL_SR
+        audio = (0.5 * np.sin(2 * np.pi * 3000 * t)).astype(np.float32)
+        dest = tmp_path / f"clip.{clip_format}"
+
+        assert write_clip(dest, audio, MODEL_SR)
+
+        info = sf.info(dest)
+        assert info.samplerate == MODEL_SR
+        assert info.duration == pytest.approx(3.0, abs=0.01)
+
+    def test_compressed_clips_are_smaller(self, tmp_path: Path) -> None:
+        audio = np.random.default_rng(0).normal(0, 0.01, 3 * MODEL_SR).astype(np.float32)
+        sizes = {}
+        for clip_format in ("flac", "opus", "wav"):
+            write_clip(tmp_path / f"clip.{clip_format}", audio, MODEL_SR)
+            sizes[clip_format] = (tmp_path / f"clip.{clip_format}").stat().st_size
+        assert sizes["opus"] < sizes["flac"] < sizes["wav"]
+
+    def test_extract_clip_at_source_rate(self, tmp_path: Path) -> None:
+        """Raw-only sources keep their native rate; channels are mixed down."""
+        source = tmp_path / "raw.wav"
+        _ramp(source, 10.0, sample_rate=96000, channels=2)
+
+        # Opus cannot encode 96 kHz: the clip falls back to FLAC
+        clip_path = extract_clip(source, 2.0, 5.0, tmp_path / "clip", "opus")
+        assert clip_path == tmp_path / "clip.flac"
+
+        clip, sr = sf.read(clip_path, dtype="float32")
+        assert sr == 96000
+        assert clip.ndim == 1
+        assert len(clip) == 3 * 96000
+        assert clip[0] == pytest.approx(0.02, abs=1e-4)
+
+    def test_extract_clip_clamps_padding(self, tmp_path: Path) -> None:
+        source = tmp_path / "seg.wav"
+        _ramp(source, 4.0)
+
+        clip_path = extract_clip(source, -3.0, 9.0, tmp_path / "clip", "opus")
+        assert clip_path == tmp_path / "clip.opus"
+        assert sf.info(clip_path).frames == 4 * MODEL_SR
+
+    def test_missing_source(self, tmp_path: Path) -> None:
+        assert extract_clip(tmp_path / "gone.wav", 0.0, 3.0, tmp_path / "clip") is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestClipService:
+    @pytest.fixture
+    def clips(self, tmp_path: Path) -> ClipService:
+        (tmp_path / "birdnet" / "clips").mkdir(parents=True)
+        _ramp(tmp_path / "recorder" / "mic-01" / "seg.wav", 10.0)
+        return ClipService(tmp_path / "birdnet" / "clips", tmp_path / "recorder", 1.0)
+
+    def _row(
+        self, clip_path: str | None = None, gone: bool = False, start_s: float = 3.0
+    ) -> tuple[Any, ...]:
+        det_time = T0 + timedelta(seconds=start_s)
+        return (
+            42,
+            det_time,
+            det_time + timedelta(seconds=3),
+            clip_path,
+            7,
+            T0,
+            "mic-01/seg.wav",
+            "mic-01/raw.wav",
+            gone,
+        )
+
+    async def test_first_request_cuts_and_records_clip(self, clips: ClipService) -> None:
+        session = _session(self._row())
+
+        path = await clips.materialize(session, 42)
+
+        assert path == "clips/7_3000_6000.flac"
+        audio, _ = sf.read(clips.clips_dir.parent / path, dtype="float32")
+        # Detection 3-6 s of the recording, padded by 1 s on each side
+        assert len(audio) == 5 * MODEL_SR
+        assert audio[0] == pytest.approx(0.02, abs=1e-4)
+        update_sql = str(session.execute.await_args_list[-1].args[0])
+        assert update_sql.startswith("UPDATE detections SET clip_path")
+
+    async def test_clip_stops_at_the_end_of_its_segment(self, clips: ClipService) -> None:
+        """Lazy clips are cut from one recording, even where stream analysis stitched segments.
+
+        An eager stream clip of this detection would run on into the next segment.
+        """
+        session = _session(self._row(start_s=8.5))
+
+        path = await clips.materialize(session, 42)
+
+        assert path == "clips/7_8500_11500.flac"
+        audio, _ = sf.read(clips.clips_dir.parent / path, dtype="float32")
+        # 7.5 s (padded start) up to the 10 s end of seg.wav
+        assert len(audio) == int(2.5 * MODEL_SR)
+        assert audio[-1] == pytest.approx(0.1, abs=1e-4)
+
+    async def test_cached_clip_is_reused(self, clips: ClipService) -> None:
+        (clips.clips_dir / "cached.wav").write_bytes(b"RIFF")
+        session = _session(self._row(clip_path="clips/cached.wav"))
+
+        with patch("silvasonic.birdnet.clips.extract_clip") as extract:
+            assert await clips.materialize(session, 42) == "clips/cached.wav"
+        extract.assert_not_called()
+        assert session.execute.await_count == 1
+
+    async def test_clip_of_same_span_is_shared(self, clips: ClipService) -> None:
+        """Another species detected in the same window already has the clip."""
+        (clips.clips_dir / "7_3000_6000.flac").write_bytes(b"fLaC")
+        session = _session(self._row())
+
+        with patch("silvasonic.birdnet.clips.extract_clip") as extract:
+            assert await clips.materialize(session, 42) == "clips/7_3000_6000.flac"
+        extract.assert_not_called()
+
+    @pytest.mark.parametrize("row", [None, "gone"], ids=["unknown", "source_deleted"])
+    async def test_unavailable(self, clips: ClipService, row: str | None) -> None:
+        session = _session(self._row(gone=True) if row else None)
+        assert await clips.materialize(session, 42) is None
+        assert session.execute.await_count == 1
+
+    async def test_materialize_pinned(self, clips: ClipService) -> None:
+        session = _session(self._row())
+
+        assert await clips.materialize_pinned(session, limit=16) == 1
+        select_sql = str(session.execute.await_args_list[0].args[0])
+        assert "detections.pinned IS true" in select_sql
+        assert "detections.clip_path IS NULL" in select_sql
+        assert "detections.clip_attempts <" in select_sql
+        assert "ORDER BY detections.clip_attempts, detections.time" in select_sql
+
+    @pytest.mark.parametrize("failure", ["unreadable", "raises"])
+    async def test_failed_pin_counts_an_attempt(self, clips: ClipService, failure: str) -> None:
+        """A pin whose clip cannot be cut is retried later, not on every sweep forever."""
+        session = _session(self._row())
+        side_effect = None if failure == "unreadable" else RuntimeError("decode error")
+
+        with patch(
+            "silvasonic.birdnet.clips.extract_clip", return_value=None, side_effect=side_effect
+        ):
+            assert await clips.materialize_pinned(session, limit=16) == 0
+        update_sql = str(session.execute.await_args_list[-1].args[0])
+        assert update_sql.startswith("UPDATE detections SET clip_attempts")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestLazyClipMode:
+    @pytest.fixture
+    def birdnet_settings(self) -> BirdnetSettings:
+        return BirdnetSettings(clip_padding_seconds=0.0, clip_mode="lazy")
+
+    async def test_only_best_hit_per_label_gets_a_clip(self, service: BirdNETService) -> None:
+        logits = np.full((3, 2), -10.0, dtype=np.float32)
+        logits[:, 0] = [2.0, 5.0, 3.0]
+        logits[2, 1] = 4.0
+
+        with patch("silvasonic.birdnet.service.sf.write") as write:
+            detections = await service._extract_detections(
+                MagicMock(id=1, time=T0),
+                np.zeros(9 * MODEL_SR, dtype=np.float32),
+                logits,
+                np.array([0, 3, 6]) * MODEL_SR,
+                LabelTable.from_labels(["A_a", "B_b"]),
+                np.ones(2, dtype=bool),
+                False,
+            )
+
+        clipped = {(d.label, d.time - T0) for d in detections if d.clip_path}
+        assert clipped == {("A_a", timedelta(seconds=3)), ("B_b", timedelta(seconds=6))}
+        assert len(detections) == 4
+        assert write.call_count == 2
+        assert not any(d.pinned for d in detections)
+
+    async def test_species_of_one_window_share_a_clip(self, service: BirdNETService) -> None:
+        assert service.birdnet_config is not None
+        service.birdnet_config.clip_mode = "eager"
+        logits = np.full((2, 3), -10.0, dtype=np.float32)
+        logits[0] = [4.0, 3.0, 2.0]
+
+        with patch("silvasonic.birdnet.service.sf.write") as write:
+            detections = await service._extract_detections(
+                MagicMock(id=1, time=T0),
+                np.zeros(6 * MODEL_SR, dtype=np.float32),
+                logits,
+                np.array([0, 3]) * MODEL_SR,
+                LabelTable.from_labels(["A_a", "B_b", "C_c"]),
+                np.ones(3, dtype=bool),
+                False,
+            )
+
+        assert len(detections) == 3
+        assert {d.clip_path for d in detections} == {"clips/1_0_3000.flac"}
+        write.assert_called_once()
+
+    async def test_eager_mode_runs_the_pin_sweep(self, service: BirdNETService) -> None:
+        """Pins whose eager clip write failed are still materialized."""
+        assert service.birdnet_config is not None
+        service.birdnet_config.clip_mode = "eager"
+        session = MagicMock(commit=AsyncMock())
+        ctx = MagicMock()
+        ctx.__aenter__ = AsyncMock(return_value=session)
+        ctx.__aexit__ = AsyncMock(return_value=None)
+        with (
+            patch("silvasonic.birdnet.service.get_session", return_value=ctx),
+            patch.object(ClipService, "materialize_pinned", new=AsyncMock(return_value=2)),
+        ):
+            assert await service._materialize_pins() == 2
+        session.commit.assert_awaited_once()
@@ -0,0 +1,135 @@
+"""Unit tests for merging overlapping detection windows into events."""
+
+import json
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+from silvasonic.birdnet.events import encode_event, merge_windows, single_windows
+from silvasonic.birdnet.inference import logits_to_scores
+from silvasonic.birdnet.labels import LabelTable
+from silvasonic.birdnet.service import MODEL_SR, WINDOW_SAMPLES, BirdNETService
+from silvasonic.core.schemas.detections import DetectionEvent
+from silvasonic.core.schemas.system_config import BirdnetSettings
+
+S = MODEL_SR
+LABELS = LabelTable.from_labels(["Turdus merula_Eurasian Blackbird", "Parus major_Great Tit"])
+T0 = datetime(2026, 5, 1, 4, 0, tzinfo=UTC)
+
+
+def _merge(starts_s: list[float], classes: list[int], scores: list[float], **kw: Any) -> Any:
+    starts = (np.array(starts_s) * S).astype(np.int64)
+    return merge_windows(starts, np.array(classes), np.array(scores), WINDOW_SAMPLES, **kw)
+
+
+@pytest.mark.unit
+class TestMergeWindows:
+    def test_overlapping_windows_of_one_label_merge(self) -> None:
+        events = _merge([0, 1, 2, 8], [0, 0, 0, 0], [0.7, 0.9, 0.6, 0.8])
+
+        assert len(events) == 2
+        assert (events.starts / S).tolist() == [0, 8]
+        assert (events.ends / S).tolist() == [5, 11]
+        assert events.confidence.tolist() == [0.9, 0.8]
+        assert events.hit_scores[events.windows(0)].tolist() == [0.7, 0.9, 0.6]
+
+    def test_touching_windows_merge(self) -> None:
+        """Consecutive windows at overlap 0 form one event."""
+        events = _merge([0, 3, 6], [0, 0, 0], [0.7, 0.8, 0.9])
+        assert len(events) == 1
+        assert (events.ends / S).tolist() == [9]
+
+    def test_labels_and_groups_never_merge(self) -> None:
+        events = _merge([0, 1, 2], [0, 1, 0], [0.7, 0.9, 0.6], groups=np.array([1, 1, 2]))
+
+        assert len(events) == 3
+        assert sorted(zip(events.groups.tolist(), events.classes.tolist(), strict=True)) == [
+            (1, 0),
+            (1, 1),
+            (2, 0),
+        ]
+
+    def test_unsorted_hits(self) -> None:
+        """Hits arrive in (window, class) order; merging sorts them per label."""
+        events = _merge([2, 0, 1], [0, 0, 0], [0.6, 0.7, 0.9])
+        assert len(events) == 1
+        assert events.hit_scores.tolist() == [0.7, 0.9, 0.6]
+
+    def test_no_hits(self) -> None:
+        assert len(_merge([], [], [])) == 0
+
+    def test_event_payload(self) -> None:
+        events = _merge([0, 1, 2, 8], [0, 0, 0, 0], [0.7, 0.9, 0.6, 0.8])
+
+        payload = DetectionEvent.model_validate_json(encode_event(events, 0, S) or "")
+        assert payload.windows == 3
+        assert payload.mean_confidence == pytest.approx(0.7333, abs=1e-4)
+        assert payload.offsets_s == [0.0, 1.0, 2.0]
+        assert payload.scores == [0.7, 0.9, 0.6]
+        # A single window needs no payload
+        assert encode_event(events, 1, S) is None
+
+    def test_single_windows_keep_every_hit(self) -> None:
+        starts = np.array([0, S])
+        events = single_windows(starts, np.array([0, 0]), np.array([0.7, 0.9]), WINDOW_SAMPLES)
+        assert len(events) == 2
+        assert encode_event(events, 0, S) is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestServiceEvents:
+    @pytest.fixture
+    def birdnet_settings(self) -> BirdnetSettings:
+        return BirdnetSettings(overlap=2.0, clip_padding_seconds=0.0, merge_events=True)
+
+    async def _extract(self, service: BirdNETService) -> tuple[list[Any], list[tuple[int, int]]]:
+        """One blackbird song scored by the windows at 0, 1 and 2 s, plus a tit at 6 s."""
+        audio = np.arange(12 * S, dtype=np.float32)
+        starts = np.array([0, 1, 2, 6]) * S
+        logits = np.full((4, 2), -10.0, dtype=np.float32)
+        logits[:3, 0] = [2.0, 5.0, 3.0]
+        logits[3, 1] = 5.0
+
+        clips: list[tuple[int, int]] = []
+
+        def fake_write(path: str, data: np.ndarray, sr: int, **kwargs: Any) -> None:
+            clips.append((int(data[0]), len(data)))
+
+        with patch("silvasonic.birdnet.service.sf.write", side_effect=fake_write):
+            detections = await service._extract_detections(
+                MagicMock(id=1, time=T0),
+                audio,
+                logits,
+                starts,
+                LABELS,
+                np.ones(2, dtype=bool),
+                False,
+            )
+        return detections, clips
+
+    async def test_one_row_and_clip_per_event(self, service: BirdNETService) -> None:
+        detections, clips = await self._extract(service)
+
+        assert len(detections) == 2
+        song = next(d for d in detections if d.label.startswith("Turdus"))
+        assert song.time == T0
+        assert song.end_time == T0 + timedelta(seconds=5)
+        # The best window (logit 5.0) sets the confidence
+        assert song.confidence == pytest.approx(float(logits_to_scores(np.array([5.0]), 1.0)[0]))
+        assert song.clip_path == "clips/1_0_5000.flac"
+        assert json.loads(song.event or "")["windows"] == 3
+        assert json.loads(song.details)["merge_events"] is True
+
+        # The song clip covers all three windows once
+        assert sorted(clips) == [(0, 5 * S), (6 * S, 3 * S)]
+
+    async def test_disabled_keeps_one_row_per_window(self, service: BirdNETService) -> None:
+        assert service.birdnet_config is not None
+        service.birdnet_config.merge_events = False
+        detections, clips = await self._extract(service)
+
+        assert len(detections) == len(clips) == 4
+        assert all(d.event is None for d in detections)
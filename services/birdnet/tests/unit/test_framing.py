@@ -0,0 +1,111 @@
+"""Unit tests for zero-copy sliding-window framing."""
+
+import numpy as np
+import pytest
+from silvasonic.birdnet.framing import (
+    FrameRows,
+    frame_audio,
+    padded_length,
+    refine_rows,
+    window_count,
+)
+
+WINDOW = 30
+MIN_SAMPLES = 15
+
+
+def _reference_windows(audio: np.ndarray, step: int) -> list[np.ndarray]:
+    """Per-window slice + pad loop that the framing layer replaces."""
+    out = []
+    for start in range(0, len(audio), step):
+        chunk = audio[start : start + WINDOW]
+        if len(chunk) < MIN_SAMPLES:
+            break
+        padded = np.zeros(WINDOW, dtype=np.float32)
+        padded[: len(chunk)] = chunk
+        out.append(padded)
+    return out
+
+
+@pytest.mark.unit
+class TestFrameAudio:
+    @pytest.mark.parametrize("step", [30, 25, 15, 10, 1])
+    @pytest.mark.parametrize("length", [14, 15, 29, 30, 44, 45, 100, 101])
+    def test_matches_slice_and_pad_reference(self, step: int, length: int) -> None:
+        audio = np.arange(1, length + 1, dtype=np.float32)
+
+        frames, starts = frame_audio(audio, WINDOW, step, MIN_SAMPLES)
+        expected = _reference_windows(audio, step)
+
+        assert len(frames) == len(expected) == window_count(length, step, MIN_SAMPLES)
+        for row, ref in enumerate(expected):
+            np.testing.assert_array_equal(frames[row], ref)
+        np.testing.assert_array_equal(starts, np.arange(len(expected)) * step)
+
+    def test_view_on_input_when_no_padding_needed(self) -> None:
+        audio = np.ones(90, dtype=np.float32)
+
+        frames, _ = frame_audio(audio, WINDOW, 30, MIN_SAMPLES)
+
+        assert frames.shape == (3, WINDOW)
+        assert np.shares_memory(frames, audio)
+
+    def test_overlap_does_not_multiply_memory(self) -> None:
+        audio = np.ones(100, dtype=np.float32)
+
+        frames, _ = frame_audio(audio, WINDOW, 5, MIN_SAMPLES)
+
+        # 18 overlapping windows, but backed by a single padded buffer
+        assert frames.shape == (18, WINDOW)
+        assert frames.base is not None
+        assert frames.strides == (5 * 4, 4)
+        assert not frames.flags.writeable
+
+    def test_too_short_returns_empty(self) -> None:
+        frames, starts = frame_audio(np.ones(10, dtype=np.float32), WINDOW, 30, MIN_SAMPLES)
+
+        assert frames.shape == (0, WINDOW)
+        assert starts.size == 0
+
+    def test_non_positive_step_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            frame_audio(np.ones(100, dtype=np.float32), WINDOW, 0, MIN_SAMPLES)
+
+    def test_padded_length(self) -> None:
+        assert padded_length(110, WINDOW, 30, MIN_SAMPLES) == 120
+        assert padded_length(100, WINDOW, 30, MIN_SAMPLES) == 100
+        assert padded_length(90, WINDOW, 30, MIN_SAMPLES) == 90
+        assert padded_length(10, WINDOW, 30, MIN_SAMPLES) == 10
+
+
+@pytest.mark.unit
+class TestRefineRows:
+    def test_fine_windows_around_hot_coarse_windows(self) -> None:
+        """Dense windows overlapping a hot coarse window, minus coarse positions."""
+        coarse = np.array([0, 30, 60, 90])
+        fine = np.arange(0, 100, 10)
+        rows = refine_rows(fine, np.array([60]), coarse, WINDOW)
+        np.testing.assert_array_equal(fine[rows], [40, 50, 70, 80])
+
+    def test_adjacent_hot_windows_merge(self) -> None:
+        coarse = np.array([0, 30, 60, 90])
+        fine = np.arange(0, 100, 10)
+        rows = refine_rows(fine, np.array([0, 30]), coarse, WINDOW)
+        np.testing.assert_array_equal(fine[rows], [10, 20, 40, 50])
+
+    def test_nothing_hot(self) -> None:
+        rows = refine_rows(
+            np.arange(0, 100, 10), np.array([], dtype=np.int64), np.arange(4), WINDOW
+        )
+        assert rows.dtype == np.int64
+        assert len(rows) == 0
+
+    def test_frame_rows_gathers_selected_windows(self) -> None:
+        audio = np.arange(100, dtype=np.float32)
+        frames, _ = frame_audio(audio, WINDOW, 10, MIN_SAMPLES)
+        selected = FrameRows(frames, np.array([2, 5]))
+
+        assert len(selected) == 2
+        assert selected.shape == (2, WINDOW)
+        np.testing.assert_array_equal(selected[1:][0], frames[5])
+        np.testing.assert_array_equal(selected[np.array([0])], frames[[2]])
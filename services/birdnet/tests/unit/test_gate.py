@@ -0,0 +1,101 @@
+"""Unit tests for the BirdNET energy pre-gate."""
+
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+from silvasonic.birdnet.gate import band_power_db, gate_windows
+from silvasonic.birdnet.labels import LabelTable
+from silvasonic.birdnet.service import MODEL_SR, WINDOW_SAMPLES, BirdNETService
+from silvasonic.core.schemas.system_config import BirdnetSettings
+
+
+def _tone(freq_hz: float, amplitude: float, seconds: float = 3.0) -> np.ndarray:
+    t = np.arange(int(seconds * MODEL_SR)) / MODEL_SR
+    return (amplitude * np.sin(2 * np.pi * freq_hz * t)).astype(np.float32)
+
+
+@pytest.mark.unit
+class TestBandPower:
+    def test_full_scale_sine_in_band_is_minus_3_dbfs(self) -> None:
+        db = band_power_db(_tone(3000, 1.0)[None, :], MODEL_SR)
+        assert db[0] == pytest.approx(-3.01, abs=0.05)
+
+    def test_out_of_band_energy_is_ignored(self) -> None:
+        """Low-frequency rumble (wind, traffic) does not count as band energy."""
+        db = band_power_db(_tone(200, 1.0)[None, :], MODEL_SR)
+        assert db[0] < -60
+
+    def test_chunked_fft_matches_per_window(self) -> None:
+        frames = np.stack([_tone(2000 + 500 * i, 0.1 * (i + 1)) for i in range(11)])
+        batched = band_power_db(frames, MODEL_SR)
+        single = np.array([band_power_db(f[None, :], MODEL_SR)[0] for f in frames])
+        np.testing.assert_allclose(batched, single, rtol=1e-6)
+
+    def test_disabled_gate_keeps_everything(self) -> None:
+        frames = np.zeros((3, 16), dtype=np.float32)
+        assert gate_windows(frames, MODEL_SR, None).all()
+
+    def test_gate_is_opt_in(self) -> None:
+        """Existing deployments keep scoring every window until a site enables the gate."""
+        assert BirdnetSettings().gate_threshold_db is None
+
+    def test_silence_is_gated(self) -> None:
+        frames = np.stack([np.zeros(WINDOW_SAMPLES, dtype=np.float32), _tone(4000, 0.01)])
+        assert gate_windows(frames, MODEL_SR, -80.0).tolist() == [False, True]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestGatedInference:
+    @pytest.fixture
+    def birdnet_settings(self) -> BirdnetSettings:
+        return BirdnetSettings(batch_size=8, gate_threshold_db=-80.0)
+
+    async def test_only_loud_windows_reach_the_model(
+        self, service: BirdNETService, fake_inference: Callable[..., Any]
+    ) -> None:
+        """Silent windows are skipped, counted, and keep their window index."""
+        # Windows 0 and 2 silent, window 1 carries a 4 kHz tone
+        audio = np.concatenate(
+            [np.zeros(WINDOW_SAMPLES), _tone(4000, 0.1), np.zeros(WINDOW_SAMPLES)]
+        ).astype(np.float32)
+
+        def first_window_hits(batch: np.ndarray) -> np.ndarray:
+            logits = np.full((len(batch), 3), -10.0, dtype=np.float32)
+            logits[0, 1] = 10.0
+            return logits
+
+        model = fake_inference(first_window_hits)
+
+        recording = MagicMock()
+        recording.id = 1
+        recording.time = datetime(2024, 1, 1, tzinfo=UTC)
+
+        with (
+            patch("silvasonic.birdnet.service.sf.read", return_value=(audio, MODEL_SR)),
+            patch("silvasonic.birdnet.service.sf.write"),
+        ):
+            detections = await service._process_recording(
+                recording,
+                Path("/tmp/fake.wav"),
+                None,
+                LabelTable.from_labels(["A_a", "B_b", "C_c"]),
+                np.ones(3, dtype=bool),
+                loc_filter_active=False,
+            )
+
+        assert [len(b) for b in model.batches] == [1]
+        np.testing.assert_array_equal(
+            model.batches[0][0], audio[WINDOW_SAMPLES : 2 * WINDOW_SAMPLES]
+        )
+        assert service.stats.total_windows == 3
+        assert service.stats.total_windows_skipped == 2
+        assert service.get_extra_meta()["analysis"]["windows_skipped"] == 2
+        # The hit maps back to the original (ungated) window index
+        assert len(detections) == 1
+        assert detections[0].time == recording.time.replace(second=3)
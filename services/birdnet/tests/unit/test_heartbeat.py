@@ -1,61 +1,59 @@
 """Unit tests for BirdNET heartbeat and get_extra_meta implementation."""
 
-from pathlib import Path
-from unittest.mock import patch
-
 import pytest
 from silvasonic.birdnet.service import BirdNETService
-
-
-@pytest.fixture
-def mock_service(tmp_path: Path) -> BirdNETService:
-    with patch.dict(
-        "os.environ",
-        {
-            "SILVASONIC_INSTANCE_ID": "test-bnet",
-            "SILVASONIC_WORKSPACE_DIR": str(tmp_path),
-        },
-    ):
-        svc = BirdNETService()
-        return svc
+from silvasonic.core.database.backlog import BacklogCounts
 
 
 @pytest.mark.unit
 class TestBirdNETHeartbeatUnit:
     """Verify heartbeat metadata namespace and metrics integration."""
 
-    def test_get_extra_meta_returns_analysis_namespace(self, mock_service: BirdNETService) -> None:
+    def test_get_extra_meta_returns_analysis_namespace(self, service: BirdNETService) -> None:
         """get_extra_meta() must return a dict with an 'analysis' key."""
-        meta = mock_service.get_extra_meta()
+        meta = service.get_extra_meta()
         assert "analysis" in meta
         assert isinstance(meta["analysis"], dict)
 
-    def test_get_extra_meta_backlog_counter(self, mock_service: BirdNETService) -> None:
-        """The private _backlog_pending counter must be correctly exposed."""
-        mock_service._backlog_pending = 42
-        meta = mock_service.get_extra_meta()
+    def test_get_extra_meta_backlog_counter(self, service: BirdNETService) -> None:
+        """The BirdNET queue gauges must be correctly exposed."""
+        service._backlog.counts = {"birdnet": BacklogCounts(pending=42, claimed=8)}
+        meta = service.get_extra_meta()
         assert meta["analysis"]["backlog_pending"] == 42
+        assert meta["analysis"]["backlog_claimed"] == 8
 
-    def test_get_extra_meta_stats_integration(self, mock_service: BirdNETService) -> None:
+    def test_get_extra_meta_stats_integration(self, service: BirdNETService) -> None:
         """Operational statistics are correctly fetched from BirdnetStats and calculated."""
         # Manually force some stats
-        mock_service.stats.total_analyzed = 10
-        mock_service.stats.total_hits = 15
-        mock_service.stats.total_errors = 2
-        mock_service.stats.total_duration_s = 5.0  # 5000 ms total for 10 items -> 500ms avg
+        service.stats.total_analyzed = 10
+        service.stats.total_hits = 15
+        service.stats.total_errors = 2
+        service.stats.total_duration_s = 5.0  # 5000 ms total for 10 items -> 500ms avg
 
-        meta = mock_service.get_extra_meta()
+        meta = service.get_extra_meta()
 
         assert meta["analysis"]["total_analyzed"] == 10
         assert meta["analysis"]["total_detections"] == 15
         assert meta["analysis"]["total_errors"] == 2
         assert meta["analysis"]["avg_inference_ms"] == 500.0
 
-    def test_get_extra_meta_zero_division_safe(self, mock_service: BirdNETService) -> None:
+    def test_get_extra_meta_zero_division_safe(self, service: BirdNETService) -> None:
         """Ensure avg_inference_ms does not cause ZeroDivisionError when no recordings analyzed."""
-        mock_service.stats.total_analyzed = 0
-        mock_service.stats.total_duration_s = 0.0
+        service.stats.total_analyzed = 0
+        service.stats.total_duration_s = 0.0
 
-        meta = mock_service.get_extra_meta()
+        meta = service.get_extra_meta()
 
         assert meta["analysis"]["avg_inference_ms"] == 0.0
+
+    def test_get_extra_meta_stage_latencies(self, service: BirdNETService) -> None:
+        """Per-stage p50/p95/p99 tell disk, CPU and database stalls apart."""
+        for seconds in (0.1, 0.1, 0.1, 2.0):
+            service.stats.record_stage("commit", seconds)
+
+        stages = service.get_extra_meta()["analysis"]["stages"]
+
+        assert stages["commit"]["count"] == 4
+        assert 50.0 < stages["commit"]["p50_ms"] <= 100.0
+        assert stages["commit"]["p99_ms"] > 1000.0
+        assert stages["inference"]["count"] == 0
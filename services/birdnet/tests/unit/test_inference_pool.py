@@ -0,0 +1,132 @@
+"""Unit tests for the multi-process BirdNET inference pool wiring."""
+
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pytest
+from silvasonic.birdnet import inference
+from silvasonic.birdnet.service import BirdNETService
+from silvasonic.core.schemas.system_config import BirdnetSettings
+
+
+@pytest.fixture
+def birdnet_settings() -> BirdnetSettings:
+    return BirdnetSettings(workers=3)
+
+
+@pytest.mark.unit
+class TestWorkerProcessSide:
+    def test_uninitialized_worker_raises(self) -> None:
+        with (
+            patch.object(inference, "_worker_interpreter", None),
+            pytest.raises(RuntimeError),
+        ):
+            inference._infer_in_worker(np.zeros((1, 4), dtype=np.float32))
+
+    def test_initializer_loads_one_interpreter(self) -> None:
+        with patch.object(inference, "Interpreter") as mock_cls:
+            inference._init_worker("/models/m.tflite", 2)
+
+        mock_cls.assert_called_once_with(model_path="/models/m.tflite", num_threads=2)
+        mock_cls.return_value.allocate_tensors.assert_called_once()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestPoolDispatch:
+    async def test_run_inference_prefers_pool(self, service: BirdNETService) -> None:
+        pool = MagicMock()
+        pool.infer = AsyncMock(return_value=np.ones((2, 5), dtype=np.float32))
+        service._inference_pool = pool
+        batch = np.zeros((2, 4), dtype=np.float32)
+
+        out = await service._run_inference(None, batch)
+
+        pool.infer.assert_awaited_once_with(batch)
+        assert out.shape == (2, 5)
+
+    async def test_run_starts_pool_sized_to_workers(self, service: BirdNETService) -> None:
+        """With workers=3 the loop runs a three-process pool and no local interpreter."""
+        calls: list[Any] = []
+
+        async def fake_batch(interpreter: Any, *args: Any) -> bool:
+            calls.append(interpreter)
+            service._shutdown_event.set()
+            return True
+
+        with (
+            patch("builtins.open"),
+            patch("silvasonic.birdnet.service.InferencePool") as mock_pool_cls,
+            patch("silvasonic.birdnet.service.Interpreter") as mock_interp_cls,
+            patch("silvasonic.birdnet.service.get_session", side_effect=RuntimeError("no db")),
+            patch.object(service, "_analyze_batch", side_effect=fake_batch),
+            patch.object(service, "_refresh_config", new=AsyncMock()),
+        ):
+            mock_pool_cls.return_value.broken = False
+            await service.run()
+
+        mock_pool_cls.assert_called_once()
+        assert mock_pool_cls.call_args.args[1] == 3
+        mock_interp_cls.assert_not_called()
+        assert calls == [None]
+        assert service._workers == 3
+        mock_pool_cls.return_value.shutdown.assert_called_once()
+        assert service._inference_pool is None
+
+    async def test_broken_pool_is_restarted_before_claiming(self, service: BirdNETService) -> None:
+        """While the pool cannot be rebuilt, the worker is unhealthy and claims nothing."""
+        analyze = AsyncMock()
+
+        async def fake_sleep(seconds: float) -> None:
+            service._shutdown_event.set()
+
+        with (
+            patch("builtins.open"),
+            patch("silvasonic.birdnet.service.InferencePool") as mock_pool_cls,
+            patch.object(service, "_analyze_batch", new=analyze),
+            patch.object(service, "_refresh_config", new=AsyncMock()),
+            patch("silvasonic.birdnet.service.asyncio.sleep", side_effect=fake_sleep),
+        ):
+            mock_pool_cls.return_value.broken = True
+            mock_pool_cls.return_value.restart = AsyncMock(return_value=False)
+            await service.run()
+
+        mock_pool_cls.return_value.restart.assert_awaited_once()
+        analyze.assert_not_awaited()
+        assert service.health._components["birdnet"]["healthy"] is False
+        assert service.health._components["birdnet"]["details"] == "inference_pool_broken"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestPoolRecovery:
+    async def test_worker_that_cannot_load_breaks_the_pool(self, tmp_path: Path) -> None:
+        """A worker process dying in its initializer breaks the pool; so does the restart."""
+        pool = inference.InferencePool(str(tmp_path / "missing.tflite"), workers=1)
+        try:
+            with pytest.raises(BrokenProcessPool):
+                await pool.infer(np.zeros((1, 4), dtype=np.float32))
+            assert pool.broken
+
+            assert await pool.restart() is False
+            assert pool.broken
+        finally:
+            pool.shutdown()
+
+    async def test_restart_replaces_the_executor(self) -> None:
+        with patch.object(
+            inference, "ProcessPoolExecutor", side_effect=lambda **kw: ThreadPoolExecutor(1)
+        ):
+            pool = inference.InferencePool("/models/m.tflite", workers=1)
+            old = pool._executor
+            pool.broken = True
+
+            assert await pool.restart() is True
+
+        assert not pool.broken
+        assert pool._executor is not old
+        pool.shutdown()
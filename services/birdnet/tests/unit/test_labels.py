@@ -0,0 +1,66 @@
+"""Unit tests for precomputed BirdNET label metadata."""
+
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from silvasonic.birdnet.labels import LabelTable, load_common_names, split_label
+from sqlalchemy.dialects.postgresql import dialect
+
+RAW = ["Turdus merula_Eurasian Blackbird", "Erithacus rubecula_European Robin", "Noise"]
+
+
+@pytest.mark.unit
+class TestLabelTable:
+    def test_split_label(self) -> None:
+        assert split_label("Turdus merula_Eurasian Blackbird") == (
+            "Turdus merula_Eurasian Blackbird",
+            "Eurasian Blackbird",
+        )
+        assert split_label("Noise") == ("Noise", "")
+
+    def test_metadata_per_class(self) -> None:
+        table = LabelTable.from_labels(RAW)
+
+        assert len(table) == 3
+        assert table.labels.tolist() == RAW
+        assert table.scientific_names.tolist() == ["Turdus merula", "Erithacus rubecula", "Noise"]
+        assert table.common_names.tolist() == ["Eurasian Blackbird", "European Robin", ""]
+
+    def test_from_file_strips_lines(self, tmp_path: Path) -> None:
+        path = tmp_path / "labels.txt"
+        path.write_text("\n".join(RAW) + "\n")
+        assert LabelTable.from_file(path).labels.tolist() == RAW
+
+    def test_common_names_replaced_where_known(self) -> None:
+        table = LabelTable.from_labels(RAW)
+        local = table.with_common_names({RAW[0]: "Amsel"})
+
+        assert local.common_names.tolist() == ["Amsel", "European Robin", ""]
+        # The model table is left untouched for a later locale change
+        assert table.common_names[0] == "Eurasian Blackbird"
+        assert local.scientific_names is table.scientific_names
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestLoadCommonNames:
+    async def test_bulk_query_for_locale(self) -> None:
+        statements: list[Any] = []
+
+        async def execute(stmt: Any) -> MagicMock:
+            statements.append(stmt)
+            result = MagicMock()
+            result.all.return_value = [(RAW[0], "Amsel"), (RAW[1], "")]
+            return result
+
+        session = MagicMock(execute=execute)
+        names = await load_common_names(session, "de")
+
+        # Empty names fall back to the model's common name
+        assert names == {RAW[0]: "Amsel"}
+        (stmt,) = statements
+        sql = str(stmt.compile(dialect=dialect()))  # type: ignore[no-untyped-call]
+        assert "FROM taxonomy" in sql
+        assert "taxonomy.common_names ? " in sql
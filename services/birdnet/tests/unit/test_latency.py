@@ -0,0 +1,58 @@
+"""Unit tests for the fixed-bucket stage latency histograms."""
+
+import pytest
+from silvasonic.birdnet.latency import BUCKET_BOUNDS_MS, LatencyHistogram, percentile
+
+
+@pytest.mark.unit
+class TestLatencyHistogram:
+    def test_empty(self) -> None:
+        assert LatencyHistogram().summary() == {
+            "count": 0,
+            "p50_ms": 0.0,
+            "p95_ms": 0.0,
+            "p99_ms": 0.0,
+        }
+
+    def test_percentiles_interpolate_within_bucket(self) -> None:
+        hist = LatencyHistogram()
+        # 90 samples in (10, 20] ms, 10 in (200, 300] ms
+        for _ in range(90):
+            hist.record(0.015)
+        for _ in range(10):
+            hist.record(0.25)
+
+        summary = hist.summary()
+        assert summary["count"] == 100
+        assert summary["p50_ms"] == pytest.approx(15.6, abs=0.1)
+        assert summary["p95_ms"] == 250.0
+        assert summary["p99_ms"] == 290.0
+
+    def test_bucket_bounds_are_inclusive(self) -> None:
+        hist = LatencyHistogram()
+        hist.record(0.005)
+        assert hist.counts[BUCKET_BOUNDS_MS.index(5)] == 1
+
+    def test_overflow_reports_last_bound(self) -> None:
+        hist = LatencyHistogram()
+        hist.record(500.0)
+        assert hist.summary()["p99_ms"] == BUCKET_BOUNDS_MS[-1]
+
+    def test_summary_since_snapshot(self) -> None:
+        hist = LatencyHistogram()
+        hist.record(2.0)
+        before = hist.snapshot()
+        hist.record(0.001)
+
+        assert hist.summary(since=before) == {
+            "count": 1,
+            "p50_ms": 0.5,
+            "p95_ms": 0.9,
+            "p99_ms": 1.0,
+        }
+        assert hist.count == 2
+
+    def test_percentile_of_counts(self) -> None:
+        counts = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+        counts[BUCKET_BOUNDS_MS.index(1000)] = 4
+        assert percentile(counts, 50) == 750.0
@@ -0,0 +1,293 @@
+"""Unit tests for BirdNET lease-based batch analysis (claim → pipeline → bulk commit)."""
+
+import asyncio
+from concurrent.futures.process import BrokenProcessPool
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pytest
+from silvasonic.birdnet.labels import LabelTable
+from silvasonic.birdnet.service import BirdNETService
+from silvasonic.core.database.analysis_queue import Claim
+from silvasonic.core.schemas.system_config import BirdnetSettings
+
+NO_LABELS = LabelTable.from_labels([])
+LEASE = datetime(2026, 5, 1, 4, 0, tzinfo=UTC)
+
+
+class FakeSession:
+    """Records commits."""
+
+    def __init__(self) -> None:
+        """Start with no commits."""
+        self.commits = 0
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+    async def __aenter__(self) -> "FakeSession":
+        """Act as the ``get_session()`` context manager."""
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        """Nothing to close."""
+
+
+@pytest.fixture
+def service_env(service_env: dict[str, str], tmp_path: Path) -> dict[str, str]:
+    return {**service_env, "SILVASONIC_RECORDINGS_DIR": str(tmp_path)}
+
+
+@pytest.fixture
+def birdnet_settings() -> BirdnetSettings:
+    return BirdnetSettings(claim_batch_size=3)
+
+
+def _recordings(tmp_path: Path, count: int) -> list[Any]:
+    recs: list[Any] = []
+    for rid in range(1, count + 1):
+        (tmp_path / f"{rid}.wav").touch()
+        rec = MagicMock()
+        rec.id = rid
+        rec.file_processed = f"{rid}.wav"
+        recs.append(rec)
+    return recs
+
+
+def _scores(n: int = 1) -> tuple[np.ndarray, np.ndarray]:
+    return np.zeros((n, 2), dtype=np.float32), np.zeros(n, dtype=np.int64)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestLeaseBatches:
+    async def test_empty_queue(self, service: BirdNETService) -> None:
+        session = FakeSession()
+        with (
+            patch("silvasonic.birdnet.service.get_session", return_value=session),
+            patch(
+                "silvasonic.birdnet.service.claim_recordings",
+                new=AsyncMock(return_value=Claim([])),
+            ),
+        ):
+            assert await service._analyze_batch(None, NO_LABELS, MagicMock(), False) is False
+        assert session.commits == 1
+
+    async def test_claim_commits_before_analysis_and_results_in_bulk(
+        self, service: BirdNETService, tmp_path: Path
+    ) -> None:
+        """Claim commit happens before any decode; all results land in one commit."""
+        session = FakeSession()
+        recs = _recordings(tmp_path, 3)
+        recs[1].file_processed = "missing.wav"
+        commits_seen_by_decode: list[int] = []
+
+        async def fake_decode(audio_path: Path, out: np.ndarray | None = None) -> np.ndarray:
+            commits_seen_by_decode.append(session.commits)
+            if audio_path.name == "3.wav":
+                raise ValueError("corrupt")
+            return np.zeros(4, dtype=np.float32)
+
+        async def fake_extract(recording: Any, *args: Any) -> list[Any]:
+            return [MagicMock(recording_id=recording.id)]
+
+        claim = AsyncMock(return_value=Claim(recs, LEASE))
+        complete = AsyncMock(return_value={1, 2, 3})
+        release = AsyncMock()
+        insert = AsyncMock()
+        with (
+            patch("silvasonic.birdnet.service.get_session", return_value=session),
+            patch("silvasonic.birdnet.service.claim_recordings", new=claim),
+            patch("silvasonic.birdnet.service.insert_detections", new=insert),
+            patch("silvasonic.birdnet.service.complete_recordings", new=complete),
+            patch("silvasonic.birdnet.service.release_recordings", new=release),
+            patch.object(service, "_decode_audio", side_effect=fake_decode),
+            patch.object(service, "_infer_audio", new=AsyncMock(return_value=_scores())),
+            patch.object(service, "_extract_detections", side_effect=fake_extract),
+        ):
+            assert await service._analyze_batch(None, NO_LABELS, MagicMock(), False) is True
+
+        assert claim.await_args_list[-1].kwargs["limit"] == 3
+        assert claim.await_args_list[-1].kwargs["lease_s"] == service.env_settings.LEASE_DURATION_S
+        assert commits_seen_by_decode == [1, 1]
+        assert session.commits == 2
+        assert [d.recording_id for d in insert.await_args_list[-1].args[1]] == [1]
+        assert complete.await_args_list[-1].args[3] == LEASE
+        states = complete.await_args_list[-1].args[2]
+        assert states[1] == "done"
+        assert states[2] == "failed_file_missing"
+        assert states[3].startswith("crashed: corrupt")
+        assert release.await_args_list[-1].args[2] == []
+        assert service.stats.total_analyzed == 1
+        assert service.stats.total_errors == 1
+
+    async def test_results_of_lost_leases_are_dropped(
+        self, service: BirdNETService, tmp_path: Path
+    ) -> None:
+        """A recording reclaimed by another worker meanwhile keeps that worker's result."""
+
+        async def fake_extract(recording: Any, *args: Any) -> list[Any]:
+            return [MagicMock(recording_id=recording.id)]
+
+        insert = AsyncMock()
+        with (
+            patch("silvasonic.birdnet.service.get_session", return_value=FakeSession()),
+            patch(
+                "silvasonic.birdnet.service.claim_recordings",
+                new=AsyncMock(return_value=Claim(_recordings(tmp_path, 2), LEASE)),
+            ),
+            patch("silvasonic.birdnet.service.insert_detections", new=insert),
+            # The lease of recording 1 expired and another worker holds it now
+            patch(
+                "silvasonic.birdnet.service.complete_recordings", new=AsyncMock(return_value={2})
+            ),
+            patch("silvasonic.birdnet.service.release_recordings", new=AsyncMock()),
+            patch.object(service, "_decode_audio", new=AsyncMock(return_value=np.zeros(4))),
+            patch.object(service, "_infer_audio", new=AsyncMock(return_value=_scores())),
+            patch.object(service, "_extract_detections", side_effect=fake_extract),
+            patch("silvasonic.birdnet.service.log") as mock_log,
+        ):
+            await service._analyze_batch(None, NO_LABELS, MagicMock(), False)
+
+        assert [d.recording_id for d in insert.await_args_list[-1].args[1]] == [2]
+        assert mock_log.warning.call_args.kwargs["recording_ids"] == [1]
+        assert service.stats.total_analyzed == 1
+
+    async def test_dead_inference_process_retries_the_batch(
+        self, service: BirdNETService, tmp_path: Path
+    ) -> None:
+        """A broken inference pool releases the leases (counting the attempt), not crashes."""
+        release = AsyncMock()
+        complete = AsyncMock(return_value=set())
+        with (
+            patch("silvasonic.birdnet.service.get_session", return_value=FakeSession()),
+            patch(
+                "silvasonic.birdnet.service.claim_recordings",
+                new=AsyncMock(return_value=Claim(_recordings(tmp_path, 2), LEASE)),
+            ),
+            patch("silvasonic.birdnet.service.insert_detections", new=AsyncMock()),
+            patch("silvasonic.birdnet.service.complete_recordings", new=complete),
+            patch("silvasonic.birdnet.service.release_recordings", new=release),
+            patch.object(service, "_decode_audio", new=AsyncMock(return_value=np.zeros(4))),
+            patch.object(
+                service, "_infer_audio", new=AsyncMock(side_effect=BrokenProcessPool("killed"))
+            ),
+        ):
+            await service._analyze_batch(None, NO_LABELS, MagicMock(), False)
+
+        assert complete.await_args_list[-1].args[2] == {}
+        retry = release.await_args_list[-1]
+        assert retry.args[2:] == ([1, 2], LEASE)
+        assert retry.kwargs["attempted"] is True
+        assert service.stats.total_errors == 0
+
+    async def test_shutdown_releases_leases(self, service: BirdNETService, tmp_path: Path) -> None:
+        """Recordings interrupted by shutdown are released, not marked done."""
+        service._shutdown_event.set()
+        complete = AsyncMock(return_value=set())
+        release = AsyncMock()
+        with (
+            patch("silvasonic.birdnet.service.get_session", return_value=FakeSession()),
+            patch(
+                "silvasonic.birdnet.service.claim_recordings",
+                new=AsyncMock(return_value=Claim(_recordings(tmp_path, 2), LEASE)),
+            ),
+            patch("silvasonic.birdnet.service.complete_recordings", new=complete),
+            patch("silvasonic.birdnet.service.release_recordings", new=release),
+        ):
+            await service._analyze_batch(None, NO_LABELS, MagicMock(), False)
+
+        assert complete.await_args_list[-1].args[2] == {}
+        assert release.await_args_list[-1].args[2:] == ([1, 2], LEASE)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestPipeline:
+    async def test_decode_prefetches_while_inference_runs(
+        self, service: BirdNETService, tmp_path: Path
+    ) -> None:
+        """The next recording is decoded before inference on the current one finishes."""
+        events: list[str] = []
+        release_inference = asyncio.Event()
+
+        async def fake_decode(audio_path: Path, out: np.ndarray | None = None) -> np.ndarray:
+            events.append(f"decode {audio_path.stem}")
+            if audio_path.stem == "2":
+                release_inference.set()
+            return np.zeros(4, dtype=np.float32)
+
+        async def fake_score(audio: np.ndarray, interpreter: Any) -> tuple[Any, Any]:
+            await release_inference.wait()
+            events.append("infer")
+            return _scores()
+
+        with (
+            patch.object(service, "_decode_audio", side_effect=fake_decode),
+            patch.object(service, "_infer_audio", side_effect=fake_score),
+            patch.object(service, "_extract_detections", new=AsyncMock(return_value=[])),
+        ):
+            results = await service._run_pipeline(
+                _recordings(tmp_path, 2), None, NO_LABELS, MagicMock(), False
+            )
+
+        assert events[:2] == ["decode 1", "decode 2"]
+        assert [results[rid][0] for rid in (1, 2)] == [("done", []), ("done", [])]
+
+    async def test_one_inference_task_per_worker(
+        self, service: BirdNETService, tmp_path: Path
+    ) -> None:
+        """No more recordings are in inference concurrently than there are workers."""
+        service._workers = 2
+        active = 0
+        peak = 0
+
+        async def fake_score(*args: Any) -> tuple[Any, Any]:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0)
+            active -= 1
+            return _scores()
+
+        with (
+            patch.object(service, "_decode_audio", new=AsyncMock(return_value=np.zeros(4))),
+            patch.object(service, "_infer_audio", side_effect=fake_score),
+            patch.object(service, "_extract_detections", new=AsyncMock(return_value=[])),
+        ):
+            results = await service._run_pipeline(
+                _recordings(tmp_path, 3), None, NO_LABELS, MagicMock(), False
+            )
+
+        assert peak == 2
+        assert len(results) == 3
+
+    async def test_writer_failure_marks_only_that_recording(
+        self, service: BirdNETService, tmp_path: Path
+    ) -> None:
+        """A failing writer stage crashes one recording without stalling the others."""
+
+        async def fake_extract(recording: Any, *args: Any) -> list[Any]:
+            if recording.id == 1:
+                raise OSError("disk full")
+            return ["det"]
+
+        with (
+            patch.object(service, "_decode_audio", new=AsyncMock(return_value=np.zeros(4))),
+            patch.object(service, "_infer_audio", new=AsyncMock(return_value=_scores())),
+            patch.object(service, "_extract_detections", side_effect=fake_extract),
+        ):
+            results = await service._run_pipeline(
+                _recordings(tmp_path, 2), None, NO_LABELS, MagicMock(), False
+            )
+
+        outcome_1 = results[1][0]
+        assert outcome_1 is not None
+        assert outcome_1[0].startswith("crashed: disk full")
+        outcome_2 = results[2][0]
+        assert outcome_2 is not None
+        assert outcome_2[0] == "done"
+        assert len(outcome_2[1]) == 1
@@ -0,0 +1,291 @@
+"""Unit tests for the per-window logit store and vectorized re-scoring."""
+
+import json
+from datetime import UTC, date, datetime
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pytest
+from silvasonic.birdnet.inference import logits_to_scores
+from silvasonic.birdnet.labels import LabelTable
+from silvasonic.birdnet.logit_store import LogitStore, load_day, rescore, stored_days
+from silvasonic.birdnet.rescore import _rescore, rescore_day
+from silvasonic.birdnet.service import MODEL_SR, BirdNETService
+from silvasonic.core.schemas.system_config import BirdnetSettings, SystemSettings
+
+DAY = date(2026, 5, 1)
+
+
+def _logits(n: int, classes: int = 6, seed: int = 0) -> np.ndarray:
+    return np.random.default_rng(seed).normal(0.0, 4.0, (n, classes)).astype(np.float32)
+
+
+@pytest.mark.unit
+class TestLogitStore:
+    def test_full_roundtrip_is_float16(self, tmp_path: Path) -> None:
+        store = LogitStore(tmp_path, "full", 4, num_classes=6, model_version="v2.4", overlap=0.0)
+        logits = _logits(3)
+        store.append(7, DAY, np.array([0, 144000, 288000]), logits)
+
+        day = load_day(tmp_path, DAY, "v2.4")
+        assert len(day) == 3
+        assert day.classes is None
+        assert day.index["recording_id"].tolist() == [7, 7, 7]
+        assert day.index["start"].tolist() == [0, 144000, 288000]
+        np.testing.assert_allclose(day.values, logits, atol=1e-2)
+        assert stored_days(tmp_path) == [DAY]
+
+    def test_top_k_keeps_largest_logits(self, tmp_path: Path) -> None:
+        store = LogitStore(tmp_path, "top_k", 2, num_classes=6, model_version="v2.4", overlap=0.0)
+        logits = np.array([[0, 5, 1, 9, 2, 3]], dtype=np.float32)
+        store.append(1, DAY, np.array([0]), logits)
+
+        day = load_day(tmp_path, DAY, "v2.4")
+        assert day.classes is not None
+        assert sorted(day.classes[0].tolist()) == [1, 3]
+        assert sorted(day.values[0].tolist()) == [5.0, 9.0]
+
+    def test_latest_drops_superseded_rows(self, tmp_path: Path) -> None:
+        """A re-analyzed recording counts once, with its most recent logits."""
+        store = LogitStore(tmp_path, "full", 4, num_classes=6, model_version="v2.4", overlap=0.0)
+        store.append(1, DAY, np.array([0]), np.zeros((1, 6), dtype=np.float32))
+        store.append(2, DAY, np.array([0]), np.zeros((1, 6), dtype=np.float32))
+        store.append(1, DAY, np.array([0]), np.ones((1, 6), dtype=np.float32))
+
+        latest = load_day(tmp_path, DAY, "v2.4").latest()
+        assert latest.index["recording_id"].tolist() == [2, 1]
+        # Rows are selected lazily; the mapped logits are not copied
+        assert isinstance(latest.values, np.memmap)
+        (_, values, _), *_ = latest.chunks()
+        assert values[1].tolist() == [1.0] * 6
+
+    def test_torn_append_is_discarded(self, tmp_path: Path) -> None:
+        """Values written without an index entry never misalign later rows."""
+        store = LogitStore(tmp_path, "full", 4, num_classes=6, model_version="v2.4", overlap=0.0)
+        store.append(1, DAY, np.array([0]), np.zeros((1, 6), dtype=np.float32))
+        with open(tmp_path / DAY.isoformat() / "values.f16", "ab") as f:
+            f.write(np.full(6, 9, dtype=np.float16).tobytes())
+        store.append(2, DAY, np.array([0]), np.ones((1, 6), dtype=np.float32))
+
+        day = load_day(tmp_path, DAY, "v2.4")
+        assert len(day) == 2
+        assert day.values[1].tolist() == [1.0] * 6
+
+    def test_layout_and_model_mismatch_refused(self, tmp_path: Path) -> None:
+        LogitStore(tmp_path, "full", 4, num_classes=6, model_version="v2.4", overlap=0.0).append(
+            1, DAY, np.array([0]), _logits(1)
+        )
+        with pytest.raises(ValueError):
+            LogitStore(
+                tmp_path, "top_k", 4, num_classes=6, model_version="v2.4", overlap=0.0
+            ).append(1, DAY, np.array([0]), _logits(1))
+        with pytest.raises(ValueError):
+            load_day(tmp_path, DAY, "v3.0")
+
+    def test_missing_day_is_empty(self, tmp_path: Path) -> None:
+        assert len(load_day(tmp_path, DAY, "v2.4")) == 0
+        assert stored_days(tmp_path / "nope") == []
+
+
+@pytest.mark.unit
+class TestRescore:
+    @pytest.mark.parametrize("mode", ["full", "top_k"])
+    def test_matches_live_thresholding(self, tmp_path: Path, mode: Any) -> None:
+        """Re-scoring stored logits reproduces the live score matrix hits."""
+        logits = _logits(50, seed=3)
+        store = LogitStore(tmp_path, mode, 6, num_classes=6, model_version="v2.4", overlap=0.0)
+        store.append(1, DAY, np.arange(50) * 144000, logits)
+        allowed = np.array([True, True, False, True, True, True])
+
+        rows, classes, scores = rescore(
+            load_day(tmp_path, DAY, "v2.4"), sensitivity=1.2, threshold=0.7, allowed_mask=allowed
+        )
+
+        live = logits_to_scores(logits, 1.2)
+        exp_rows, exp_cls = np.nonzero((live >= 0.7) & allowed)
+        got = sorted(zip(rows.tolist(), classes.tolist(), strict=True))
+        expected = sorted(zip(exp_rows.tolist(), exp_cls.tolist(), strict=True))
+        # float16 storage may flip hits sitting exactly on the threshold
+        assert len(set(got) ^ set(expected)) <= 1
+        assert np.all(scores >= 0.7)
+
+    @pytest.mark.parametrize("mode", ["full", "top_k"])
+    def test_chunked_rescore_matches_single_block(self, tmp_path: Path, mode: Any) -> None:
+        """Walking the mapped rows in blocks finds the same hits as one block."""
+        store = LogitStore(tmp_path, mode, 3, num_classes=6, model_version="v2.4", overlap=0.0)
+        for rid in range(5):
+            store.append(rid, DAY, np.arange(10) * 144000, _logits(10, seed=rid))
+        store.append(2, DAY, np.arange(10) * 144000, _logits(10, seed=9))
+        day = load_day(tmp_path, DAY, "v2.4").latest()
+        allowed = np.array([True, False, True, True, True, True])
+
+        whole = rescore(day, sensitivity=1.0, threshold=0.6, allowed_mask=allowed)
+        blocks = rescore(day, sensitivity=1.0, threshold=0.6, allowed_mask=allowed, chunk_rows=7)
+
+        for a, b in zip(whole, blocks, strict=True):
+            np.testing.assert_array_equal(a, b)
+        assert len(whole[0]) > 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestStoreFromService:
+    async def test_disabled_by_default(self, service: BirdNETService) -> None:
+        service.birdnet_config = BirdnetSettings()
+        recording = MagicMock(id=1, time=datetime(2026, 5, 1, 23, 0, tzinfo=UTC))
+        await service._store_logits(recording, np.array([0]), _logits(1))
+        assert stored_days(service.logits_dir) == []
+
+    async def test_appends_under_recording_day(self, service: BirdNETService) -> None:
+        service.birdnet_config = BirdnetSettings(logit_store="top_k", logit_top_k=3)
+        recording = MagicMock(id=1, time=datetime(2026, 5, 1, 23, 0, tzinfo=UTC))
+        await service._store_logits(recording, np.array([0, 144000]), _logits(2))
+
+        day = load_day(service.logits_dir, DAY, service.model_version)
+        assert len(day) == 2
+        assert day.values.shape == (2, 3)
+
+    async def test_rescore_day_rebuilds_detections(self, tmp_path: Path) -> None:
+        """Detections are replaced; surviving hits keep their clip and pin, others lose it."""
+        logits = np.full((2, 3), -10.0, dtype=np.float32)
+        logits[1, 2] = 10.0
+        store = LogitStore(tmp_path, "full", 3, num_classes=3, model_version="v2.4", overlap=1.5)
+        store.append(5, DAY, np.array([0, 3 * MODEL_SR]), logits)
+        (tmp_path / "clips").mkdir()
+        for name in ("old.wav", "gone.flac"):
+            (tmp_path / "clips" / name).touch()
+
+        rec_time = datetime(2026, 5, 1, 6, 0, tzinfo=UTC)
+        hit_time = rec_time.replace(second=3)
+        session = MagicMock()
+        session.execute = AsyncMock(
+            side_effect=[
+                MagicMock(all=MagicMock(return_value=[(5, rec_time)])),
+                MagicMock(
+                    all=MagicMock(
+                        return_value=[
+                            (5, hit_time, "C_c", "clips/old.wav", True),
+                            (5, rec_time, "A_a", "clips/gone.flac", False),
+                        ]
+                    )
+                ),
+                MagicMock(),
+            ]
+        )
+        session.commit = AsyncMock()
+        insert = AsyncMock()
+        ctx = MagicMock()
+        ctx.__aenter__ = AsyncMock(return_value=session)
+        ctx.__aexit__ = AsyncMock(return_value=None)
+
+        with (
+            patch("silvasonic.birdnet.rescore.get_session", return_value=ctx),
+            patch("silvasonic.birdnet.rescore.insert_detections", new=insert),
+        ):
+            written = await rescore_day(
+                load_day(tmp_path, DAY, "v2.4"),
+                labels=LabelTable.from_labels(["A_a", "B_b", "C_c"]),
+                birdnet_config=BirdnetSettings(confidence_threshold=0.5, overlap=0.0),
+                system_config=SystemSettings(),
+                allowed_mask=np.ones(3, dtype=bool),
+                loc_filter_active=False,
+                model_version="v2.4",
+                clips_root=tmp_path,
+            )
+
+        assert written == 1
+        (det,) = insert.await_args_list[-1].args[1]
+        assert det.recording_id == 5
+        assert det.time == hit_time
+        assert det.label == "C_c"
+        assert det.clip_path == "clips/old.wav"
+        assert det.pinned is True
+        session.commit.assert_awaited_once()
+        # Run details carry the overlap the windows were stored with
+        assert json.loads(det.details)["overlap"] == 1.5
+        # The clip of the vanished hit has no row left; it is removed with it
+        assert (tmp_path / "clips" / "old.wav").exists()
+        assert not (tmp_path / "clips" / "gone.flac").exists()
+
+    async def test_rescore_day_merges_events(self, tmp_path: Path) -> None:
+        """With merge_events, consecutive hits of one recording become one detection."""
+        logits = np.full((4, 3), -10.0, dtype=np.float32)
+        logits[:, 0] = 10.0
+        store = LogitStore(tmp_path, "full", 3, num_classes=3, model_version="v2.4", overlap=0.0)
+        store.append(5, DAY, np.array([0, 3, 6]) * MODEL_SR, logits[:3])
+        store.append(6, DAY, np.array([0]), logits[3:])
+
+        rec_time = datetime(2026, 5, 1, 6, 0, tzinfo=UTC)
+        session = MagicMock()
+        session.execute = AsyncMock(
+            side_effect=[
+                MagicMock(all=MagicMock(return_value=[(5, rec_time), (6, rec_time)])),
+                MagicMock(all=MagicMock(return_value=[])),
+                MagicMock(),
+            ]
+        )
+        session.commit = AsyncMock()
+        insert = AsyncMock()
+        ctx = MagicMock()
+        ctx.__aenter__ = AsyncMock(return_value=session)
+        ctx.__aexit__ = AsyncMock(return_value=None)
+
+        with (
+            patch("silvasonic.birdnet.rescore.get_session", return_value=ctx),
+            patch("silvasonic.birdnet.rescore.insert_detections", new=insert),
+        ):
+            written = await rescore_day(
+                load_day(tmp_path, DAY, "v2.4"),
+                labels=LabelTable.from_labels(["A_a", "B_b", "C_c"]),
+                birdnet_config=BirdnetSettings(confidence_threshold=0.5, merge_events=True),
+                system_config=SystemSettings(),
+                allowed_mask=np.ones(3, dtype=bool),
+                loc_filter_active=False,
+                model_version="v2.4",
+                clips_root=tmp_path,
+            )
+
+        assert written == 2
+        rows = {det.recording_id: det for det in insert.await_args_list[-1].args[1]}
+        assert rows[5].end_time == rec_time.replace(second=9)
+        assert json.loads(rows[5].event or "")["windows"] == 3
+        assert rows[6].event is None
+
+    async def test_rescore_uses_active_variant_and_skips_other_days(
+        self, service: BirdNETService
+    ) -> None:
+        """Days of the active variant are re-scored; days of another model are skipped."""
+        service.birdnet_config = BirdnetSettings()
+        other_day = date(2026, 5, 2)
+        for day, version in ((DAY, "v2.4-int8"), (other_day, "v2.4")):
+            store = LogitStore(
+                service.logits_dir, "full", 3, num_classes=3, model_version=version, overlap=0.0
+            )
+            store.append(5, day, np.array([0]), _logits(1, classes=3))
+
+        def select_int8() -> Path:
+            service.model_version = "v2.4-int8"
+            return Path("int8.tflite")
+
+        rescore_mock = AsyncMock(return_value=1)
+        with (
+            patch("silvasonic.birdnet.rescore.BirdNETService", return_value=service),
+            patch("silvasonic.birdnet.rescore.LabelTable.from_file"),
+            patch("silvasonic.birdnet.rescore.rescore_day", new=rescore_mock),
+            patch("silvasonic.birdnet.rescore.log") as mock_log,
+            patch.object(service, "load_config", new=AsyncMock()),
+            patch.object(service, "_select_model", side_effect=select_int8),
+            patch.object(service, "_localize_labels", new=AsyncMock()),
+            patch.object(
+                service, "_get_allowed_species_mask", return_value=(np.ones(3, bool), False)
+            ),
+        ):
+            await _rescore(None)
+
+        rescore_mock.assert_awaited_once()
+        assert rescore_mock.await_args_list[0].kwargs["model_version"] == "v2.4-int8"
+        skipped = mock_log.warning.call_args
+        assert skipped.args[0] == "birdnet.rescore_day_skipped"
+        assert skipped.kwargs["day"] == "2026-05-02"
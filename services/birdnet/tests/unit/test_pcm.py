@@ -0,0 +1,124 @@
+"""Unit tests for the memory-mapped 16-bit PCM fast path."""
+
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pytest
+import soundfile as sf  # type: ignore[import-untyped]
+from silvasonic.birdnet.framing import frame_audio
+from silvasonic.birdnet.pcm import Pcm16Frames, open_pcm16, read_wav_header
+from silvasonic.birdnet.service import MODEL_SR, WINDOW_SAMPLES, BirdNETService
+from silvasonic.core.schemas.system_config import BirdnetSettings
+
+
+def _pcm(n: int, seed: int = 0) -> np.ndarray:
+    return np.random.default_rng(seed).integers(-20000, 20000, n).astype(np.int16)
+
+
+def _write(path: Path, samples: np.ndarray, sr: int = MODEL_SR, **kwargs: Any) -> Path:
+    sf.write(path, samples, sr, **kwargs)
+    return path
+
+
+@pytest.mark.unit
+class TestWavHeader:
+    def test_pcm16_layout(self, tmp_path: Path) -> None:
+        path = _write(tmp_path / "a.wav", _pcm(1000), subtype="PCM_16")
+        info = read_wav_header(path)
+        assert info is not None
+        assert (info.sample_rate, info.channels, info.bits_per_sample) == (MODEL_SR, 1, 16)
+        assert info.frames == 1000
+        assert info.data_offset == path.stat().st_size - 2000
+
+    def test_extensible_header(self, tmp_path: Path) -> None:
+        path = _write(tmp_path / "x.wav", _pcm(10), format="WAVEX", subtype="PCM_16")
+        mapped = open_pcm16(path, MODEL_SR)
+        assert mapped is not None
+        assert mapped.tolist() == _pcm(10).tolist()
+
+    def test_truncated_file_clamps_frame_count(self, tmp_path: Path) -> None:
+        """A segment cut off mid-write still yields its complete frames."""
+        path = _write(tmp_path / "t.wav", _pcm(1000), subtype="PCM_16")
+        with open(path, "r+b") as f:
+            f.truncate(path.stat().st_size - 301)
+        info = read_wav_header(path)
+        assert info is not None
+        assert info.frames == 849
+
+    @pytest.mark.parametrize(
+        "sr, kwargs",
+        [
+            (MODEL_SR, {"subtype": "FLOAT"}),
+            (MODEL_SR, {"subtype": "PCM_24"}),
+            (44100, {"subtype": "PCM_16"}),
+        ],
+    )
+    def test_other_formats_use_soundfile(self, tmp_path: Path, sr: int, kwargs: Any) -> None:
+        path = _write(tmp_path / "f.wav", np.zeros(100, dtype=np.float32), sr, **kwargs)
+        assert open_pcm16(path, MODEL_SR) is None
+
+    def test_stereo_and_non_wav_use_soundfile(self, tmp_path: Path) -> None:
+        stereo = _write(tmp_path / "s.wav", np.zeros((10, 2), dtype=np.int16), subtype="PCM_16")
+        flac = _write(tmp_path / "a.flac", _pcm(10))
+        assert open_pcm16(stereo, MODEL_SR) is None
+        assert open_pcm16(flac, MODEL_SR) is None
+        assert open_pcm16(tmp_path / "missing.wav", MODEL_SR) is None
+
+
+@pytest.mark.unit
+class TestPcm16Frames:
+    @pytest.mark.parametrize("seconds", [1.0, 3.0, 7.9, 9.0, 10.0])
+    @pytest.mark.parametrize("overlap", [0.0, 1.5, 2.5])
+    def test_matches_float_framing(self, seconds: float, overlap: float) -> None:
+        """Lazy windows equal frame_audio() on the soundfile-decoded signal."""
+        pcm = _pcm(int(seconds * MODEL_SR))
+        step = int((3.0 - overlap) * MODEL_SR)
+        min_samples = int(1.5 * MODEL_SR)
+        expected, starts = frame_audio(
+            pcm.astype(np.float32) / 32768.0, WINDOW_SAMPLES, step, min_samples
+        )
+
+        frames = Pcm16Frames(pcm, WINDOW_SAMPLES, step, min_samples)
+
+        assert frames.shape == expected.shape
+        np.testing.assert_array_equal(frames.starts, starts)
+        np.testing.assert_array_equal(frames[0 : len(frames)], expected)
+        picked = np.arange(len(frames))[::2]
+        np.testing.assert_array_equal(frames[picked], expected[picked])
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestMappedDecode:
+    @pytest.fixture
+    def birdnet_settings(self) -> BirdnetSettings:
+        return BirdnetSettings(batch_size=2, overlap=1.0, gate_threshold_db=None)
+
+    async def test_processed_segment_is_memory_mapped(
+        self, service: BirdNETService, tmp_path: Path
+    ) -> None:
+        path = _write(tmp_path / "seg.wav", _pcm(MODEL_SR), subtype="PCM_16")
+        audio = await service._decode_audio(path, out=np.zeros(2 * MODEL_SR, dtype=np.float32))
+        assert isinstance(audio, np.memmap)
+        assert audio.dtype == np.int16
+
+    async def test_inference_batches_match_soundfile_decode(
+        self, service: BirdNETService, tmp_path: Path, fake_inference: Callable[..., Any]
+    ) -> None:
+        """The fast path feeds the model exactly what the soundfile path would."""
+        path = _write(tmp_path / "seg.wav", _pcm(int(8.2 * MODEL_SR)), subtype="PCM_16")
+        model = fake_inference(lambda batch: np.zeros((len(batch), 2), dtype=np.float32))
+
+        mapped = await service._decode_audio(path)
+        _, mapped_starts = await service._infer_audio(mapped, None)
+        mapped_batches = model.windows
+        model.batches.clear()
+
+        decoded, _ = sf.read(path, dtype="float32")
+        _, decoded_starts = await service._infer_audio(decoded, None)
+        decoded_batches = model.windows
+
+        np.testing.assert_array_equal(mapped_starts, decoded_starts)
+        np.testing.assert_array_equal(mapped_batches, decoded_batches)
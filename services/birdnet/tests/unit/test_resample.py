@@ -0,0 +1,81 @@
+"""Unit tests for streaming polyphase resampling of raw-only recordings."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+import soundfile as sf  # type: ignore[import-untyped]
+from silvasonic.birdnet.resample import (
+    KAISER_BETA,
+    ROLLOFF,
+    StreamResampler,
+    output_length,
+    polyphase_bank,
+    resample,
+)
+from silvasonic.birdnet.service import MODEL_SR, BirdNETService
+
+
+def _reference(x: np.ndarray, src: int, dst: int) -> np.ndarray:
+    """Zero-stuff, filter with the full prototype, decimate (slow but obvious)."""
+    up, down, delay, _ = polyphase_bank(src, dst)
+    ratio = max(up, down)
+    n = np.arange(-delay, delay + 1)
+    cutoff = ROLLOFF * 0.5 / ratio
+    h = 2 * cutoff * np.sinc(2 * cutoff * n) * np.kaiser(len(n), KAISER_BETA) * up
+    stuffed = np.zeros(len(x) * up)
+    stuffed[::up] = x
+    filtered = np.convolve(stuffed, h)
+    return filtered[np.arange(output_length(len(x), src, dst)) * down + delay]
+
+
+def _tone(freq: float, sr: int, seconds: float) -> np.ndarray:
+    t = np.arange(int(seconds * sr)) / sr
+    return np.sin(2 * np.pi * freq * t).astype(np.float32)
+
+
+@pytest.mark.unit
+class TestPolyphaseResampler:
+    @pytest.mark.parametrize("src", [44100, 96000, 192000, 384000])
+    def test_matches_direct_convolution(self, src: int) -> None:
+        x = np.random.default_rng(0).standard_normal(3001).astype(np.float32)
+        np.testing.assert_allclose(
+            resample(x, src, MODEL_SR, block=517), _reference(x, src, MODEL_SR), atol=1e-5
+        )
+
+    def test_block_size_does_not_change_output(self) -> None:
+        x = np.random.default_rng(1).standard_normal(20000).astype(np.float32)
+        whole = resample(x, 96000, MODEL_SR, block=len(x))
+        streamed = resample(x, 96000, MODEL_SR, block=97)
+        np.testing.assert_allclose(whole, streamed, atol=1e-6)
+
+    def test_filter_bank_is_cached(self) -> None:
+        assert StreamResampler(384000, MODEL_SR).bank is polyphase_bank(384000, MODEL_SR)[3]
+
+    def test_passband_kept_and_ultrasound_rejected(self) -> None:
+        """A 5 kHz call survives; a 60 kHz bat call must not alias into the band."""
+        src = 384000
+        bird = resample(_tone(5000, src, 1.0), src, MODEL_SR)
+        bat = resample(_tone(60000, src, 1.0), src, MODEL_SR)
+
+        core = slice(1000, -1000)
+        np.testing.assert_allclose(bird[core], _tone(5000, MODEL_SR, 1.0)[core], atol=1e-3)
+        assert np.sqrt(np.mean(bat[core] ** 2)) < 1e-3
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestRawDecode:
+    async def test_high_rate_stereo_is_resampled_into_buffer(
+        self, service: BirdNETService, tmp_path: Path
+    ) -> None:
+        tone = 0.5 * _tone(4000, 192000, 2.0)
+        sf.write(tmp_path / "raw.wav", np.stack([tone, tone], axis=1), 192000, subtype="FLOAT")
+        buffer = np.zeros(3 * MODEL_SR, dtype=np.float32)
+
+        audio = await service._decode_audio(tmp_path / "raw.wav", out=buffer)
+
+        assert len(audio) == 2 * MODEL_SR
+        assert np.shares_memory(audio, buffer)
+        core = slice(1000, -1000)
+        np.testing.assert_allclose(audio[core], 0.5 * _tone(4000, MODEL_SR, 2.0)[core], atol=1e-3)
@@ -0,0 +1,191 @@
+"""Unit tests for the cached 48-week species location mask."""
+
+import json
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+from silvasonic.birdnet.labels import LabelTable
+from silvasonic.birdnet.service import MODEL_SR, BirdNETService
+from silvasonic.birdnet.species_mask import (
+    CACHE_FILENAME,
+    WEEKS,
+    compute_week_table,
+    mask_for,
+    week_48,
+    week_table,
+)
+from silvasonic.core.schemas.system_config import BirdnetSettings, SystemSettings
+
+META = Path("/models/BirdNET_GLOBAL_6K_V2.4_MData_Model_V2_FP16.tflite")
+
+SUMMER = datetime(2026, 6, 15, 5, 0, tzinfo=UTC)
+WINTER = datetime(2026, 1, 10, 5, 0, tzinfo=UTC)
+
+
+class FakeMetaModel:
+    """Meta-model stand-in: class 0 is a summer visitor, class 1 is resident."""
+
+    def __init__(self, batched: bool = True) -> None:
+        """Optionally reject batch resizing like a fixed-shape model."""
+        self.batched = batched
+        self.invokes = 0
+        self._input: np.ndarray | None = None
+
+    def allocate_tensors(self) -> None:
+        pass
+
+    def get_input_details(self) -> list[dict[str, Any]]:
+        return [{"index": 0}]
+
+    def get_output_details(self) -> list[dict[str, Any]]:
+        return [{"index": 1}]
+
+    def resize_tensor_input(self, index: int, shape: list[int]) -> None:
+        if shape[0] != 1 and not self.batched:
+            raise RuntimeError("batch dimension is fixed")
+
+    def set_tensor(self, index: int, value: np.ndarray) -> None:
+        self._input = value
+
+    def invoke(self) -> None:
+        self.invokes += 1
+
+    def get_tensor(self, index: int) -> np.ndarray:
+        assert self._input is not None
+        weeks = self._input[:, 2]
+        summer = ((weeks >= 15) & (weeks <= 32)).astype(np.float32)
+        return np.stack([summer * 0.5, np.full(len(weeks), 0.9)], axis=1)
+
+
+def _patch_meta(model: FakeMetaModel) -> Any:
+    return patch("silvasonic.birdnet.species_mask.Interpreter", return_value=model)
+
+
+@pytest.mark.unit
+class TestWeekTable:
+    def test_week_48_range(self) -> None:
+        assert week_48(datetime(2026, 1, 1, tzinfo=UTC)) == 1
+        assert week_48(datetime(2026, 12, 28, tzinfo=UTC)) == WEEKS
+        assert week_48(SUMMER) == 23
+
+    def test_mask_for_selects_week_row(self) -> None:
+        table = np.zeros((WEEKS, 3), dtype=bool)
+        table[week_48(SUMMER) - 1] = [True, False, True]
+        assert mask_for(table, SUMMER).tolist() == [True, False, True]
+        assert not mask_for(table, WINTER).any()
+
+    def test_static_mask_passes_through(self) -> None:
+        static = np.array([True, False])
+        assert mask_for(static, SUMMER) is static
+
+    def test_one_batched_invoke_for_all_weeks(self) -> None:
+        model = FakeMetaModel()
+        with _patch_meta(model):
+            table = compute_week_table(META, 52.5, 13.4)
+
+        assert model.invokes == 1
+        assert table.shape == (WEEKS, 2)
+        assert table[:, 1].all()
+        assert mask_for(table, SUMMER)[0]
+        assert not mask_for(table, WINTER)[0]
+
+    def test_fixed_batch_model_falls_back_to_per_week(self) -> None:
+        model = FakeMetaModel(batched=False)
+        with _patch_meta(model):
+            table = compute_week_table(META, 52.5, 13.4)
+
+        assert model.invokes == WEEKS
+        assert mask_for(table, SUMMER)[0]
+
+    def test_table_persisted_and_reused(self, tmp_path: Path) -> None:
+        with _patch_meta(FakeMetaModel()) as factory:
+            first = week_table(tmp_path, META, 52.5, 13.4, num_classes=2)
+            second = week_table(tmp_path, META, 52.5, 13.4, num_classes=2)
+
+        assert factory.call_count == 1
+        assert (tmp_path / CACHE_FILENAME).exists()
+        np.testing.assert_array_equal(first, second)
+
+    @pytest.mark.parametrize(
+        ("lat", "lon", "meta", "classes"),
+        [
+            (48.1, 13.4, META, 2),
+            (52.5, 13.4, META.with_name("MData_V3.tflite"), 2),
+            (52.5, 13.4, META, 3),
+        ],
+        ids=["moved", "new_meta_model", "new_labels"],
+    )
+    def test_stale_cache_recomputed(
+        self, tmp_path: Path, lat: float, lon: float, meta: Path, classes: int
+    ) -> None:
+        with _patch_meta(FakeMetaModel()):
+            week_table(tmp_path, META, 52.5, 13.4, num_classes=2)
+        with _patch_meta(FakeMetaModel()) as factory:
+            week_table(tmp_path, meta, lat, lon, num_classes=classes)
+
+        assert factory.call_count == 1
+
+    def test_corrupt_cache_recomputed(self, tmp_path: Path) -> None:
+        (tmp_path / CACHE_FILENAME).write_bytes(b"garbage")
+        with _patch_meta(FakeMetaModel()) as factory:
+            table = week_table(tmp_path, META, 52.5, 13.4, num_classes=2)
+
+        assert factory.call_count == 1
+        assert table.shape == (WEEKS, 2)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestServiceMask:
+    @pytest.fixture
+    def birdnet_settings(self) -> BirdnetSettings:
+        return BirdnetSettings(clip_padding_seconds=0.0)
+
+    @pytest.fixture
+    def system_settings(self) -> SystemSettings:
+        return SystemSettings(latitude=52.5, longitude=13.4)
+
+    async def test_no_location_allows_everything(self, service: BirdNETService) -> None:
+        assert service.system_config is not None
+        service.system_config.latitude = None
+        mask, active = service._get_allowed_species_mask(["a_A", "b_B"])
+        assert active is False
+        assert mask.tolist() == [True, True]
+
+    async def test_location_yields_cached_week_table(
+        self, service: BirdNETService, tmp_path: Path
+    ) -> None:
+        with _patch_meta(FakeMetaModel()):
+            mask, active = service._get_allowed_species_mask(["a_A", "b_B"])
+
+        assert active is True
+        assert mask.shape == (WEEKS, 2)
+        assert (tmp_path / CACHE_FILENAME).exists()
+
+    @pytest.mark.parametrize(("when", "hits"), [(SUMMER, 1), (WINTER, 0)])
+    async def test_detections_use_the_recording_season(
+        self, service: BirdNETService, when: datetime, hits: int
+    ) -> None:
+        """A backlog recording from winter is filtered with the winter mask."""
+        with _patch_meta(FakeMetaModel()):
+            table, active = service._get_allowed_species_mask(["a_A", "b_B"])
+
+        recording = MagicMock(id=1, time=when)
+        logits = np.array([[10.0, -10.0]], dtype=np.float32)
+        detections = await service._extract_detections(
+            recording,
+            np.zeros(3 * MODEL_SR, dtype=np.float32),
+            logits,
+            np.array([0]),
+            LabelTable.from_labels(["a_A", "b_B"]),
+            table,
+            active,
+        )
+
+        assert len(detections) == hits
+        if detections:
+            assert json.loads(detections[0].details)["week"] == week_48(when)
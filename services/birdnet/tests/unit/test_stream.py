@@ -0,0 +1,245 @@
+"""Unit tests for cross-segment stream analysis (grouping, attribution, pipeline)."""
+
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pytest
+import soundfile as sf  # type: ignore[import-untyped]
+from silvasonic.birdnet.labels import LabelTable
+from silvasonic.birdnet.service import MODEL_SR, BirdNETService
+from silvasonic.birdnet.stream import (
+    SegmentKey,
+    attribute_windows,
+    group_streams,
+    segment_key,
+)
+from silvasonic.core.database.models.recordings import Recording
+from silvasonic.core.schemas.system_config import BirdnetSettings
+
+T0 = datetime(2026, 5, 1, 4, 0, tzinfo=UTC)
+
+
+def _rec(
+    rid: int,
+    seq: int,
+    run_id: str = "1a2b3c4d",
+    sensor: str = "mic-01",
+    duration: float = 10.0,
+) -> Recording:
+    name = f"{sensor}/data/processed/2026-05-01T04-00-00Z_10s_{run_id}_{seq:08d}.wav"
+    return Recording(
+        id=rid,
+        time=T0 + timedelta(seconds=seq * duration),
+        sensor_id=sensor,
+        file_raw=name.replace("processed", "raw"),
+        file_processed=name,
+        duration=duration,
+    )
+
+
+def _ids(streams: list[list[Recording]]) -> list[list[int]]:
+    return [[r.id for r in stream] for stream in streams]
+
+
+@pytest.mark.unit
+class TestGrouping:
+    def test_segment_key_from_filename(self) -> None:
+        assert segment_key(_rec(1, 7)) == SegmentKey("mic-01", "1a2b3c4d", 7)
+
+    def test_foreign_filename_has_no_key(self) -> None:
+        rec = _rec(1, 0)
+        rec.file_processed = "mic-01/data/processed/import.wav"
+        assert segment_key(rec) is None
+
+    def test_consecutive_segments_form_one_stream(self) -> None:
+        recs = [_rec(3, 2), _rec(1, 0), _rec(2, 1)]
+        assert _ids(group_streams(recs, 60 * MODEL_SR, MODEL_SR)) == [[1, 2, 3]]
+
+    @pytest.mark.parametrize(
+        "second",
+        [
+            _rec(2, 1, run_id="deadbeef"),
+            _rec(2, 1, sensor="mic-02"),
+            _rec(2, 2),
+        ],
+        ids=["new_run", "other_sensor", "gap"],
+    )
+    def test_streams_break_between_runs_and_gaps(self, second: Recording) -> None:
+        streams = group_streams([_rec(1, 0), second], 60 * MODEL_SR, MODEL_SR)
+        assert _ids(streams) == [[1], [2]]
+
+    def test_stream_length_bounded_by_buffer(self) -> None:
+        recs = [_rec(i + 1, i) for i in range(5)]
+        streams = group_streams(recs, 20 * MODEL_SR, MODEL_SR)
+        assert _ids(streams) == [[1, 2], [3, 4], [5]]
+
+    def test_streams_keep_claim_order(self) -> None:
+        """Newest-first claims stay newest-first across streams."""
+        recs = [_rec(4, 1, sensor="mic-02"), _rec(3, 0, sensor="mic-02"), _rec(2, 5), _rec(1, 4)]
+        assert _ids(group_streams(recs, 60 * MODEL_SR, MODEL_SR)) == [[3, 4], [1, 2]]
+
+    def test_attribution_by_window_start(self) -> None:
+        starts = np.array([0, 3, 6, 9, 12]) * MODEL_SR
+        offsets = [0, int(4.5 * MODEL_SR), 9 * MODEL_SR]
+        np.testing.assert_array_equal(attribute_windows(starts, offsets), [0, 0, 1, 2, 2])
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestStreamPipeline:
+    @pytest.fixture
+    def service_env(self, service_env: dict[str, str], tmp_path: Path) -> dict[str, str]:
+        return {
+            **service_env,
+            "SILVASONIC_WORKSPACE_DIR": str(tmp_path / "birdnet"),
+            "SILVASONIC_RECORDINGS_DIR": str(tmp_path),
+        }
+
+    @pytest.fixture
+    def birdnet_settings(self) -> BirdnetSettings:
+        return BirdnetSettings(
+            gate_threshold_db=None, clip_padding_seconds=0.0, stream_analysis=True
+        )
+
+    def _segments(self, tmp_path: Path) -> list[Recording]:
+        """Three 4.5 s segments of one run; sample values encode the stream position."""
+        recs = [_rec(i + 1, i, duration=4.5) for i in range(3)]
+        n = int(4.5 * MODEL_SR)
+        for i, rec in enumerate(recs):
+            assert rec.file_processed is not None
+            path = tmp_path / rec.file_processed
+            path.parent.mkdir(parents=True, exist_ok=True)
+            sf.write(path, np.full(n, (i + 1) / 8, dtype=np.float32), MODEL_SR, subtype="PCM_16")
+        return recs
+
+    @pytest.fixture(autouse=True)
+    def _model(self, fake_inference: Callable[..., Any]) -> None:
+        # Every window is a confident hit of class 0
+        self.model = fake_inference(
+            lambda batch: np.tile(np.array([10.0, -10.0], dtype=np.float32), (len(batch), 1))
+        )
+
+    async def _run(self, service: BirdNETService, recs: list[Recording]) -> dict[int, Any]:
+        results = await service._run_pipeline(
+            recs,
+            None,
+            LabelTable.from_labels(["Turdus merula_Eurasian Blackbird", "A_B"]),
+            np.ones(2, bool),
+            False,
+        )
+        self.windows = self.model.windows
+        return results
+
+    async def test_windows_span_segment_boundaries(
+        self, service: BirdNETService, tmp_path: Path
+    ) -> None:
+        """One 13.5 s stream: the 3-6 s window holds audio of the first two segments."""
+        results = await self._run(service, self._segments(tmp_path))
+
+        assert len(self.windows) == 5
+        boundary = int(1.5 * MODEL_SR)
+        np.testing.assert_allclose(self.windows[1, :boundary], 1 / 8)
+        np.testing.assert_allclose(self.windows[1, boundary:], 2 / 8)
+        # The tail window of a segment is no longer zero-padded
+        assert np.all(self.windows[:-1] != 0)
+
+        counts = {rid: len(results[rid][0][1]) for rid in (1, 2, 3)}
+        assert counts == {1: 2, 2: 1, 3: 2}
+        assert all(results[rid][0][0] == "done" for rid in (1, 2, 3))
+
+    async def test_detections_attributed_to_their_recording(
+        self, service: BirdNETService, tmp_path: Path
+    ) -> None:
+        """Detection times and IDs refer to the segment the window starts in."""
+        recs = self._segments(tmp_path)
+        results = await self._run(service, recs)
+
+        (det,) = results[2][0][1]
+        assert det.recording_id == 2
+        # Stream window at 6 s starts 1.5 s into the second segment
+        assert det.time == recs[1].time + timedelta(seconds=1.5)
+        assert det.clip_path is not None
+        assert det.clip_path == "clips/2_1500_4500.flac"
+
+    async def test_disabled_analyzes_segments_in_isolation(
+        self, service: BirdNETService, tmp_path: Path
+    ) -> None:
+        assert service.birdnet_config is not None
+        service.birdnet_config.stream_analysis = False
+        results = await self._run(service, self._segments(tmp_path))
+
+        # Two windows per 4.5 s segment, the second one zero-padded
+        assert len(self.windows) == 6
+        assert {rid: len(results[rid][0][1]) for rid in (1, 2, 3)} == {1: 2, 2: 2, 3: 2}
+        assert np.all(self.windows[1, int(1.5 * MODEL_SR) :] == 0)
+
+    async def test_failed_segment_splits_the_stream(
+        self, service: BirdNETService, tmp_path: Path
+    ) -> None:
+        recs = self._segments(tmp_path)
+        assert recs[1].file_processed is not None
+        (tmp_path / recs[1].file_processed).write_bytes(b"not a wav")
+
+        results = await self._run(service, recs)
+
+        assert results[2][0][0].startswith("crashed:")
+        assert results[1][0][0] == "done"
+        assert results[3][0][0] == "done"
+        assert len(self.windows) == 4
+
+    async def test_merged_event_spans_segments(
+        self, service: BirdNETService, tmp_path: Path
+    ) -> None:
+        """A song across the boundaries is one detection of the segment it starts in."""
+        assert service.birdnet_config is not None
+        service.birdnet_config.merge_events = True
+        recs = self._segments(tmp_path)
+        results = await self._run(service, recs)
+
+        assert {rid: len(results[rid][0][1]) for rid in (1, 2, 3)} == {1: 1, 2: 0, 3: 0}
+        (det,) = results[1][0][1]
+        assert det.time == recs[0].time
+        assert det.end_time == recs[0].time + timedelta(seconds=15)
+        assert det.clip_path is not None
+        assert det.clip_path == "clips/1_0_15000.flac"
+
+    def _gated_segments(self, tmp_path: Path, silent: int) -> list[Recording]:
+        """Three 3 s segments of noise, one of them silent (every window gated)."""
+        recs = [_rec(i + 1, i, duration=3.0) for i in range(3)]
+        rng = np.random.default_rng(0)
+        for i, rec in enumerate(recs):
+            assert rec.file_processed is not None
+            path = tmp_path / rec.file_processed
+            path.parent.mkdir(parents=True, exist_ok=True)
+            audio = rng.normal(0, 0.1, 3 * MODEL_SR) * (i != silent)
+            sf.write(path, audio, MODEL_SR, subtype="PCM_16")
+        return recs
+
+    @pytest.mark.parametrize(
+        ("silent", "expected"),
+        [(0, {1: 0, 2: 1, 3: 0}), (2, {1: 1, 2: 0, 3: 0})],
+        ids=["first", "last"],
+    )
+    async def test_merged_events_with_gated_segment(
+        self,
+        service: BirdNETService,
+        tmp_path: Path,
+        silent: int,
+        expected: dict[int, int],
+    ) -> None:
+        """A segment without scored windows gets no detections and crashes nothing."""
+        assert service.birdnet_config is not None
+        service.birdnet_config.merge_events = True
+        service.birdnet_config.gate_threshold_db = -80.0
+        recs = self._gated_segments(tmp_path, silent)
+
+        results = await self._run(service, recs)
+
+        assert len(self.windows) == 2
+        assert all(results[rid][0][0] == "done" for rid in (1, 2, 3))
+        assert {rid: len(results[rid][0][1]) for rid in (1, 2, 3)} == expected
+        (det,) = [d for rid in (1, 2, 3) for d in results[rid][0][1]]
+        assert det.end_time - det.time == timedelta(seconds=6)
@@ -0,0 +1,145 @@
+"""Unit tests for BirdNET model variants and their validation gate."""
+
+import json
+import os
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+import soundfile as sf  # type: ignore[import-untyped]
+from silvasonic.birdnet.labels import LabelTable
+from silvasonic.birdnet.service import MODEL_SR, WINDOW_SAMPLES, BirdNETService
+from silvasonic.birdnet.validate import (
+    Scored,
+    compare,
+    expected_species,
+    hit_agreement,
+    score_fixtures,
+)
+from silvasonic.birdnet.variants import file_sha256, load_reports, model_path, refusal
+from silvasonic.core.schemas.system_config import BirdnetSettings
+
+
+@pytest.fixture
+def int8(tmp_path: Path) -> Path:
+    path = model_path(tmp_path, "INT8")
+    path.write_bytes(b"int8 model")
+    return path
+
+
+def _report(path: Path, agreement: float = 0.97) -> dict[str, dict[str, object]]:
+    return {"INT8": {"sha256": file_sha256(path), "agreement": agreement}}
+
+
+@pytest.mark.unit
+class TestRefusal:
+    def test_reference_needs_no_report(self, tmp_path: Path) -> None:
+        assert refusal("FP32", model_path(tmp_path, "FP32"), {}, 0.95) is None
+
+    def test_validated_variant_passes(self, int8: Path) -> None:
+        assert refusal("INT8", int8, _report(int8), 0.95) is None
+
+    def test_reasons(self, tmp_path: Path, int8: Path) -> None:
+        assert refusal("FP16", model_path(tmp_path, "FP16"), {}, 0.95) == "model file missing"
+        assert refusal("INT8", int8, {}, 0.95) == "not validated"
+        assert refusal("INT8", int8, _report(int8, 0.9), 0.95) == "agreement 0.9 below floor 0.95"
+        reports = _report(int8)
+        int8.write_bytes(b"another int8 model")
+        assert refusal("INT8", int8, reports, 0.95) == "model file changed since validation"
+
+    def test_load_reports(self, tmp_path: Path) -> None:
+        path = tmp_path / "model_variants.json"
+        assert load_reports(path) == {}
+        path.write_text("{not json")
+        assert load_reports(path) == {}
+        path.write_text(json.dumps({"INT8": {"agreement": 0.97}}))
+        assert load_reports(path) == {"INT8": {"agreement": 0.97}}
+
+
+@pytest.mark.unit
+class TestSelectModel:
+    @pytest.fixture
+    def birdnet_settings(self) -> BirdnetSettings:
+        return BirdnetSettings(model_variant="INT8")
+
+    def test_validated_variant_is_loaded(
+        self, service: BirdNETService, tmp_path: Path, int8: Path
+    ) -> None:
+        service.variant_reports_path.write_text(json.dumps(_report(int8)))
+
+        with patch("silvasonic.birdnet.service.MODEL_DIR", tmp_path):
+            assert service._select_model() == int8
+
+        assert service.model_version == "v2.4-int8"
+        assert service.get_extra_meta()["analysis"]["model_variant"] == "INT8"
+
+    def test_refused_variant_falls_back_to_fp32(
+        self, service: BirdNETService, tmp_path: Path, int8: Path
+    ) -> None:
+        service.variant_reports_path.write_text(json.dumps(_report(int8, 0.8)))
+
+        with patch("silvasonic.birdnet.service.MODEL_DIR", tmp_path):
+            path = service._select_model()
+
+        assert path.name == "BirdNET_GLOBAL_6K_V2.4_Model_FP32.tflite"
+        assert service.model_variant == "FP32"
+        assert service.model_version == "v2.4"
+
+
+@pytest.mark.unit
+class TestCompare:
+    def test_expected_species(self) -> None:
+        assert expected_species(Path("XC1 - Common Blackbird - Turdus merula.wav")) == (
+            "Turdus merula"
+        )
+        assert expected_species(Path("field.wav")) is None
+
+    def test_hit_agreement(self) -> None:
+        ref = np.array([[True, False], [True, True]])
+        assert hit_agreement(ref, ref) == 1.0
+        assert hit_agreement(ref, np.array([[True, False], [False, False]])) == 0.5
+        assert hit_agreement(ref & False, ref & False) == 1.0
+
+    def test_variant_report(self) -> None:
+        labels = LabelTable.from_labels(["Turdus merula_Blackbird", "Parus major_Great Tit"])
+        files = [Path("XC1 - Blackbird - Turdus merula.wav"), Path("XC2 - Tit - Parus major.wav")]
+        # Per file: (windows, classes) logits; FP32 hits the labelled species
+        ref = Scored([np.array([[5.0, -5.0]]), np.array([[-5.0, 5.0]])], [40.0, 40.0])
+        # The variant misses the tit and ranks the blackbird first instead
+        cand = Scored([np.array([[5.0, -5.0]]), np.array([[-1.0, -2.0]])], [10.0, 20.0])
+
+        report = compare("INT8", "abc", ref, cand, files, labels, 0.65, 1.0)
+
+        assert report.agreement == pytest.approx(2 / 3, abs=1e-4)
+        assert report.top1_agreement == 0.5
+        assert report.label_recall == 0.5
+        assert report.window_ms_p50 == 15.0
+        assert report.speedup == pytest.approx(2.67, abs=0.01)
+        assert report.windows == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestScoreFixtures:
+    async def test_scores_every_window_in_a_scratch_workspace(self, tmp_path: Path) -> None:
+        audio = tmp_path / "XC1 - Blackbird - Turdus merula.wav"
+        sf.write(audio, np.zeros(6 * MODEL_SR), MODEL_SR, subtype="PCM_16")
+        interpreter = MagicMock()
+        interpreter.get_input_details.return_value = [
+            {"index": 0, "shape": np.array([2, WINDOW_SAMPLES])}
+        ]
+        interpreter.get_output_details.return_value = [{"index": 0}]
+        interpreter.get_tensor.return_value = np.zeros((2, 3), dtype=np.float32)
+
+        with (
+            patch.dict("os.environ", {"SILVASONIC_INSTANCE_ID": "birdnet-validate"}),
+            patch("silvasonic.birdnet.validate.Interpreter", return_value=interpreter),
+        ):
+            workspace = os.environ.get("SILVASONIC_WORKSPACE_DIR")
+            scored = await score_fixtures(tmp_path / "m.tflite", [audio], threads=1)
+            assert os.environ.get("SILVASONIC_WORKSPACE_DIR") == workspace
+
+        # Silent audio still reaches the model: the energy gate is off
+        assert [logits.shape for logits in scored.logits] == [(2, 3)]
+        assert len(scored.window_ms) == 2
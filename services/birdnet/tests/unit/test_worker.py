@@ -1,44 +1,38 @@
 """Unit tests for BirdNET worker loops."""
 
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from silvasonic.birdnet.service import BirdNETService
+from silvasonic.core.database.analysis_queue import Claim
 
 
 @pytest.mark.unit
 class TestBirdNETServiceUnit:
     """Isolate and test the worker orchestration mechanisms."""
 
-    @pytest.fixture
-    def mock_service(self, tmp_path: Path) -> BirdNETService:
-        with patch.dict(
-            "os.environ",
-            {
-                "SILVASONIC_INSTANCE_ID": "test-bnet",
-                "SILVASONIC_WORKSPACE_DIR": str(tmp_path),
-            },
-        ):
-            return BirdNETService()
-
     @pytest.mark.asyncio
-    async def test_graceful_shutdown(self, mock_service: BirdNETService) -> None:
+    async def test_graceful_shutdown(self, service: BirdNETService) -> None:
         """Service exits gracefully when shutdown event is set without pulling further."""
-        # Trick the service into skipping DB init and jumping to loops
-        mock_service.birdnet_config = MagicMock()
-        mock_service.system_config = MagicMock()
-
         # Prevent actually calling TFLite loading by throwing an Exception simulating no model
         # which will cause hit the fast return logic and exit immediately since shutdown is set
-        mock_service._shutdown_event.set()
+        service._shutdown_event.set()
 
         with patch("builtins.open", side_effect=FileNotFoundError), patch("asyncio.sleep"):
-            await mock_service.run()
+            await service.run()
 
         # Test won't hang if shutdown logic is respected
         assert True
 
+    def test_idle_timeout_follows_work_signal(self, service: BirdNETService) -> None:
+        """Idle waits use the long fallback only while the work signal is subscribed."""
+        env = service.env_settings
+        assert service._idle_timeout() == env.POLLING_INTERVAL_S
+
+        service._work_signal.connected = True
+        assert service._idle_timeout() == env.IDLE_FALLBACK_S
+
 
 @pytest.mark.unit
 class TestAudioPathResolution:
@@ -93,22 +87,8 @@ class TestAudioPathResolution:
 class TestBirdNETResilience:
     """Test BirdNET Soft-Fail and transient I/O resilience (ADR-0030)."""
 
-    @pytest.fixture
-    def mock_service(self, tmp_path: Path) -> BirdNETService:
-        with patch.dict(
-            "os.environ",
-            {
-                "SILVASONIC_INSTANCE_ID": "test-bnet",
-                "SILVASONIC_WORKSPACE_DIR": str(tmp_path),
-            },
-        ):
-            svc = BirdNETService()
-            svc.birdnet_config = MagicMock()
-            svc.system_config = MagicMock()
-            return svc
-
     @pytest.mark.asyncio
-    async def test_loop_survives_db_failure(self, mock_service: BirdNETService) -> None:
+    async def test_loop_survives_db_failure(self, service: BirdNETService) -> None:
         """Database connection drop during get_session() doesn't crash the loop."""
         from typing import Any
 
@@ -117,7 +97,7 @@ class TestBirdNETResilience:
         async def dummy_sleep(*args: Any, **kwargs: Any) -> None:
             nonlocal call_count
             call_count += 1
-            mock_service._shutdown_event.set()
+            service._shutdown_event.set()
 
         with (
             patch("builtins.open"),
@@ -125,18 +105,18 @@ class TestBirdNETResilience:
             patch("silvasonic.birdnet.service.get_session", side_effect=RuntimeError("DB Down")),
             patch("asyncio.sleep", side_effect=dummy_sleep) as mock_sleep,
         ):
-            await mock_service.run()
+            await service.run()
 
-        expected_sleep = mock_service.env_settings.DB_RETRY_INTERVAL_S
+        expected_sleep = service.env_settings.DB_RETRY_INTERVAL_S
         mock_sleep.assert_called_with(expected_sleep)
 
     @pytest.mark.asyncio
-    async def test_health_transient_degradation(self, mock_service: BirdNETService) -> None:
+    async def test_health_transient_degradation(self, service: BirdNETService) -> None:
         """Health degrades cleanly to database_unavailable."""
         from typing import Any
 
         async def dummy_sleep(*args: Any, **kwargs: Any) -> None:
-            mock_service._shutdown_event.set()
+            service._shutdown_event.set()
 
         with (
             patch("builtins.open"),
@@ -144,14 +124,17 @@ class TestBirdNETResilience:
             patch("silvasonic.birdnet.service.get_session", side_effect=RuntimeError("DB Down")),
             patch("asyncio.sleep", side_effect=dummy_sleep),
         ):
-            await mock_service.run()
+            await service.run()
 
-        assert mock_service.health._components["birdnet"]["healthy"] is False
-        assert mock_service.health._components["birdnet"]["details"] == "database_unavailable"
+        assert service.health._components["birdnet"]["healthy"] is False
+        assert service.health._components["birdnet"]["details"] == "database_unavailable"
 
     @pytest.mark.asyncio
-    async def test_post_rollback_failure_caught(self, mock_service: BirdNETService) -> None:
-        """If writing the crashed state fails (e.g. DB commit drop), it soft-fails."""
+    async def test_post_rollback_failure_caught(self, service: BirdNETService) -> None:
+        """If the bulk result commit fails (e.g. DB commit drop), it soft-fails.
+
+        The leases are left in place and expire, so the batch is reclaimed later.
+        """
         from typing import Any
 
         call_count = 0
@@ -159,47 +142,56 @@ class TestBirdNETResilience:
         async def dummy_sleep(*args: Any, **kwargs: Any) -> None:
             nonlocal call_count
             call_count += 1
-            mock_service._shutdown_event.set()
+            service._shutdown_event.set()
 
         class MockSession:
             def __init__(self) -> None:
                 self.commit_calls = 0
 
             async def execute(self, *args: Any, **kwargs: Any) -> Any:
-                mock_result = MagicMock()
-                mock_recording = MagicMock()
-                mock_recording.analysis_state = {}
-                mock_result.scalar_one_or_none.return_value = mock_recording
-                return mock_result
+                return MagicMock()
+
+            def add_all(self, items: Any) -> None:
+                pass
 
             async def rollback(self) -> None:
                 pass
 
             async def commit(self) -> None:
                 self.commit_calls += 1
-                if self.commit_calls == 1:
+                if self.commit_calls == 2:
                     raise RuntimeError("DB Dropped During Commit")
 
+        session = MockSession()
+
         class MockSessionCtx:
             async def __aenter__(self) -> MockSession:
-                return MockSession()
+                return session
 
             async def __aexit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
                 pass
 
+        mock_recording = MagicMock()
+        mock_recording.id = 1
+        mock_recording.analysis_state = {}
+
         with (
             patch("builtins.open"),
             patch("silvasonic.birdnet.service.Interpreter"),
-            patch("silvasonic.birdnet.service.get_session", return_value=MockSessionCtx()),
-            patch.object(
-                mock_service, "_process_recording", side_effect=ValueError("Inference failed")
+            patch("silvasonic.birdnet.service.get_session", side_effect=lambda: MockSessionCtx()),
+            patch(
+                "silvasonic.birdnet.service.claim_recordings",
+                new=AsyncMock(return_value=Claim([mock_recording])),
             ),
+            patch("silvasonic.birdnet.service.complete_recordings", new=AsyncMock()),
+            patch.object(service, "_decode_audio", new=AsyncMock(return_value=MagicMock())),
+            patch.object(service, "_infer_audio", side_effect=ValueError("Inference failed")),
             patch("asyncio.sleep", side_effect=dummy_sleep) as mock_sleep,
             patch("silvasonic.birdnet.service.Path.exists", return_value=True),
         ):
-            await mock_service.run()
+            await service.run()
 
-        expected_sleep = mock_service.env_settings.DB_RETRY_INTERVAL_S
+        expected_sleep = service.env_settings.DB_RETRY_INTERVAL_S
         mock_sleep.assert_called_with(expected_sleep)
-        assert mock_service.health._components["birdnet"]["healthy"] is False
-        assert mock_service.health._components["birdnet"]["details"] == "database_unavailable"
+        assert service.health._components["birdnet"]["healthy"] is False
+        assert service.health._components["birdnet"]["details"] == "database_unavailable"
@@ -128,7 +128,105 @@ CREATE INDEX ix_recordings_upload_pending
 ON recordings (time ASC)
 WHERE uploaded = false AND local_deleted = false;
 
--- 9. Detections (Hypertable)
+-- 8b. Recording Analysis (Worker Pull work queue, ADR-0018)
+-- One row per (recording, analysis worker), enqueued by the Indexer together
+-- with the recording. state: pending -> claimed -> final result (e.g. done,
+-- failed_file_missing), or deleted when the Janitor removes the file first.
+-- Workers claim batches with a lease and release the claim transaction
+-- immediately; a lease past lease_expires_at is reclaimable by any worker.
+-- recording_time mirrors recordings.time so claims walk one partial index.
+CREATE TABLE recording_analysis (
+    recording_id BIGINT NOT NULL,
+    worker TEXT NOT NULL,
+    state TEXT NOT NULL DEFAULT 'pending',
+    recording_time TIMESTAMP WITH TIME ZONE NOT NULL,
+    claimed_at TIMESTAMP WITH TIME ZONE,
+    lease_expires_at TIMESTAMP WITH TIME ZONE,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (recording_id, worker),
+    FOREIGN KEY(recording_id) REFERENCES recordings (id)
+);
+
+-- Claims: the oldest/newest pending rows of one worker (O(log n) per batch).
+CREATE INDEX ix_recording_analysis_pending
+ON recording_analysis (worker, recording_time)
+WHERE state = 'pending';
+
+-- Lease recovery: expired claims of one worker.
+CREATE INDEX ix_recording_analysis_claimed
+ON recording_analysis (worker, lease_expires_at)
+WHERE state = 'claimed';
+
+-- 8c. Analysis Backlog (trigger-maintained queue gauges)
+-- Pending / claimed deltas of recording_analysis per worker, appended by
+-- statement-level triggers so heartbeats read the backlog by summing a few
+-- rows instead of counting the queue. Readers fold the deltas into one row
+-- per worker (silvasonic.core.database.backlog.compact_backlog).
+CREATE TABLE analysis_backlog (
+    id BIGINT GENERATED BY DEFAULT AS IDENTITY NOT NULL,
+    worker TEXT NOT NULL,
+    pending BIGINT NOT NULL DEFAULT 0,
+    claimed BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (id)
+);
+
+CREATE FUNCTION analysis_backlog_track() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    -- Append one delta row per worker and statement. Plain inserts never
+    -- wait on each other, so a long transaction that writes the queue does
+    -- not hold up claims and completions of other sessions.
+    IF TG_OP <> 'DELETE' THEN
+        INSERT INTO analysis_backlog (worker, pending, claimed)
+        SELECT worker,
+               count(*) FILTER (WHERE state = 'pending'),
+               count(*) FILTER (WHERE state = 'claimed')
+        FROM new_rows
+        WHERE state IN ('pending', 'claimed')
+        GROUP BY worker;
+    END IF;
+    IF TG_OP <> 'INSERT' THEN
+        INSERT INTO analysis_backlog (worker, pending, claimed)
+        SELECT worker,
+               -count(*) FILTER (WHERE state = 'pending'),
+               -count(*) FILTER (WHERE state = 'claimed')
+        FROM old_rows
+        WHERE state IN ('pending', 'claimed')
+        GROUP BY worker;
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+CREATE TRIGGER recording_analysis_backlog_insert
+AFTER INSERT ON recording_analysis
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION analysis_backlog_track();
+
+CREATE TRIGGER recording_analysis_backlog_update
+AFTER UPDATE ON recording_analysis
+REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION analysis_backlog_track();
+
+CREATE TRIGGER recording_analysis_backlog_delete
+AFTER DELETE ON recording_analysis
+REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION analysis_backlog_track();
+
+-- 9a. Analysis Runs
+-- One row per distinct analysis configuration snapshot (model version,
+-- thresholds, location, ...). Detections reference it instead of repeating
+-- the same details JSONB on every row.
+CREATE TABLE analysis_runs (
+    id BIGINT GENERATED BY DEFAULT AS IDENTITY NOT NULL,
+    worker TEXT NOT NULL,
+    details JSONB NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (id),
+    UNIQUE (worker, details)
+);
+
+-- 9b. Detections (Hypertable)
 CREATE TABLE detections (
     id BIGINT GENERATED BY DEFAULT AS IDENTITY NOT NULL,
     time TIMESTAMP WITH TIME ZONE NOT NULL,
@@ -139,14 +237,21 @@ CREATE TABLE detections (
     label TEXT NOT NULL,
     common_name TEXT,
     clip_path TEXT,
-    details JSONB NOT NULL,
+    pinned BOOLEAN NOT NULL DEFAULT false,
+    clip_attempts SMALLINT NOT NULL DEFAULT 0,
+    event JSONB,
+    run_id BIGINT NOT NULL,
     PRIMARY KEY (time, id),
-    FOREIGN KEY(recording_id) REFERENCES recordings (id)
+    FOREIGN KEY(recording_id) REFERENCES recordings (id),
+    FOREIGN KEY(run_id) REFERENCES analysis_runs (id)
 );
 CREATE INDEX ix_detections_time ON detections (time);
 CREATE INDEX ix_detections_label ON detections (label);
 CREATE INDEX ix_detections_recording_id ON detections (recording_id);
 CREATE INDEX ix_detections_worker ON detections (worker);
+-- Pinned detections whose clip is still to be cut (BirdNET sweep, Janitor guard)
+CREATE INDEX ix_detections_pending_pins ON detections (recording_id)
+    WHERE pinned AND clip_path IS NULL;
 
 -- 10. Uploads
 CREATE TABLE uploads (
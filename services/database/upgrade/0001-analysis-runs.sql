@@ -0,0 +1,42 @@
+-- Silvasonic Database Upgrade 0001: normalize detections.details into analysis_runs
+--
+-- Fresh databases get analysis_runs from init/01-init-schema.sql and never
+-- need this script. Run it once against a database created before the
+-- analysis_runs table existed (e.g. a field station with recorded data):
+--
+--   psql -U silvasonic -d silvasonic -f 0001-analysis-runs.sql
+--
+-- Every distinct (worker, details) pair becomes one analysis run; detections
+-- are re-pointed to it and the per-row details column is dropped.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS analysis_runs (
+    id BIGINT GENERATED BY DEFAULT AS IDENTITY NOT NULL,
+    worker TEXT NOT NULL,
+    details JSONB NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (id),
+    UNIQUE (worker, details)
+);
+
+ALTER TABLE detections ADD COLUMN run_id BIGINT;
+
+-- Backfill: one run per distinct configuration snapshot
+INSERT INTO analysis_runs (worker, details, created_at)
+SELECT worker, details, MIN(time)
+FROM detections
+GROUP BY worker, details
+ON CONFLICT (worker, details) DO NOTHING;
+
+UPDATE detections d
+SET run_id = r.id
+FROM analysis_runs r
+WHERE r.worker = d.worker AND r.details = d.details;
+
+ALTER TABLE detections ALTER COLUMN run_id SET NOT NULL;
+ALTER TABLE detections
+    ADD CONSTRAINT detections_run_id_fkey FOREIGN KEY (run_id) REFERENCES analysis_runs (id);
+ALTER TABLE detections DROP COLUMN details;
+
+COMMIT;
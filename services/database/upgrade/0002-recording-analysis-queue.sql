@@ -0,0 +1,56 @@
+-- Silvasonic Database Upgrade 0002: turn recording_analysis into the analysis work queue
+--
+-- Fresh databases get the queue from init/01-init-schema.sql and never need
+-- this script. Run it once against a database created before the queue
+-- existed, after 0001:
+--
+--   psql -U silvasonic -d silvasonic -f 0002-recording-analysis-queue.sql
+--
+-- recording_analysis previously held only live leases. It now keeps one row
+-- per (recording, analysis worker) for the recording's whole life. Existing
+-- recordings are enqueued from their analysis_state: a recorded result
+-- becomes the final state, a missing key becomes pending (or deleted when
+-- the file is already gone).
+--
+-- Databases from before the lease table existed get it first, in its lease
+-- shape, so the script upgrades both generations the same way.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS recording_analysis (
+    recording_id BIGINT NOT NULL,
+    worker TEXT NOT NULL,
+    claimed_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    lease_expires_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (recording_id, worker),
+    FOREIGN KEY(recording_id) REFERENCES recordings (id)
+);
+
+-- Live leases are dropped; their recordings are re-enqueued as pending below
+DELETE FROM recording_analysis;
+
+ALTER TABLE recording_analysis
+    ADD COLUMN state TEXT NOT NULL DEFAULT 'pending',
+    ADD COLUMN recording_time TIMESTAMP WITH TIME ZONE NOT NULL,
+    ALTER COLUMN claimed_at DROP NOT NULL,
+    ALTER COLUMN claimed_at DROP DEFAULT,
+    ALTER COLUMN lease_expires_at DROP NOT NULL;
+
+-- Backfill: one row per recording for every analysis worker (currently birdnet)
+INSERT INTO recording_analysis (recording_id, worker, recording_time, state)
+SELECT r.id, w.worker, r.time,
+       COALESCE(r.analysis_state->>w.worker,
+                CASE WHEN r.local_deleted THEN 'deleted' ELSE 'pending' END)
+FROM recordings r
+CROSS JOIN (VALUES ('birdnet')) AS w(worker);
+
+CREATE INDEX ix_recording_analysis_pending
+ON recording_analysis (worker, recording_time)
+WHERE state = 'pending';
+
+CREATE INDEX ix_recording_analysis_claimed
+ON recording_analysis (worker, lease_expires_at)
+WHERE state = 'claimed';
+
+COMMIT;
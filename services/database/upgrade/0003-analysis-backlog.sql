@@ -0,0 +1,75 @@
+-- Silvasonic Database Upgrade 0003: trigger-maintained analysis backlog gauges
+--
+-- Fresh databases get analysis_backlog from init/01-init-schema.sql and never
+-- need this script. Run it once after 0002:
+--
+--   psql -U silvasonic -d silvasonic -f 0003-analysis-backlog.sql
+--
+-- Creates the delta table and its triggers, then seeds one row per worker
+-- from the current queue. The queue is locked against writes meanwhile, so no
+-- change slips between the seed and the trigger installation.
+
+BEGIN;
+
+LOCK TABLE recording_analysis IN SHARE ROW EXCLUSIVE MODE;
+
+CREATE TABLE analysis_backlog (
+    id BIGINT GENERATED BY DEFAULT AS IDENTITY NOT NULL,
+    worker TEXT NOT NULL,
+    pending BIGINT NOT NULL DEFAULT 0,
+    claimed BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (id)
+);
+
+CREATE FUNCTION analysis_backlog_track() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    -- Append one delta row per worker and statement. Plain inserts never
+    -- wait on each other, so a long transaction that writes the queue does
+    -- not hold up claims and completions of other sessions.
+    IF TG_OP <> 'DELETE' THEN
+        INSERT INTO analysis_backlog (worker, pending, claimed)
+        SELECT worker,
+               count(*) FILTER (WHERE state = 'pending'),
+               count(*) FILTER (WHERE state = 'claimed')
+        FROM new_rows
+        WHERE state IN ('pending', 'claimed')
+        GROUP BY worker;
+    END IF;
+    IF TG_OP <> 'INSERT' THEN
+        INSERT INTO analysis_backlog (worker, pending, claimed)
+        SELECT worker,
+               -count(*) FILTER (WHERE state = 'pending'),
+               -count(*) FILTER (WHERE state = 'claimed')
+        FROM old_rows
+        WHERE state IN ('pending', 'claimed')
+        GROUP BY worker;
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+CREATE TRIGGER recording_analysis_backlog_insert
+AFTER INSERT ON recording_analysis
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION analysis_backlog_track();
+
+CREATE TRIGGER recording_analysis_backlog_update
+AFTER UPDATE ON recording_analysis
+REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION analysis_backlog_track();
+
+CREATE TRIGGER recording_analysis_backlog_delete
+AFTER DELETE ON recording_analysis
+REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION analysis_backlog_track();
+
+-- Seed: current queue sizes (the triggers append deltas from here on)
+INSERT INTO analysis_backlog (worker, pending, claimed)
+SELECT worker,
+       count(*) FILTER (WHERE state = 'pending'),
+       count(*) FILTER (WHERE state = 'claimed')
+FROM recording_analysis
+GROUP BY worker;
+
+COMMIT;
@@ -0,0 +1,15 @@
+-- Silvasonic Database Upgrade 0004: window scores of merged detection events
+--
+-- Fresh databases get detections.event from init/01-init-schema.sql and never
+-- need this script. Run it once after 0003:
+--
+--   psql -U silvasonic -d silvasonic -f 0004-detection-events.sql
+--
+-- Adds the nullable event column. Existing detections are single windows and
+-- keep NULL, so no backfill is needed.
+
+BEGIN;
+
+ALTER TABLE detections ADD COLUMN IF NOT EXISTS event JSONB;
+
+COMMIT;
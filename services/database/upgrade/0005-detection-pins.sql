@@ -0,0 +1,20 @@
+-- Silvasonic Database Upgrade 0005: pinned detection clips
+--
+-- Fresh databases get detections.pinned from init/01-init-schema.sql and never
+-- need this script. Run it once after 0004:
+--
+--   psql -U silvasonic -d silvasonic -f 0005-detection-pins.sql
+--
+-- Adds the pinned flag (false for all existing detections), the counter of
+-- failed clip cuts of pinned detections and the partial index over pinned
+-- detections that still lack a clip.
+
+BEGIN;
+
+ALTER TABLE detections ADD COLUMN IF NOT EXISTS pinned BOOLEAN NOT NULL DEFAULT false;
+ALTER TABLE detections ADD COLUMN IF NOT EXISTS clip_attempts SMALLINT NOT NULL DEFAULT 0;
+
+CREATE INDEX IF NOT EXISTS ix_detections_pending_pins ON detections (recording_id)
+    WHERE pinned AND clip_path IS NULL;
+
+COMMIT;
@@ -17,7 +17,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 TABLES = [
     "recordings",
+    "recording_analysis",
+    "analysis_backlog",
     "detections",
+    "analysis_runs",
     "uploads",
     "devices",
     "system_config",
@@ -17,9 +17,11 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import structlog
+from silvasonic.core.database.backlog import BacklogGauge
 from silvasonic.core.database.session import get_session
 from silvasonic.core.schemas.system_config import ProcessorSettings
 from silvasonic.core.service import SilvaService
+from silvasonic.core.work_signal import WorkPublisher
 from silvasonic.processor import indexer, janitor, reconciliation
 from silvasonic.processor.janitor import RetentionMode
 from silvasonic.processor.settings import ProcessorEnvSettings
@@ -68,6 +70,12 @@ class ProcessorService(SilvaService):
         self._janitor_counter: int = 0
         self._janitor_every_n: int = 1
 
+        # Wakes idle analysis workers after new recordings are committed
+        self._work_publisher = WorkPublisher(self._env_config.REDIS_URL)
+
+        # Analysis queue gauges of all workers (read at most once per heartbeat)
+        self._analysis_backlog = BacklogGauge(self._env_config.HEARTBEAT_INTERVAL_S)
+
         # Snapshot Refresh: monitor processor tuning parameters (ADR-0031)
         self._config_keys = ["processor"]
 
@@ -110,6 +118,7 @@ class ProcessorService(SilvaService):
                 "current_mode": self._janitor_mode,
                 "files_deleted_total": self._files_deleted_total,
             },
+            "analysis_backlog": self._analysis_backlog.as_meta(),
         }
 
         # Upload Worker metrics
@@ -147,6 +156,7 @@ class ProcessorService(SilvaService):
                 self._total_indexed += result.new
                 self._last_indexed_at = datetime.now(UTC)
                 self.health.update_status("indexer", True, f"indexed {result.new} new")
+                await self._work_publisher.notify()
             elif result.errors > 0:
                 self.health.update_status("indexer", False, f"{result.errors} errors")
             else:
@@ -255,6 +265,7 @@ class ProcessorService(SilvaService):
             # --- Indexer (every cycle) ---
             await self._run_indexer_cycle(errored_files, self._indexer_stats)
             self._indexer_stats.maybe_emit_summary()
+            await self._analysis_backlog.maybe_refresh()
 
             # --- Janitor (every N cycles) ---
             await self._run_janitor_cycle(self._janitor_stats)
@@ -268,6 +279,7 @@ class ProcessorService(SilvaService):
             await asyncio.sleep(self._settings.indexer_poll_interval)
 
         # Emit final shutdown summaries
+        await self._work_publisher.close()
         self._indexer_stats.emit_final_summary()
         self._janitor_stats.emit_final_summary()
 
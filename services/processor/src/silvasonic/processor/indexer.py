@@ -3,7 +3,8 @@
 Scans the Recorder workspace for promoted WAV files in
 ``{recordings_dir}/*/data/processed/*.wav`` and ``*/data/raw/*.wav``,
 extracts metadata via ``soundfile``, and registers new recordings in
-the ``recordings`` table.
+the ``recordings`` table.  Each new recording is enqueued for every
+analysis worker in ``recording_analysis`` within the same statement.
 
 Idempotent: checks for existing entries by ``file_processed`` (dual-stream)
 or ``file_raw`` (raw-only) before insert.
@@ -23,6 +24,7 @@ from pathlib import Path
 
 import soundfile as sf  # type: ignore[import-untyped]
 import structlog
+from silvasonic.core.database.analysis_queue import ANALYSIS_WORKERS
 from silvasonic.processor.modules.indexer_stats import IndexerStats
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -278,16 +280,22 @@ async def index_recordings(
                 filesize_raw = os.path.getsize(raw_path) if raw_path.exists() else 0
                 filesize_processed = meta.filesize
 
-            # Insert new recording
+            # Insert new recording and enqueue it for every analysis worker
             await session.execute(
                 text("""
-                    INSERT INTO recordings (
-                        time, sensor_id, file_raw, file_processed,
-                        duration, sample_rate, filesize_raw, filesize_processed
-                    ) VALUES (
-                        :time, :sensor_id, :file_raw, :file_processed,
-                        :duration, :sample_rate, :filesize_raw, :filesize_processed
+                    WITH rec AS (
+                        INSERT INTO recordings (
+                            time, sensor_id, file_raw, file_processed,
+                            duration, sample_rate, filesize_raw, filesize_processed
+                        ) VALUES (
+                            :time, :sensor_id, :file_raw, :file_processed,
+                            :duration, :sample_rate, :filesize_raw, :filesize_processed
+                        )
+                        RETURNING id, time
                     )
+                    INSERT INTO recording_analysis (recording_id, worker, recording_time)
+                    SELECT rec.id, w.worker, rec.time
+                    FROM rec CROSS JOIN unnest(CAST(:workers AS TEXT[])) AS w(worker)
                 """),
                 {
                     "time": timestamp,
@@ -298,6 +306,7 @@ async def index_recordings(
                     "sample_rate": meta.sample_rate,
                     "filesize_raw": filesize_raw,
                     "filesize_processed": filesize_processed,
+                    "workers": list(ANALYSIS_WORKERS),
                 },
             )
             result.new += 1
@@ -6,7 +6,9 @@ service authorized to delete files from the Recorder workspace (ADR-0009).
 
 Three escalating modes:
 
-- **Housekeeping** (>70%): Delete uploaded + fully analyzed recordings.
+- **Housekeeping** (>70%): Delete uploaded + fully analyzed recordings
+  whose pinned detection clips have been cut (or given up after
+  ``MAX_PIN_CLIP_ATTEMPTS`` failed cuts).
 - **Defensive** (>80%): Delete uploaded recordings (analysis state ignored).
 - **Panic** (>90%): Delete oldest files regardless of any status.
 
@@ -30,6 +32,7 @@ from enum import StrEnum
 from pathlib import Path
 
 import structlog
+from silvasonic.core.database.models.detections import MAX_PIN_CLIP_ATTEMPTS
 from silvasonic.core.schemas.system_config import ProcessorSettings
 from silvasonic.processor.modules.janitor_stats import JanitorStats
 from sqlalchemy import text
@@ -135,28 +138,44 @@ async def find_deletable(
                 FROM recordings
                 WHERE local_deleted = false
                   AND uploaded = true
-                  AND analysis_state != '{}'::jsonb
+                  AND EXISTS (
+                      SELECT 1 FROM recording_analysis ra WHERE ra.recording_id = recordings.id
+                  )
+                  AND NOT EXISTS (
+                      SELECT 1 FROM recording_analysis ra
+                      WHERE ra.recording_id = recordings.id
+                        AND ra.state IN ('pending', 'claimed')
+                  )
                   AND NOT EXISTS (
-                      SELECT 1 FROM jsonb_each_text(analysis_state) AS kv
-                      WHERE kv.value != 'true'
+                      SELECT 1 FROM detections d
+                      WHERE d.recording_id = recordings.id AND d.pinned AND d.clip_path IS NULL
+                        AND d.clip_attempts < :pin_attempts
                   )
                 ORDER BY time ASC
                 LIMIT :batch
-            """)
+            """).bindparams(pin_attempts=MAX_PIN_CLIP_ATTEMPTS)
         else:
             # Cloud-Sync-Fallback: skip uploaded condition
             query = text("""
                 SELECT id, file_raw, file_processed
                 FROM recordings
                 WHERE local_deleted = false
-                  AND analysis_state != '{}'::jsonb
+                  AND EXISTS (
+                      SELECT 1 FROM recording_analysis ra WHERE ra.recording_id = recordings.id
+                  )
+                  AND NOT EXISTS (
+                      SELECT 1 FROM recording_analysis ra
+                      WHERE ra.recording_id = recordings.id
+                        AND ra.state IN ('pending', 'claimed')
+                  )
                   AND NOT EXISTS (
-                      SELECT 1 FROM jsonb_each_text(analysis_state) AS kv
-                      WHERE kv.value != 'true'
+                      SELECT 1 FROM detections d
+                      WHERE d.recording_id = recordings.id AND d.pinned AND d.clip_path IS NULL
+                        AND d.clip_attempts < :pin_attempts
                   )
                 ORDER BY time ASC
                 LIMIT :batch
-            """)
+            """).bindparams(pin_attempts=MAX_PIN_CLIP_ATTEMPTS)
 
     elif mode == RetentionMode.DEFENSIVE:
         if cloud_sync_active:
@@ -233,7 +252,11 @@ async def delete_worker_clips(
 ) -> int:
     """Physically delete audio clips extracted by analysis workers.
 
-    1. Query the detections table for associated clips.
+    Clips of pinned detections are kept: they outlive their recording.
+    A clip file may be shared by several detections of the same time span,
+    so a clip is only deleted if none of them is pinned.
+
+    1. Query the detections table for associated unpinned clips.
     2. Unlink the physical files from the respective worker workspaces via a thread.
     3. Nullify the clip_path column in the database only for successfully deleted paths.
 
@@ -248,9 +271,14 @@ async def delete_worker_clips(
     """
     result = await session.execute(
         text("""
-            SELECT worker, clip_path 
-            FROM detections 
-            WHERE recording_id = :id AND clip_path IS NOT NULL
+            SELECT DISTINCT worker, clip_path
+            FROM detections d
+            WHERE recording_id = :id AND clip_path IS NOT NULL AND NOT pinned
+              AND NOT EXISTS (
+                  SELECT 1 FROM detections p
+                  WHERE p.recording_id = d.recording_id AND p.worker = d.worker
+                    AND p.clip_path = d.clip_path AND p.pinned
+              )
         """),
         {"id": recording_id},
     )
@@ -310,9 +338,17 @@ async def soft_delete(
 
     The row is preserved for historical inventory — only the
     ``local_deleted`` flag is set to ``TRUE`` (Soft Delete pattern).
+    Analysis work still pending for the recording is cancelled so it leaves
+    the workers' claim index.
     """
     await session.execute(
-        text("UPDATE recordings SET local_deleted = true WHERE id = :id"),
+        text("""
+            WITH gone AS (
+                UPDATE recordings SET local_deleted = true WHERE id = :id RETURNING id
+            )
+            UPDATE recording_analysis SET state = 'deleted'
+            WHERE recording_id IN (SELECT id FROM gone) AND state = 'pending'
+        """),
         {"id": recording_id},
     )
 
@@ -12,6 +12,7 @@ from __future__ import annotations
 from pathlib import Path
 
 import structlog
+from silvasonic.processor.janitor import soft_delete
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -57,10 +58,7 @@ async def run_audit(
             missing_file = file_raw
 
         if missing_file is not None:
-            await session.execute(
-                text("UPDATE recordings SET local_deleted = true WHERE id = :id"),
-                {"id": row_id},
-            )
+            await soft_delete(session, row_id)
             reconciled += 1
             log.warning(
                 "reconciliation.file_missing",
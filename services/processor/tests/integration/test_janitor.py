@@ -78,7 +78,7 @@ async def _seed_recording(
     local_deleted: bool = False,
     time: datetime,
 ) -> int:
-    """Insert a recording row and return its ID."""
+    """Insert a recording row (and its analysis queue rows) and return its ID."""
     async with factory() as session:
         result = await session.execute(
             text(f"""
@@ -104,6 +104,16 @@ async def _seed_recording(
         )
         row = result.fetchone()
         assert row is not None
+        # Mirror the per-worker states into the analysis work queue
+        await session.execute(
+            text("""
+                INSERT INTO recording_analysis (recording_id, worker, recording_time, state)
+                SELECT r.id, kv.key, r.time, kv.value
+                FROM recordings r, jsonb_each_text(r.analysis_state) AS kv
+                WHERE r.id = :id
+            """),
+            {"id": row[0]},
+        )
         await session.commit()
         return int(row[0])
 
@@ -119,9 +129,15 @@ async def _seed_detection(
     async with factory() as session:
         await session.execute(
             text("""
+                WITH run AS (
+                    INSERT INTO analysis_runs (worker, details)
+                    VALUES (:worker, '{}'::jsonb)
+                    ON CONFLICT (worker, details) DO UPDATE SET worker = EXCLUDED.worker
+                    RETURNING id
+                )
                 INSERT INTO detections (
-                    time, end_time, recording_id, worker, label, confidence, clip_path, details
-                ) VALUES (
+                    time, end_time, recording_id, worker, label, confidence, clip_path, run_id
+                ) SELECT
                     now(), 
                     now() + interval '3 seconds', 
                     :recording_id, 
@@ -129,8 +145,8 @@ async def _seed_detection(
                     'TestLabel', 
                     0.9, 
                     :clip_path, 
-                    '{}'::jsonb
-                )
+                    run.id
+                FROM run
             """),
             {
                 "recording_id": recording_id,
@@ -499,6 +515,7 @@ class TestJanitorIntegration:
             file_raw="panic-mic/data/raw/old.wav",
             file_processed="panic-mic/data/processed/old.wav",
             uploaded=False,
+            analysis_state_sql='\'{"birdnet": "pending"}\'::jsonb',
             time=datetime(2025, 1, 1, tzinfo=UTC),
         )
 
@@ -537,6 +554,12 @@ class TestJanitorIntegration:
                 text("SELECT local_deleted FROM recordings WHERE id = :id"), {"id": new_id}
             )
             assert row_new.scalar() is False
+            # Pending analysis of the deleted file is cancelled
+            queue_old = await session.execute(
+                text("SELECT state FROM recording_analysis WHERE recording_id = :id"),
+                {"id": old_id},
+            )
+            assert queue_old.scalar() == "deleted"
 
         await engine.dispose()
 
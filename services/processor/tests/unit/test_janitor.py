@@ -237,6 +237,49 @@ class TestDeleteWorkerClips:
         update_call = session.execute.call_args_list[1]
         assert update_call[0][1] == {"id": 42, "clip_paths": ["clips/ok.wav"]}
 
+    async def test_pinned_clips_are_kept(self, tmp_path: Path) -> None:
+        """Clips of pinned detections are never selected for deletion."""
+        from silvasonic.processor.janitor import delete_worker_clips
+
+        session = AsyncMock()
+        session.execute.return_value = MagicMock(fetchall=MagicMock(return_value=[]))
+
+        assert await delete_worker_clips(session, 7, tmp_path) == 0
+        query = str(session.execute.call_args_list[0][0][0])
+        assert "NOT pinned" in query
+        # ... including clips shared with a pinned detection of the same span
+        assert "p.clip_path = d.clip_path AND p.pinned" in query
+
+
+class TestFindDeletable:
+    """Tests for find_deletable() selection criteria."""
+
+    @pytest.mark.parametrize("cloud_sync_active", [True, False])
+    async def test_housekeeping_waits_for_pinned_clips(self, cloud_sync_active: bool) -> None:
+        """Recordings with pinned detections still lacking a clip are held back."""
+        from silvasonic.processor.janitor import find_deletable
+
+        session = AsyncMock()
+        session.execute.return_value = MagicMock(fetchall=MagicMock(return_value=[]))
+
+        await find_deletable(session, RetentionMode.HOUSEKEEPING, 10, cloud_sync_active)
+
+        query = str(session.execute.call_args[0][0])
+        assert "d.pinned AND d.clip_path IS NULL" in query
+        # ... unless their clip cut has been given up
+        assert "d.clip_attempts < :pin_attempts" in query
+
+    async def test_defensive_ignores_pinned_clips(self) -> None:
+        """Under disk pressure, pending pins no longer block deletion."""
+        from silvasonic.processor.janitor import find_deletable
+
+        session = AsyncMock()
+        session.execute.return_value = MagicMock(fetchall=MagicMock(return_value=[]))
+
+        await find_deletable(session, RetentionMode.DEFENSIVE, 10, True)
+
+        assert "pinned" not in str(session.execute.call_args[0][0])
+
 
 # ---------------------------------------------------------------------------
 # Panic Filesystem Fallback
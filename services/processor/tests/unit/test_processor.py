@@ -19,6 +19,7 @@ from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from silvasonic.core.database.backlog import BacklogCounts, BacklogGauge
 from silvasonic.core.health import HealthMonitor
 from silvasonic.core.schemas.system_config import ProcessorSettings
 from silvasonic.processor.__main__ import ProcessorService
@@ -50,6 +51,8 @@ def _make_bare_service() -> Any:
     svc._files_deleted_total = 0
     svc._janitor_counter = 0
     svc._janitor_every_n = 1
+    svc._analysis_backlog = BacklogGauge(interval_s=10.0)
+    svc._work_publisher = MagicMock(notify=AsyncMock(return_value=True), close=AsyncMock())
     return svc
 
 
@@ -230,6 +233,8 @@ class TestProcessorCycles:
         assert svc._total_indexed == 3
         status = svc.health.get_status()
         assert status["components"]["indexer"]["healthy"] is True
+        # Idle analysis workers are woken after the commit
+        svc._work_publisher.notify.assert_awaited_once()
 
     async def test_indexer_cycle_errors(self) -> None:
         """_run_indexer_cycle updates errored_files and sets unhealthy on DB errors."""
@@ -307,6 +312,13 @@ class TestProcessorGetExtraMeta:
         assert meta["janitor"]["current_mode"] == "idle"
         assert meta["janitor"]["files_deleted_total"] == 0
 
+    def test_extra_meta_has_analysis_backlog_per_worker(self) -> None:
+        """Queue gauges of every analysis worker are reported."""
+        svc = _make_bare_service()
+        svc._analysis_backlog.counts = {"birdnet": BacklogCounts(pending=7, claimed=2)}
+        meta = svc.get_extra_meta()
+        assert meta["analysis_backlog"] == {"birdnet": {"pending": 7, "claimed": 2}}
+
 
 # ---------------------------------------------------------------------------
 # __main__ guard
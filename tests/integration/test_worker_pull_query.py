@@ -1,6 +1,6 @@
 """Integration tests for Worker Pull query patterns (ADR-0018).
 
-Validates that the ``recordings`` table partial indices are correctly
+Validates that the ``recordings`` and ``recording_analysis`` partial indices are correctly
 used by the query planner and that ``FOR UPDATE SKIP LOCKED`` provides
 concurrent claim semantics.
 
@@ -159,6 +159,29 @@ class TestWorkerPullQuery:
             f"Expected partial index scan, got:\n{plan}"
         )
 
+    async def test_partial_index_analysis_queue_used(
+        self, postgres_container: PostgresContainer
+    ) -> None:
+        """EXPLAIN confirms claims walk ix_recording_analysis_pending."""
+        url = _build_async_url(postgres_container)
+        engine = create_async_engine(url, echo=False)
+
+        async with engine.begin() as conn:
+            result = await conn.execute(
+                text("""
+                    EXPLAIN (FORMAT TEXT)
+                    SELECT recording_id FROM recording_analysis
+                    WHERE worker = 'birdnet' AND state = 'pending'
+                    ORDER BY recording_time ASC
+                    LIMIT 8
+                    FOR UPDATE SKIP LOCKED
+                """)
+            )
+            plan = "\n".join(row[0] for row in result.fetchall())
+
+        await engine.dispose()
+        assert "ix_recording_analysis_pending" in plan, f"Expected partial index scan, got:\n{plan}"
+
     async def test_partial_index_upload_pending_used(
         self, postgres_container: PostgresContainer
     ) -> None:
@@ -180,3 +203,182 @@ class TestWorkerPullQuery:
 
         await engine.dispose()
         assert "ix_recordings_upload_pending" in plan, f"Expected partial index scan, got:\n{plan}"
+
+    async def test_lease_claims_are_exclusive_and_expire(
+        self, postgres_container: PostgresContainer
+    ) -> None:
+        """Leased rows are skipped by other claims until the lease expires."""
+        from silvasonic.core.database.analysis_queue import (
+            claim_recordings,
+            complete_recordings,
+        )
+        from silvasonic.core.database.backlog import BacklogCounts, read_backlog
+
+        url = _build_async_url(postgres_container)
+        engine = create_async_engine(url, echo=False)
+
+        async with engine.begin() as conn:
+            await conn.execute(
+                text("""
+                    INSERT INTO devices (name, serial_number, model, config)
+                    VALUES ('test-mic', 'SN-TEST-001', 'TestMic', '{}')
+                    ON CONFLICT (name) DO NOTHING
+                """)
+            )
+
+        session_factory = async_sessionmaker(engine, expire_on_commit=False)
+        async with session_factory() as session:
+            await _insert_test_recordings(session, count=2)
+            await session.execute(
+                text("""
+                    INSERT INTO recording_analysis (recording_id, worker, recording_time)
+                    SELECT id, 'lease-test', time FROM recordings
+                """)
+            )
+            await session.commit()
+
+        async def backlog(session: AsyncSession) -> BacklogCounts:
+            return (await read_backlog(session)).get("lease-test", BacklogCounts())
+
+        async with session_factory() as s1:
+            assert await backlog(s1) == (2, 0)
+            first = await claim_recordings(s1, "lease-test", limit=1000, lease_s=300)
+            await s1.commit()
+            # Trigger-maintained gauges follow the state transitions
+            assert await backlog(s1) == (0, 2)
+        assert len(first.recordings) >= 2
+
+        async with session_factory() as s2:
+            idle = await claim_recordings(s2, "lease-test", limit=1000, lease_s=300)
+            assert idle.recordings == []
+            await s2.commit()
+
+            # Expire one lease — the next claim must pick exactly that row up again
+            expired_id = first.recordings[0].id
+            await s2.execute(
+                text("""
+                    UPDATE recording_analysis
+                    SET lease_expires_at = NOW() - INTERVAL '1 second'
+                    WHERE recording_id = :id AND worker = 'lease-test'
+                """),
+                {"id": expired_id},
+            )
+            await s2.commit()
+
+            reclaimed = await claim_recordings(s2, "lease-test", limit=1000, lease_s=300)
+            await s2.commit()
+            assert [r.id for r in reclaimed.recordings] == [expired_id]
+
+            attempts = await s2.execute(
+                text("""
+                    SELECT attempts FROM recording_analysis
+                    WHERE recording_id = :id AND worker = 'lease-test'
+                """),
+                {"id": expired_id},
+            )
+            assert attempts.scalar_one() == 2
+
+            # The stale first claim only completes the rows it still holds
+            kept = await complete_recordings(
+                s2, "lease-test", {r.id: "done" for r in first.recordings}, first.claimed_at
+            )
+            await s2.commit()
+            assert kept == {r.id for r in first.recordings} - {expired_id}
+
+            # The second lease runs out as well: max_attempts gives the recording up
+            await s2.execute(
+                text("""
+                    UPDATE recording_analysis
+                    SET lease_expires_at = NOW() - INTERVAL '1 second'
+                    WHERE recording_id = :id AND worker = 'lease-test'
+                """),
+                {"id": expired_id},
+            )
+            await s2.commit()
+            retry = await claim_recordings(
+                s2, "lease-test", limit=1000, lease_s=300, max_attempts=2
+            )
+            await s2.commit()
+            assert retry.recordings == []
+            assert (
+                await complete_recordings(
+                    s2, "lease-test", {expired_id: "done"}, reclaimed.claimed_at
+                )
+                == set()
+            )
+            await s2.commit()
+
+            leases = await s2.execute(
+                text("""
+                    SELECT recording_id, state FROM recording_analysis
+                    WHERE worker = 'lease-test' AND state != 'done'
+                """)
+            )
+            assert leases.fetchall() == [(expired_id, "failed_max_attempts")]
+            assert await backlog(s2) == (0, 0)
+            state = await s2.execute(
+                text("SELECT analysis_state->>'lease-test' FROM recordings WHERE id = :id"),
+                {"id": expired_id},
+            )
+            assert state.scalar_one() == "failed_max_attempts"
+
+        await engine.dispose()
+
+    async def test_backlog_deltas_do_not_block_other_queue_writers(
+        self, postgres_container: PostgresContainer
+    ) -> None:
+        """An open transaction that enqueues work does not hold up claims of the same worker."""
+        from silvasonic.core.database.analysis_queue import claim_recordings
+        from silvasonic.core.database.backlog import compact_backlog, read_backlog
+
+        url = _build_async_url(postgres_container)
+        engine = create_async_engine(url, echo=False)
+
+        async with engine.begin() as conn:
+            await conn.execute(
+                text("""
+                    INSERT INTO devices (name, serial_number, model, config)
+                    VALUES ('test-mic', 'SN-TEST-001', 'TestMic', '{}')
+                    ON CONFLICT (name) DO NOTHING
+                """)
+            )
+
+        session_factory = async_sessionmaker(engine, expire_on_commit=False)
+        async with session_factory() as session:
+            first, second = await _insert_test_recordings(session, count=2)
+            await session.execute(
+                text("""
+                    INSERT INTO recording_analysis (recording_id, worker, recording_time)
+                    SELECT id, 'delta-test', time FROM recordings WHERE id = :id
+                """),
+                {"id": first},
+            )
+            await session.commit()
+
+        async with session_factory() as indexer, session_factory() as worker:
+            # Indexer-style scan transaction: enqueues and stays open
+            await indexer.execute(
+                text("""
+                    INSERT INTO recording_analysis (recording_id, worker, recording_time)
+                    SELECT id, 'delta-test', time FROM recordings WHERE id = :id
+                """),
+                {"id": second},
+            )
+
+            await worker.execute(text("SET LOCAL lock_timeout = '2s'"))
+            claim = await claim_recordings(worker, "delta-test", limit=10, lease_s=300)
+            await worker.commit()
+            assert [r.id for r in claim.recordings] == [first]
+
+            await indexer.commit()
+
+        async with session_factory() as session:
+            await compact_backlog(session)
+            await session.commit()
+            assert (await read_backlog(session))["delta-test"] == (1, 1)
+            rows = await session.execute(
+                text("SELECT count(*) FROM analysis_backlog WHERE worker = 'delta-test'")
+            )
+            assert rows.scalar_one() == 1
+
+        await engine.dispose()
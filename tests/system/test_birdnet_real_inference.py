@@ -6,6 +6,7 @@ from pathlib import Path
 from unittest.mock import patch
 
 import pytest
+from silvasonic.birdnet.labels import LabelTable
 from silvasonic.birdnet.service import BirdNETService
 
 # Default image name as built by podman-compose / just build
@@ -112,8 +113,7 @@ async def test_native_tflite_inference(
     meta_model_path = model_dir / "BirdNET_GLOBAL_6K_V2.4_MData_Model_V2_FP16.tflite"
     labels_file = model_dir / "BirdNET_GLOBAL_6K_V2.4_Labels.txt"
 
-    with open(labels_file) as f:
-        labels = [line.strip() for line in f.readlines()]
+    labels = LabelTable.from_file(labels_file)
 
     # We must explicitly import Interpreter here to test it natively
     from ai_edge_litert.interpreter import Interpreter  # type: ignore